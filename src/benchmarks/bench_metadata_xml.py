@@ -0,0 +1,115 @@
+"""Render time of a custom object per field: the old template read/replace passes vs the XML writer,
+with and without precompiled constant fragments.
+
+Run from src/:
+
+    python -m benchmarks.bench_metadata_xml [field counts...]
+"""
+import sys
+import timeit
+import xml.etree.ElementTree as ET
+
+import salesforcemcp.metadata_xml as mdxml
+
+# The field and object templates the package builders used to fill with str.replace
+FIELD_TEMPLATE = """<fields>
+    <fullName>##api_name##</fullName>
+    <externalId>false</externalId>
+    <label>##name##</label>
+    <required>false</required>
+    <trackTrending>false</trackTrending>
+    ##type##
+    <unique>false</unique>
+</fields>
+"""
+
+OBJECT_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<CustomObject xmlns="http://soap.sforce.com/2006/04/metadata">
+    <description>##description##</description>
+    <allowInChatterGroups>false</allowInChatterGroups>
+    <compactLayoutAssignment>SYSTEM</compactLayoutAssignment>
+    <deploymentStatus>Deployed</deploymentStatus>
+    <enableActivities>true</enableActivities>
+    <enableBulkApi>true</enableBulkApi>
+    <enableFeeds>false</enableFeeds>
+    <enableHistory>true</enableHistory>
+    <enableLicensing>false</enableLicensing>
+    <enableReports>true</enableReports>
+    <enableSearch>true</enableSearch>
+    <enableSharing>true</enableSharing>
+    <enableStreamingApi>true</enableStreamingApi>
+    <externalSharingModel>Private</externalSharingModel>
+    <label>##name##</label>
+    <nameField>
+        <displayFormat>##name##-{000000}</displayFormat>
+        <label>##name## Name</label>
+        <trackHistory>false</trackHistory>
+        <type>AutoNumber</type>
+    </nameField>
+    <pluralLabel>##plural_name##</pluralLabel>
+    <searchLayouts/>
+    <sharingModel>ReadWrite</sharingModel>
+    <visibility>Public</visibility>
+    ##fields##
+</CustomObject>
+"""
+
+NUMBER_TYPE = {"precision": 18, "scale": 0, "type": "Number"}
+NUMBER_TYPE_XML = """<precision>18</precision>
+                    <scale>0</scale>
+                    <type>Number</type>"""
+
+def field_names(field_count: int) -> list[tuple[str, str]]:
+    return [(f"Field_{i}__c", f"Field {i}") for i in range(field_count)]
+
+def render_with_replace(fields: list[tuple[str, str]]) -> str:
+    """One str.replace pass per placeholder, per field and for the object."""
+    fields_str = ""
+    for api_name, label in fields:
+        new_field = FIELD_TEMPLATE.replace("##api_name##", api_name)
+        new_field = new_field.replace("##name##", label)
+        new_field = new_field.replace("##type##", NUMBER_TYPE_XML)
+        fields_str = fields_str + new_field
+    obj = OBJECT_TEMPLATE.replace("##description##", "Benchmark object")
+    obj = obj.replace("##name##", "Benchmark")
+    obj = obj.replace("##plural_name##", "Benchmarks")
+    return obj.replace("##fields##", fields_str)
+
+def render_with_writer(fields: list[tuple[str, str]]) -> str:
+    """The structured writer with the field type as a plain dict (escaped, one pass)."""
+    return mdxml.custom_object(
+        "Benchmark", "Benchmarks", "Benchmark object",
+        [mdxml.custom_field(api_name, label, NUMBER_TYPE) for api_name, label in fields],
+    )
+
+def render_with_fragments(fields: list[tuple[str, str]]) -> str:
+    """The writer as the package builders use it: constant parts precompiled once per process."""
+    return mdxml.custom_object(
+        "Benchmark", "Benchmarks", "Benchmark object",
+        [mdxml.custom_field(api_name, label, mdxml.NUMBER_FIELD) for api_name, label in fields],
+    )
+
+APPROACHES = {
+    "replace": render_with_replace,
+    "writer": render_with_writer,
+    "precompiled": render_with_fragments,
+}
+
+def _per_field_us(func, field_count: int, repeat: int = 5) -> float:
+    fields = field_names(field_count)
+    number = max(1, 2000 // field_count)
+    best = min(timeit.repeat(lambda: func(fields), number=number, repeat=repeat))
+    return best / number / field_count * 1e6
+
+def main(field_counts: list[int]):
+    for name, func in APPROACHES.items():
+        root = ET.fromstring(func(field_names(3)))
+        assert len(root.findall(f"{{{mdxml.MD_NS}}}fields")) == 3, f"{name} must render 3 fields"
+    print(f"{'fields':>8}" + "".join(f"{name + ' (us/field)':>26}" for name in APPROACHES))
+    for field_count in field_counts:
+        print(f"{field_count:>8}" + "".join(
+            f"{_per_field_us(func, field_count):>26.2f}" for func in APPROACHES.values()
+        ))
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10, 100, 300, 1000])
@@ -0,0 +1,150 @@
+"""Throughput and latency of tool calls through the MCP dispatch layer, against a local mock org.
+
+Each scenario calls one tool through an in-memory MCP client session, so the timings
+include JSON-RPC dispatch, the tool executor, the implementation and real HTTP round
+trips to benchmarks.mock_salesforce. No org or network access is needed.
+
+Run from src/:
+
+    python -m benchmarks.bench_tools [--iterations N] [--concurrency C] [scenario ...]
+
+Scenarios: soql (result sizes), describe (object widths, cold and cached),
+deploy (package sizes, through sfdc_client.deploy()) and create_record.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from typing import Any, Callable
+
+from benchmarks.mock_salesforce import INSTANCE, SESSION_ID, MockSalesforce
+
+# The server reads its settings at import time: no on-disk caches, no deploy dedup
+os.environ.pop("SFMCP_CACHE_DIR", None)
+os.environ["SFMCP_DEPLOY_DEDUP_WINDOW"] = "0"
+os.environ.setdefault("SFMCP_MAX_WORKERS", "8")
+
+import server  # noqa: E402
+from mcp.shared.memory import create_connected_server_and_client_session  # noqa: E402
+from salesforcemcp.metrics import METRICS  # noqa: E402
+
+SOQL_ROWS = (10, 200, 2000, 10000)
+DESCRIBE_WIDTHS = (10, 100, 500)
+DEPLOY_FIELDS = (10, 100, 500)
+
+# (label, tool, arguments(iteration), before(iteration) or None)
+Case = tuple[str, str, Callable[[int], dict[str, Any]], Any]
+
+def soql_cases() -> list[Case]:
+    return [(
+        f"soql {rows} rows", "run_soql_query",
+        lambda i, rows=rows: {"query": f"SELECT Id, Name, Amount__c FROM Bench__c LIMIT {rows}",
+                              "max_rows": rows, "max_bytes": 1 << 30, "use_bulk": "never"},
+        None,
+    ) for rows in SOQL_ROWS]
+
+def describe_cases() -> list[Case]:
+    cases = []
+    for width in DESCRIBE_WIDTHS:
+        object_name = f"Wide{width}__c"
+        arguments = lambda i, object_name=object_name: {"object_name": object_name}
+        cases.append((f"describe {width} fields (cold)", "describe_object", arguments,
+                      lambda i, object_name=object_name: server.sf_client.invalidate_describe(object_name)))
+        cases.append((f"describe {width} fields (cached)", "describe_object", arguments, None))
+    return cases
+
+def deploy_cases() -> list[Case]:
+    return [(
+        f"deploy object with {count} fields", "create_object_with_fields",
+        lambda i, count=count: {
+            "name": f"Bench {count} {i}", "plural_name": f"Bench {count} {i}s", "api_name": f"Bench_{count}_{i}__c",
+            "description": "Benchmark object",
+            "fields": [{"label": f"Field {f}", "api_name": f"Field_{f}__c", "type": "Number"} for f in range(count)],
+        },
+        None,
+    ) for count in DEPLOY_FIELDS]
+
+def create_record_cases() -> list[Case]:
+    return [("create_record", "create_record",
+             lambda i: {"object_name": "Bench__c", "data": {"Name": f"Record {i}", "Amount__c": i}}, None)]
+
+SCENARIOS = {
+    "soql": soql_cases,
+    "describe": describe_cases,
+    "deploy": deploy_cases,
+    "create_record": create_record_cases,
+}
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+def _tool_totals(tool: str) -> tuple[int, int]:
+    entry = METRICS.summary()["tools"].get(tool, {})
+    transfer = entry.get("bytes", {})
+    return entry.get("salesforceRequests", 0), transfer.get("salesforceSent", 0) + transfer.get("salesforceReceived", 0)
+
+async def run_case(client, case: Case, iterations: int, concurrency: int) -> dict[str, Any]:
+    label, tool, arguments, before = case
+    # One untimed call warms up the connection pool and, for cached scenarios, the cache
+    await client.call_tool(tool, arguments(-1))
+    requests_before, bytes_before = _tool_totals(tool)
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(i: int):
+        async with semaphore:
+            if before:
+                before(i)
+            start = time.perf_counter()
+            result = await client.call_tool(tool, arguments(i))
+            latencies.append(time.perf_counter() - start)
+            if result.isError or "Error" in result.content[0].text[:40]:
+                raise RuntimeError(f"{label}: {result.content[0].text[:300]}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(call(i) for i in range(iterations)))
+    elapsed = time.perf_counter() - start
+    requests_after, bytes_after = _tool_totals(tool)
+    return {
+        "label": label,
+        "calls_per_second": iterations / elapsed,
+        "p50": _percentile(latencies, 0.5),
+        "p95": _percentile(latencies, 0.95),
+        "p99": _percentile(latencies, 0.99),
+        "mean": statistics.fmean(latencies),
+        "round_trips": (requests_after - requests_before) / iterations,
+        "kib": (bytes_after - bytes_before) / iterations / 1024,
+    }
+
+def print_row(row: dict[str, Any]):
+    print(f"{row['label']:<34}{row['calls_per_second']:>10.1f}{row['p50'] * 1e3:>10.2f}{row['p95'] * 1e3:>10.2f}"
+          f"{row['p99'] * 1e3:>10.2f}{row['round_trips']:>10.1f}{row['kib']:>12.1f}")
+
+async def main(scenarios: list[str], iterations: int, concurrency: int):
+    mock = MockSalesforce().start()
+    try:
+        sf_client = server.sf_client
+        mock.attach(sf_client.http_session, pool_size=max(concurrency, 1))
+        sf_client._connect(SESSION_ID, INSTANCE)
+        print(f"{iterations} calls per case, {concurrency} concurrent; latencies in ms, per-call Salesforce round trips and KiB")
+        print(f"{'case':<34}{'calls/s':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'trips':>10}{'KiB':>12}")
+        async with create_connected_server_and_client_session(server.server) as client:
+            for scenario in scenarios:
+                for case in SCENARIOS[scenario]():
+                    print_row(await run_case(client, case, iterations, concurrency))
+    finally:
+        mock.close()
+        server.tool_executor.shutdown()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenarios", nargs="*", help=f"scenarios to run: {', '.join(SCENARIOS)} (default: all)")
+    parser.add_argument("--iterations", type=int, default=50, help="timed calls per case")
+    parser.add_argument("--concurrency", type=int, default=1, help="calls in flight at once")
+    args = parser.parse_args()
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    asyncio.run(main(args.scenarios or list(SCENARIOS), args.iterations, args.concurrency))
@@ -0,0 +1,276 @@
+"""A local stand-in for the Salesforce endpoints the tools call, for offline benchmarks.
+
+Serves, over plain HTTP on 127.0.0.1:
+- REST query/queryMore: `SELECT ... FROM X LIMIT n` returns n generated rows, paged by
+  the Sforce-Query-Options batch size (2000 by default)
+- REST describeGlobal: the objects in GLOBAL_OBJECTS
+- REST sObject describe: `Wide<n>__c` has n fields (other objects have DEFAULT_WIDTH)
+- REST sObject create and sObject Collections create/update/delete
+- Metadata SOAP deploy() and checkDeployStatus() (every deploy succeeds at once)
+
+The server code builds https:// URLs from the instance name, so attach() mounts an
+adapter on the client session that sends https://<INSTANCE> requests to the local server.
+"""
+import functools
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+INSTANCE = "mock.my.salesforce.com"
+SESSION_ID = "00DMOCK000000000001!benchmark"
+
+DEFAULT_WIDTH = 50
+DEFAULT_BATCH_SIZE = 2000
+API_MAX = 1_000_000
+
+# Objects listed by describeGlobal (any object name can still be described or queried)
+GLOBAL_OBJECTS = ("Account", "Contact", "Opportunity", "Bench__c",
+                  "Wide10__c", "Wide50__c", "Wide100__c", "Wide500__c", "Wide1000__c")
+STANDARD_KEY_PREFIXES = {"Account": "001", "Contact": "003", "Opportunity": "006"}
+
+QUERY_FROM = re.compile(r"\bFROM\s+(\w+)", re.IGNORECASE)
+QUERY_LIMIT = re.compile(r"\bLIMIT\s+(\d+)", re.IGNORECASE)
+WIDE_OBJECT = re.compile(r"Wide(\d+)__c$")
+ASYNC_PROCESS_ID = re.compile(rb"asyncProcessId>(\w+)<")
+
+SOAP_ENVELOPE = ('<?xml version="1.0" encoding="UTF-8"?><soapenv:Envelope '
+                 'xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/"><soapenv:Body>{}</soapenv:Body></soapenv:Envelope>')
+MD_NS = 'xmlns="http://soap.sforce.com/2006/04/metadata"'
+
+@functools.lru_cache(maxsize=256)
+def query_page(object_name: str, total: int, offset: int, batch_size: int, api_version: str) -> bytes:
+    """One page of a generated query result; pages are cached so serving them costs little."""
+    end = min(total, offset + batch_size)
+    records = [{
+        "attributes": {"type": object_name, "url": f"/services/data/v{api_version}/sobjects/{object_name}/a00{i:012d}"},
+        "Id": f"a00{i:012d}AAA",
+        "Name": f"Record {i}",
+        "Amount__c": i * 1.5,
+        "Status__c": "Open" if i % 2 else "Closed",
+        "Description__c": f"Generated row {i} for the offline benchmark",
+    } for i in range(offset, end)]
+    page: dict[str, Any] = {"totalSize": total, "done": end >= total, "records": records}
+    if end < total:
+        page["nextRecordsUrl"] = f"/services/data/v{api_version}/query/01gMOCK-{total}-{end}-{batch_size}-{object_name}"
+    return json.dumps(page).encode("utf-8")
+
+def _field(index: int) -> dict[str, Any]:
+    kind = ("string", "double", "picklist", "reference", "boolean")[index % 5]
+    return {
+        "name": f"Field_{index}__c",
+        "label": f"Field {index}",
+        "type": kind,
+        "length": 255 if kind == "string" else 0,
+        "nillable": index % 7 != 0,
+        "unique": False,
+        "externalId": index % 11 == 0,
+        "custom": True,
+        "createable": True,
+        "updateable": True,
+        "referenceTo": ["Account"] if kind == "reference" else [],
+        "relationshipName": f"Field_{index}__r" if kind == "reference" else None,
+        "picklistValues": [
+            {"value": f"Value {v}", "label": f"Value {v}", "active": True, "defaultValue": v == 0}
+            for v in range(10)
+        ] if kind == "picklist" else [],
+    }
+
+@functools.lru_cache(maxsize=64)
+def describe(object_name: str) -> bytes:
+    match = WIDE_OBJECT.search(object_name)
+    width = int(match.group(1)) if match else DEFAULT_WIDTH
+    payload = {
+        "name": object_name,
+        "label": object_name.replace("__c", "").replace("_", " "),
+        "labelPlural": object_name.replace("__c", "") + "s",
+        "keyPrefix": "a00",
+        "custom": object_name.endswith("__c"),
+        "createable": True,
+        "updateable": True,
+        "deletable": True,
+        "fields": [_field(i) for i in range(width)],
+    }
+    return json.dumps(payload).encode("utf-8")
+
+@functools.lru_cache(maxsize=1)
+def describe_global() -> bytes:
+    sobjects = []
+    for index, name in enumerate(GLOBAL_OBJECTS):
+        label = name.replace("__c", "").replace("_", " ")
+        sobjects.append({
+            "name": name,
+            "label": label,
+            "labelPlural": f"{label}s",
+            "keyPrefix": STANDARD_KEY_PREFIXES.get(name, f"a{index:02d}"),
+            "custom": name.endswith("__c"),
+            "queryable": True,
+            "createable": True,
+        })
+    return json.dumps({"encoding": "UTF-8", "maxBatchSize": 200, "sobjects": sobjects}).encode("utf-8")
+
+class MockState:
+    """Counters shared by the request handlers."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.deploys = 0
+        self.records = 0
+
+    def next(self, counter: str, count: int = 1) -> int:
+        with self.lock:
+            value = getattr(self, counter) + count
+            setattr(self, counter, value)
+            return value
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real instance
+    # Headers and body are separate writes; without this, delayed ACKs add ~40 ms per response
+    disable_nagle_algorithm = True
+    state: MockState
+
+    def log_message(self, format: str, *args: Any):
+        pass
+
+    def _body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json"):
+        used = self.state.next("requests")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Sforce-Limit-Info", f"api-usage={used}/{API_MAX}")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _not_found(self):
+        self._send(404, json.dumps([{"errorCode": "NOT_FOUND", "message": f"No mock for {self.path}"}]).encode())
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        parts = url.path.strip("/").split("/")
+        # services/data/vXX.X/<resource>...
+        if len(parts) < 4 or parts[:2] != ["services", "data"]:
+            return self._not_found()
+        api_version = parts[2].lstrip("v")
+        if parts[3] == "query" and len(parts) == 4:
+            query = parse_qs(url.query).get("q", [""])[0]
+            object_match = QUERY_FROM.search(query)
+            limit_match = QUERY_LIMIT.search(query)
+            options = self.headers.get("Sforce-Query-Options", "")
+            batch_size = int(options.split("=", 1)[1]) if "batchSize=" in options else DEFAULT_BATCH_SIZE
+            total = int(limit_match.group(1)) if limit_match else 0
+            object_name = object_match.group(1) if object_match else "Account"
+            return self._send(200, query_page(object_name, total, 0, batch_size, api_version))
+        if parts[3] == "query" and len(parts) == 5:
+            _, total, offset, batch_size, object_name = parts[4].split("-", 4)
+            return self._send(200, query_page(object_name, int(total), int(offset), int(batch_size), api_version))
+        if parts[3] == "sobjects" and len(parts) == 4:
+            return self._send(200, describe_global())
+        if parts[3] == "sobjects" and len(parts) == 6 and parts[5] == "describe":
+            return self._send(200, describe(parts[4]))
+        if parts[3] == "limits":
+            with self.state.lock:
+                used = self.state.requests
+            return self._send(200, json.dumps({"DailyApiRequests": {"Max": API_MAX, "Remaining": API_MAX - used}}).encode())
+        return self._not_found()
+
+    def do_POST(self):
+        body = self._body()
+        parts = urlsplit(self.path).path.strip("/").split("/")
+        if parts[:3] == ["services", "Soap", "m"]:
+            return self._soap(body)
+        if parts[:2] != ["services", "data"] or len(parts) < 5:
+            return self._not_found()
+        if parts[3:5] == ["composite", "sobjects"]:
+            records = json.loads(body).get("records", [])
+            start = self.state.next("records", len(records)) - len(records)
+            results = [{"id": f"a00{start + i:012d}AAA", "success": True, "errors": []} for i in range(len(records))]
+            return self._send(200, json.dumps(results).encode())
+        if parts[3] == "sobjects" and len(parts) == 5:
+            record = self.state.next("records")
+            return self._send(201, json.dumps({"id": f"a00{record:012d}AAA", "success": True, "errors": []}).encode())
+        return self._not_found()
+
+    def do_PATCH(self):
+        body = self._body()
+        parts = urlsplit(self.path).path.strip("/").split("/")
+        if parts[3:5] == ["composite", "sobjects"]:
+            records = json.loads(body).get("records", [])
+            results = [{"id": record.get("Id"), "success": True, "errors": []} for record in records]
+            return self._send(200, json.dumps(results).encode())
+        if parts[3] == "sobjects" and len(parts) == 6:
+            return self._send(204, b"")
+        return self._not_found()
+
+    def do_DELETE(self):
+        url = urlsplit(self.path)
+        parts = url.path.strip("/").split("/")
+        if parts[3:5] == ["composite", "sobjects"]:
+            ids = parse_qs(url.query).get("ids", [""])[0].split(",")
+            return self._send(200, json.dumps([{"id": i, "success": True, "errors": []} for i in ids]).encode())
+        if parts[3] == "sobjects" and len(parts) == 6:
+            return self._send(204, b"")
+        return self._not_found()
+
+    def _soap(self, body: bytes):
+        if b"checkDeployStatus>" in body:
+            match = ASYNC_PROCESS_ID.search(body)
+            deploy_id = match.group(1).decode() if match else "0AfMOCK"
+            result = (f"<checkDeployStatusResponse {MD_NS}><result><done>true</done><id>{deploy_id}</id>"
+                      "<status>Succeeded</status><success>true</success><numberComponentsTotal>1</numberComponentsTotal>"
+                      "<numberComponentsDeployed>1</numberComponentsDeployed><numberComponentErrors>0</numberComponentErrors>"
+                      "<numberTestsTotal>0</numberTestsTotal><numberTestsCompleted>0</numberTestsCompleted>"
+                      "<numberTestErrors>0</numberTestErrors></result></checkDeployStatusResponse>")
+        elif b"deploy>" in body:
+            deploy = self.state.next("deploys")
+            result = (f"<deployResponse {MD_NS}><result><done>false</done><id>0AfMOCK{deploy:011d}</id>"
+                      "<state>Queued</state></result></deployResponse>")
+        else:
+            return self._send(500, SOAP_ENVELOPE.format(
+                "<soapenv:Fault><faultcode>sf:INVALID_OPERATION</faultcode>"
+                "<faultstring>Not mocked</faultstring></soapenv:Fault>").encode(), "text/xml")
+        self._send(200, SOAP_ENVELOPE.format(result).encode(), "text/xml")
+
+class LocalAdapter(HTTPAdapter):
+    """Sends https://<INSTANCE> requests to the local mock over plain HTTP."""
+
+    def __init__(self, base_url: str, pool_size: int):
+        super().__init__(pool_connections=1, pool_maxsize=pool_size)
+        self.base_url = base_url
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        request.url = self.base_url + request.url[len(f"https://{INSTANCE}"):]
+        return super().send(request, **kwargs)
+
+class MockSalesforce:
+    """The mock server, running on a daemon thread until close()."""
+
+    def __init__(self, port: int = 0):
+        self.state = MockState()
+        handler = type("BoundMockHandler", (MockHandler,), {"state": self.state})
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.httpd.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_port}"
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "MockSalesforce":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="mock-salesforce", daemon=True)
+        self._thread.start()
+        return self
+
+    def attach(self, session: requests.Session, pool_size: int = 16):
+        """Routes the session's requests for the mock instance to this server."""
+        session.mount(f"https://{INSTANCE}", LocalAdapter(self.base_url, pool_size))
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,212 @@
+import contextvars
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Optional
+
+import requests
+
+from salesforcemcp.env import env_float, env_int
+
+# Header Salesforce adds to REST/SOAP/Bulk responses, e.g. "api-usage=25/15000"
+LIMIT_INFO_HEADER = "Sforce-Limit-Info"
+API_USAGE = re.compile(r"api-usage=(\d+)/(\d+)")
+
+# Daily API allocations are a rolling 24-hour window; tool budgets use the same window
+BUDGET_WINDOW = 24 * 3600.0
+
+DEFAULT_BURST = 10
+
+# Always admitted, so the usage can be read even once a budget or the reserve is reached
+EXEMPT_TOOLS = {"get_api_usage"}
+
+# Requests sent outside a tool call (the login at startup) are counted under this name
+NO_TOOL = "(server)"
+
+# Set by the server for the duration of a tool call, like the progress reporter
+_current_tool: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("sfmcp_current_tool", default=None)
+
+def set_current_tool(name: Optional[str]) -> contextvars.Token:
+    return _current_tool.set(name)
+
+def reset_current_tool(token: contextvars.Token):
+    _current_tool.reset(token)
+
+def parse_numbers(spec: Optional[str], what: str) -> dict[str, float]:
+    """Parses a per-tool spec such as "run_soql_query=2,bulk_ingest_file=0.5". Invalid entries are ignored."""
+    values = {}
+    if not spec:
+        return values
+    for entry in spec.split(","):
+        key, sep, value = entry.partition("=")
+        if not sep:
+            continue
+        try:
+            number = float(value)
+        except ValueError:
+            print(f"Ignoring invalid {what} '{entry}'", file=sys.stderr)
+            continue
+        if number > 0:
+            values[key.strip()] = number
+    return values
+
+class TokenBucket:
+    """Allows rate requests per second on average, with bursts of up to burst requests."""
+
+    def __init__(self, rate: float, burst: float = DEFAULT_BURST):
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Takes one token, sleeping until it is available; returns the seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # The token is taken right away (the balance may go negative), so concurrent
+            # callers queue up behind each other instead of all waking at once
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+class ApiScheduler:
+    """Tracks and paces the API requests the server sends to the org.
+
+    Every request goes through the shared PooledSession, which calls before_request()
+    and after_response() around it. Requests are throttled with token buckets (one for
+    the whole server and optionally one per tool), counted against the tool that sent
+    them, and the org-wide consumption is read from the Sforce-Limit-Info header of
+    each response. Tool calls are refused before they start (admit()) once their tool
+    is over its daily budget or the org is down to its reserve of API calls.
+    """
+
+    def __init__(self, rate: float = 0.0, burst: float = DEFAULT_BURST,
+                 tool_rates: Optional[dict[str, float]] = None,
+                 budgets: Optional[dict[str, float]] = None, reserve: int = 0):
+        self.rate = rate
+        self.burst = burst
+        self.tool_rates = dict(tool_rates or {})
+        self.budgets = dict(budgets or {})
+        self.reserve = reserve
+        self._bucket = TokenBucket(rate, burst) if rate > 0 else None
+        self._tool_buckets = {name: TokenBucket(tool_rate, burst) for name, tool_rate in self.tool_rates.items()}
+        self._lock = threading.Lock()
+        self._started = time.time()
+        self._requests: dict[str, int] = {}
+        self._throttled: dict[str, float] = {}
+        self._refused: dict[str, int] = {}
+        # Request timestamps of the tools that have a budget, within BUDGET_WINDOW
+        self._recent: dict[str, deque] = {name: deque() for name in self.budgets}
+        self.org_used: Optional[int] = None
+        self.org_max: Optional[int] = None
+        self.org_updated: Optional[float] = None
+
+    @classmethod
+    def from_env(cls) -> "ApiScheduler":
+        """Builds a scheduler from SFMCP_API_RATE, SFMCP_API_BURST, SFMCP_API_TOOL_RATES,
+        SFMCP_API_BUDGETS and SFMCP_API_RESERVE."""
+        return cls(
+            rate=env_float("SFMCP_API_RATE", 0.0),
+            burst=env_float("SFMCP_API_BURST", DEFAULT_BURST, minimum=1),
+            tool_rates=parse_numbers(os.getenv("SFMCP_API_TOOL_RATES"), "API rate"),
+            budgets=parse_numbers(os.getenv("SFMCP_API_BUDGETS"), "API budget"),
+            reserve=env_int("SFMCP_API_RESERVE", 0),
+        )
+
+    @property
+    def org_remaining(self) -> Optional[int]:
+        if self.org_used is None or self.org_max is None:
+            return None
+        return max(self.org_max - self.org_used, 0)
+
+    def _recent_count(self, tool: str, now: float) -> int:
+        recent = self._recent[tool]
+        while recent and recent[0] < now - BUDGET_WINDOW:
+            recent.popleft()
+        return len(recent)
+
+    def admit(self, tool: str):
+        """Raises ValueError if a call of tool must not start; calls already running are not affected."""
+        if tool in EXEMPT_TOOLS:
+            return
+        with self._lock:
+            remaining = self.org_remaining
+            if self.reserve and remaining is not None and remaining <= self.reserve:
+                self._refused[tool] = self._refused.get(tool, 0) + 1
+                raise ValueError(
+                    f"The org has {remaining} API calls left today, at or below the reserve of {self.reserve} "
+                    "kept for other integrations (SFMCP_API_RESERVE). Try again later."
+                )
+            budget = self.budgets.get(tool)
+            if budget is not None and self._recent_count(tool, time.time()) >= budget:
+                self._refused[tool] = self._refused.get(tool, 0) + 1
+                raise ValueError(
+                    f"{tool} has used its budget of {budget:g} API calls in the last 24 hours "
+                    "(SFMCP_API_BUDGETS). Try again later."
+                )
+
+    def before_request(self):
+        """Waits until the request may be sent under the global and per-tool rates."""
+        tool = _current_tool.get() or NO_TOOL
+        waited = self._bucket.acquire() if self._bucket else 0.0
+        tool_bucket = self._tool_buckets.get(tool)
+        if tool_bucket:
+            waited += tool_bucket.acquire()
+        if waited:
+            with self._lock:
+                self._throttled[tool] = self._throttled.get(tool, 0.0) + waited
+
+    def after_response(self, response: requests.Response):
+        """Counts the request against the current tool and records the org's API usage."""
+        tool = _current_tool.get() or NO_TOOL
+        now = time.time()
+        match = API_USAGE.search(response.headers.get(LIMIT_INFO_HEADER, ""))
+        with self._lock:
+            self._requests[tool] = self._requests.get(tool, 0) + 1
+            if tool in self._recent:
+                self._recent[tool].append(now)
+            if match:
+                self.org_used, self.org_max, self.org_updated = int(match.group(1)), int(match.group(2)), now
+
+    def update_org_limits(self, used: int, maximum: int):
+        """Records the org's usage read from the /limits resource (DailyApiRequests)."""
+        with self._lock:
+            self.org_used, self.org_max, self.org_updated = used, maximum, time.time()
+
+    def usage(self) -> dict[str, Any]:
+        """Returns the org-wide usage, the per-tool counts and the configured limits."""
+        now = time.time()
+        with self._lock:
+            tools = {}
+            for tool in sorted(set(self._requests) | set(self._refused) | set(self.budgets)):
+                entry: dict[str, Any] = {"requests": self._requests.get(tool, 0)}
+                if tool in self.budgets:
+                    entry["last24h"] = self._recent_count(tool, now)
+                    entry["budget"] = self.budgets[tool]
+                if tool in self.tool_rates:
+                    entry["ratePerSecond"] = self.tool_rates[tool]
+                if self._throttled.get(tool):
+                    entry["throttledSeconds"] = round(self._throttled[tool], 3)
+                if self._refused.get(tool):
+                    entry["refusedCalls"] = self._refused[tool]
+                tools[tool] = entry
+            return {
+                "org": {
+                    "used": self.org_used,
+                    "max": self.org_max,
+                    "remaining": self.org_remaining,
+                    "reserve": self.reserve,
+                    "updatedSecondsAgo": round(now - self.org_updated) if self.org_updated else None,
+                },
+                "ratePerSecond": self.rate or None,
+                "sinceSecondsAgo": round(now - self._started),
+                "tools": tools,
+            }
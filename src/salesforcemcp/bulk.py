@@ -0,0 +1,309 @@
+import csv
+import contextvars
+import io
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, Optional
+
+from simple_salesforce import Salesforce
+from simple_salesforce.util import exception_handler
+
+from salesforcemcp.env import env_int
+from salesforcemcp.formatting import flatten_record
+
+JOB_DONE_STATES = ("JobComplete", "Failed", "Aborted")
+
+# Largest page Bulk API 2.0 lets us ask for with maxRecords
+MAX_RESULT_PAGE = 100000
+
+INGEST_OPERATIONS = ("insert", "update", "upsert", "delete")
+
+# One ingest job accepts up to 150 MB of data; larger files are split over several jobs
+INGEST_JOB_BYTES = env_int("SFMCP_BULK_INGEST_JOB_BYTES", 100 * 1024 * 1024, minimum=1)
+
+# Job data up to this size is spooled in memory, larger uploads go through a temp file
+SPOOL_MEMORY_BYTES = 8 * 1024 * 1024
+
+# Bulk API 2.0 CSV value that sets a field to null ("" leaves it unchanged)
+CSV_NULL = "#N/A"
+
+class Bulk2Client:
+    """Minimal Bulk API 2.0 client on top of a simple-salesforce connection.
+
+    It reuses the connection's requests session and session id, and raises the same
+    SalesforceError subclasses as simple-salesforce when a call fails.
+    """
+
+    def __init__(self, connection: Salesforce):
+        self.connection = connection
+        self.base_url = connection.bulk2_url
+
+    def _headers(self, content_type: str = "application/json", accept: str = "application/json") -> dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.connection.session_id}",
+            "Content-Type": content_type,
+            "Accept": accept,
+        }
+
+    def _request(self, method: str, path: str, name: str, **kwargs: Any):
+        headers = kwargs.pop("headers", None) or self._headers()
+        response = self.connection.session.request(method, self.base_url + path, headers=headers, **kwargs)
+        if response.status_code >= 300:
+            exception_handler(response, name)
+        return response
+
+    # --- Jobs ---
+
+    def get_job(self, kind: str, job_id: str) -> dict[str, Any]:
+        """Returns the job info of a "query" or "ingest" job."""
+        return self._request("GET", f"{kind}/{job_id}", f"{kind} job").json()
+
+    def wait_for_job(self, kind: str, job_id: str, timeout: float = 600.0,
+                     poll_interval: float = 1.0, max_interval: float = 15.0) -> dict[str, Any]:
+        """Polls a job with exponential backoff until it completes, fails or times out.
+
+        Raises:
+            TimeoutError: If the job is still running after timeout seconds.
+        """
+        deadline = time.monotonic() + timeout
+        interval = poll_interval
+        while True:
+            job = self.get_job(kind, job_id)
+            if job.get("state") in JOB_DONE_STATES:
+                return job
+            if time.monotonic() + interval > deadline:
+                raise TimeoutError(f"Bulk {kind} job {job_id} still {job.get('state')} after {timeout:.0f}s")
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval)
+
+    def abort_job(self, kind: str, job_id: str):
+        self._request("PATCH", f"{kind}/{job_id}", f"{kind} job", json={"state": "Aborted"})
+
+    # --- Query jobs ---
+
+    def create_query_job(self, query: str) -> str:
+        job = self._request("POST", "query", "query job", json={
+            "operation": "query",
+            "query": query,
+            "contentType": "CSV",
+            "columnDelimiter": "COMMA",
+            "lineEnding": "LF",
+        }).json()
+        return job["id"]
+
+    def query_results_page(self, job_id: str, locator: Optional[str], max_records: int) -> tuple[str, Optional[str], int]:
+        """Downloads one CSV page of a query job's results, from the start or from a locator.
+
+        Returns:
+            tuple: (CSV text, locator of the next page or None, number of records in the page).
+        """
+        params = {"maxRecords": max_records}
+        if locator:
+            params["locator"] = locator
+        response = self._request("GET", f"query/{job_id}/results", "query results",
+                                 headers=self._headers(accept="text/csv"), params=params)
+        next_locator = response.headers.get("Sforce-Locator")
+        if not next_locator or next_locator == "null":
+            next_locator = None
+        text = response.content.decode("utf-8")
+        count = response.headers.get("Sforce-NumberOfRecords")
+        return text, next_locator, int(count) if count and count.isdigit() else count_csv_records(text)
+
+    def iter_query_results(self, job_id: str, page_size: int = MAX_RESULT_PAGE) -> Iterator[tuple[str, int]]:
+        """Yields the CSV pages of a completed query job with their record counts.
+
+        Locators are only known once the previous page arrives, so pages cannot be
+        requested all at once; instead the next page is downloaded in the background
+        while the caller consumes the current one.
+        """
+        page_size = max(1, min(page_size, MAX_RESULT_PAGE))
+        # Downloads run in the caller's context, so they are counted against the calling tool
+        context = contextvars.copy_context()
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="sfmcp-bulk") as prefetch:
+            pending = prefetch.submit(context.run, self.query_results_page, job_id, None, page_size)
+            while pending is not None:
+                text, locator, count = pending.result()
+                pending = (prefetch.submit(context.run, self.query_results_page, job_id, locator, page_size)
+                           if locator else None)
+                yield text, count
+
+    # --- Ingest jobs ---
+
+    def create_ingest_job(self, object_name: str, operation: str, external_id_field: Optional[str] = None) -> str:
+        body = {
+            "object": object_name,
+            "operation": operation,
+            "contentType": "CSV",
+            "columnDelimiter": "COMMA",
+            "lineEnding": "LF",
+        }
+        if external_id_field:
+            body["externalIdFieldName"] = external_id_field
+        return self._request("POST", "ingest", "ingest job", json=body).json()["id"]
+
+    def upload_job_data(self, job_id: str, data: Any):
+        """PUTs the CSV data (bytes or a file object, streamed by requests) and closes the job."""
+        self._request("PUT", f"ingest/{job_id}/batches", "ingest upload",
+                      headers=self._headers(content_type="text/csv"), data=data)
+        self._request("PATCH", f"ingest/{job_id}", "ingest job", json={"state": "UploadComplete"})
+
+    def download_job_results(self, job_id: str, result_kind: str, path: str) -> str:
+        """Streams failedResults, unprocessedrecords or successfulResults of a job to a local file."""
+        response = self._request("GET", f"ingest/{job_id}/{result_kind}", "ingest results",
+                                 headers=self._headers(accept="text/csv"), stream=True)
+        with open(path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                f.write(chunk)
+        return path
+
+def _ndjson_columns(path: str) -> list[str]:
+    """First pass over an NDJSON file: the union of the (flattened) keys, in order of appearance."""
+    columns = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                for key in flatten_record(json.loads(line)):
+                    columns.setdefault(key, None)
+    return list(columns)
+
+def iter_file_rows(path: str, file_format: str) -> tuple[list[str], Iterator[list[str]]]:
+    """Returns the header and a lazy iterator over the rows of a local CSV or NDJSON file.
+
+    NDJSON objects are flattened like query results, so {"Account": {"Ext_Id__c": "A1"}}
+    becomes the Account.Ext_Id__c column that Bulk API uses for external id lookups.
+    A JSON null is sent as #N/A (set the field to null); a missing key leaves it unchanged.
+    """
+    if file_format == "csv":
+        f = open(path, "r", encoding="utf-8-sig", newline="")
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            f.close()
+            raise ValueError(f"CSV file {path} is empty.")
+
+        def rows():
+            with f:
+                yield from reader
+        return header, rows()
+
+    if file_format == "ndjson":
+        header = _ndjson_columns(path)
+
+        def rows():
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = flatten_record(json.loads(line))
+                    yield [CSV_NULL if record.get(column, "") is None else _csv_value(record.get(column, ""))
+                           for column in header]
+        return header, rows()
+
+    raise ValueError(f"Unsupported file format '{file_format}'. Use 'csv' or 'ndjson'.")
+
+def _csv_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
+def _spool_job_data(header: list[str], rows: Iterator[list[str]], max_bytes: int):
+    """Writes rows as LF-terminated CSV until max_bytes is reached.
+
+    Returns (spooled file or None when there are no rows left, number of rows written).
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES, mode="w+b")
+    text = io.TextIOWrapper(spool, encoding="utf-8", newline="")
+    writer = csv.writer(text, lineterminator="\n")
+    writer.writerow(header)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+        if count % 1000 == 0 and text.tell() >= max_bytes:
+            break
+    text.flush()
+    text.detach()
+    if count == 0:
+        spool.close()
+        return None, 0
+    spool.seek(0)
+    return spool, count
+
+def ingest_file(connection: Salesforce, object_name: str, operation: str, file_path: str,
+                file_format: Optional[str] = None, external_id_field: Optional[str] = None,
+                results_dir: Optional[str] = None, timeout: float = 600.0) -> list[dict[str, Any]]:
+    """Loads a local CSV/NDJSON file through one or more Bulk API 2.0 ingest jobs.
+
+    The file is read row by row and spooled into job-sized uploads, so it is never held
+    in memory as a whole. All jobs are uploaded first and then polled, letting Salesforce
+    process them in parallel. Failed and unprocessed rows are written next to the input
+    file (or to results_dir).
+
+    Returns:
+        list: One summary dict per job.
+    """
+    if operation not in INGEST_OPERATIONS:
+        raise ValueError(f"Invalid operation: '{operation}'. Must be one of {list(INGEST_OPERATIONS)}")
+    if operation == "upsert" and not external_id_field:
+        raise ValueError("'external_id_field' is required for upsert.")
+    if not os.path.isfile(file_path):
+        raise ValueError(f"File not found: {file_path}")
+    if not file_format:
+        file_format = "ndjson" if file_path.lower().endswith((".ndjson", ".jsonl")) else "csv"
+    results_dir = results_dir or os.path.dirname(os.path.abspath(file_path))
+    os.makedirs(results_dir, exist_ok=True)
+
+    bulk = Bulk2Client(connection)
+    header, rows = iter_file_rows(file_path, file_format)
+    jobs = []
+    while True:
+        data, count = _spool_job_data(header, rows, INGEST_JOB_BYTES)
+        if data is None:
+            break
+        with data:
+            job_id = bulk.create_ingest_job(object_name, operation, external_id_field)
+            try:
+                bulk.upload_job_data(job_id, data)
+            except Exception:
+                bulk.abort_job("ingest", job_id)
+                raise
+        jobs.append({"jobId": job_id, "recordsUploaded": count})
+
+    base_name = os.path.splitext(os.path.basename(file_path))[0]
+    for job in jobs:
+        job_id = job["jobId"]
+        try:
+            info = bulk.wait_for_job("ingest", job_id, timeout=timeout)
+        except TimeoutError:
+            info = bulk.get_job("ingest", job_id)
+        processed = info.get("numberRecordsProcessed", 0)
+        failed = info.get("numberRecordsFailed", 0)
+        job.update(state=info.get("state"), recordsProcessed=processed, recordsFailed=failed)
+        if info.get("errorMessage"):
+            job["errorMessage"] = info["errorMessage"]
+        if info.get("state") not in JOB_DONE_STATES:
+            continue
+        if failed:
+            job["failedResultsFile"] = bulk.download_job_results(
+                job_id, "failedResults", os.path.join(results_dir, f"{base_name}.{job_id}.failed.csv"))
+        if processed < job["recordsUploaded"]:
+            job["unprocessedRecordsFile"] = bulk.download_job_results(
+                job_id, "unprocessedrecords", os.path.join(results_dir, f"{base_name}.{job_id}.unprocessed.csv"))
+    return jobs
+
+def csv_page_records(text: str) -> list[dict[str, Any]]:
+    """Parses a Bulk API CSV page into records (empty cells become None)."""
+    reader = csv.DictReader(io.StringIO(text))
+    return [{key: (value if value != "" else None) for key, value in row.items()} for row in reader]
+
+def count_csv_records(text: str) -> int:
+    """Number of records in a CSV page with a header row (quoted values may span lines)."""
+    return max(sum(1 for _ in csv.reader(io.StringIO(text))) - 1, 0)
+
+def strip_csv_header(text: str) -> str:
+    """Every result page repeats the header row; keeps only the data rows."""
+    _, _, rows = text.partition("\n")
+    return rows
@@ -1,5 +1,13 @@
 import mcp.types as types
 
+deployWaitProperties = {
+    "wait_for_deploy": {
+        "type": "boolean",
+        "description": "If true, wait until the Metadata API deploy finishes and return its outcome, including component failures. If false (default), return the deploy id as soon as the deploy is queued; check it later with get_deploy_status.",
+        "default": False,
+    },
+}
+
 createObjectSchema ={
     "type": "object",
     "properties": {
@@ -45,8 +53,9 @@ createObjectSchema ={
             },
             "additionalProperties": True,
         },
+        **deployWaitProperties,
     },
-    "required": ["name" "plural_name", "api_name", "description", "fields"],
+    "required": ["name", "plural_name", "api_name", "description", "fields"],
 }
 
 createCustomMetadataSchema ={
@@ -68,7 +77,8 @@ createCustomMetadataSchema ={
                 },
                 "required": ["type", "label", "api_name"]
             }
-        }
+        },
+        **deployWaitProperties,
     },
     "required": ["api_name", "label", "plural_name", "fields"]
 }
@@ -77,6 +87,41 @@ createCustomMetadataFieldSchema = createCustomMetadataSchema
 
 createFieldSchema = createObjectSchema
 
+outputFormatProperty = {
+    "type": "string",
+    "description": "How records are returned: 'json' (full REST payload, default), 'columnar' (column names plus rows), 'csv' or 'ndjson'. The compact formats drop 'attributes' and flatten parent relationships into dotted columns (e.g. Owner.Name).",
+    "enum": ["json", "columnar", "csv", "ndjson"],
+    "default": "json",
+}
+
+collectionOptionsProperties = {
+    "all_or_none": {
+        "type": "boolean",
+        "description": "If true, a failure rolls back its whole chunk of 200 records and later chunks are not sent. If false (default), every record succeeds or fails on its own and chunks are sent in parallel.",
+        "default": False,
+    },
+}
+
+soqlBudgetProperties = {
+    "max_rows": {
+        "type": "integer",
+        "description": "Stop fetching pages once this many records have been read (default 2000). Remaining records are returned as a cursor.",
+        "minimum": 1,
+    },
+    "max_bytes": {
+        "type": "integer",
+        "description": "Stop fetching pages once the records reach roughly this many bytes of JSON (default 1000000).",
+        "minimum": 1,
+    },
+    "page_size": {
+        "type": "integer",
+        "description": "Records per page requested from Salesforce (200-2000).",
+        "minimum": 200,
+        "maximum": 2000,
+    },
+    "output_format": outputFormatProperty,
+}
+
 def get_tools():
     tools = [
         types.Tool(
@@ -102,7 +147,7 @@ def get_tools():
                         "description": "The api name of the object to be created finished with __c",
                     },
                 },
-                "required": ["name" "plural_name", "api_name"], 
+                "required": ["name", "plural_name", "api_name"], 
             },
         ),
         types.Tool(
@@ -135,6 +180,7 @@ def get_tools():
                              },
                         },
                     },
+                    **deployWaitProperties,
                 },
                 "required": ["api_name", "fields"],
             },
@@ -194,6 +240,7 @@ def get_tools():
                         "type": "string",
                         "description": "An optional description for the tab.",
                     },
+                    **deployWaitProperties,
                 },
                 "required": ["tab_api_name", "label", "motif", "tab_type"],
             },
@@ -242,7 +289,8 @@ def get_tools():
                         "description": "The Setup Experience perspective.",
                         "enum": ["all", "sales", "service", "platform", "marketing"], # Add others as needed
                         "default": "all"
-                    }
+                    },
+                    **deployWaitProperties,
                 },
                 "required": ["api_name", "label", "tabs"]
             },
@@ -290,6 +338,53 @@ def get_tools():
                 "required": ["object_name", "rule_name", "error_condition_formula", "error_message"]
             }
         ),
+        types.Tool(
+            name="get_deploy_status",
+            description="Returns the status of a Metadata API deploy started by one of the metadata tools: its state, component counts, and the component and Apex test failures once it is done.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "deploy_id": {
+                        "type": "string",
+                        "description": "The deploy id returned by the metadata tool (starts with 0Af)."
+                    },
+                    "wait": {
+                        "type": "boolean",
+                        "description": "If true, poll until the deploy finishes (or the timeout is reached) instead of returning the current state.",
+                        "default": False
+                    },
+                    "timeout": {
+                        "type": "number",
+                        "description": "Maximum seconds to wait when 'wait' is true (default 600).",
+                        "minimum": 1
+                    },
+                },
+                "required": ["deploy_id"]
+            }
+        ),
+        types.Tool(
+            name="begin_deploy_batch",
+            description="Opens a deploy batch: until commit_deploy_batch is called, metadata tools (objects, fields, tabs, apps...) only queue their changes. Use it when several metadata changes are made together, so they go out as one Metadata API deploy instead of one deploy each.",
+            inputSchema={
+                "type": "object",
+                "properties": {},
+            }
+        ),
+        types.Tool(
+            name="commit_deploy_batch",
+            description="Closes the open deploy batch and deploys all queued metadata changes as a single package (package.xml members and profile permissions are merged). If the deploy request fails, the batch stays open with its changes.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "discard": {
+                        "type": "boolean",
+                        "description": "If true, drop the queued changes instead of deploying them.",
+                        "default": False
+                    },
+                    **deployWaitProperties,
+                },
+            }
+        ),
         # --- Data Operations ---
         types.Tool(
             name="run_soql_query",
@@ -307,10 +402,42 @@ def get_tools():
                             "SELECT COUNT(Id) FROM Contact WHERE AccountId = '001...' "
                         ]
                     },
+                    **soqlBudgetProperties,
+                    "use_bulk": {
+                        "type": "string",
+                        "description": "'auto' (default) switches to a Bulk API 2.0 query job when more than bulk_threshold rows are wanted, 'always' forces Bulk API 2.0, 'never' stays on the REST API.",
+                        "enum": ["auto", "always", "never"],
+                        "default": "auto"
+                    },
+                    "bulk_threshold": {
+                        "type": "integer",
+                        "description": "Row count from which 'auto' mode uses Bulk API 2.0 (default 10000).",
+                        "minimum": 1
+                    },
+                    "output_file": {
+                        "type": "string",
+                        "description": "Local file path. When set, every row is written there as CSV (no row/byte budget) and only a summary is returned. Use it for large extracts."
+                    },
                 },
                 "required": ["query"]
             }
         ),
+        types.Tool(
+            name="query_more",
+            description="Fetches the next records of a SOQL query that was cut short, using the nextRecordsUrl returned by run_soql_query or a previous query_more call.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "next_records_url": {
+                        "type": "string",
+                        "description": "The nextRecordsUrl cursor returned by the previous call.",
+                        "examples": ["/services/data/v59.0/query/01gD0000002HU6KIAW-2000"]
+                    },
+                    **soqlBudgetProperties,
+                },
+                "required": ["next_records_url"]
+            }
+        ),
         types.Tool(
             name="run_sosl_search",
             description="Executes a SOSL search against Salesforce.",
@@ -326,6 +453,7 @@ def get_tools():
                             "FIND {SF*} IN ALL FIELDS LIMIT 20"
                         ]
                     },
+                    "output_format": outputFormatProperty,
                 },
                 "required": ["search"]
             }
@@ -427,9 +555,110 @@ def get_tools():
                 "required": ["object_name", "record_id"]
             }
         ),
+        types.Tool(
+            name="create_records",
+            description="Creates many records of one object in as few requests as possible (sObject Collections, 200 records per request). Returns one result per record, in input order.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "object_name": {
+                        "type": "string",
+                        "description": "The API name of the object to create records for (e.g., 'Account', 'Contact').",
+                        "examples": ["Account", "Lead", "Task"]
+                    },
+                    "records": {
+                        "type": "array",
+                        "description": "The records to create, each a dictionary of field API names and values.",
+                        "items": {"type": "object", "additionalProperties": True},
+                        "examples": [[{"Name": "Acme"}, {"Name": "Globex"}]]
+                    },
+                    **collectionOptionsProperties,
+                },
+                "required": ["object_name", "records"]
+            }
+        ),
+        types.Tool(
+            name="update_records",
+            description="Updates many records of one object in as few requests as possible (sObject Collections, 200 records per request). Each record must include its Id.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "object_name": {
+                        "type": "string",
+                        "description": "The API name of the object to update.",
+                        "examples": ["Contact", "Opportunity", "Case"]
+                    },
+                    "records": {
+                        "type": "array",
+                        "description": "The records to update, each with its 'Id' and the field API names and new values.",
+                        "items": {"type": "object", "additionalProperties": True},
+                        "examples": [[{"Id": "003...", "Title": "VP of Sales"}, {"Id": "003...", "Phone": "555-0100"}]]
+                    },
+                    **collectionOptionsProperties,
+                },
+                "required": ["object_name", "records"]
+            }
+        ),
+        types.Tool(
+            name="delete_records",
+            description="Deletes many records by Id in as few requests as possible (sObject Collections, 200 records per request).",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "record_ids": {
+                        "type": "array",
+                        "description": "The 15 or 18 character IDs of the records to delete. They can belong to different objects.",
+                        "items": {"type": "string"}
+                    },
+                    "object_name": {
+                        "type": "string",
+                        "description": "Optional API name of the object, only used in the result message."
+                    },
+                    **collectionOptionsProperties,
+                },
+                "required": ["record_ids"]
+            }
+        ),
+        types.Tool(
+            name="bulk_ingest_file",
+            description="Loads a local CSV or NDJSON file into Salesforce with Bulk API 2.0 (insert, update, upsert or delete). Use it for large loads (thousands of records or more). The file is streamed, large files are split over several jobs, and failed/unprocessed rows are written to local CSV files.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "object_name": {
+                        "type": "string",
+                        "description": "The API name of the object to load (e.g., 'Account').",
+                        "examples": ["Account", "Contact", "My_Object__c"]
+                    },
+                    "operation": {
+                        "type": "string",
+                        "description": "The Bulk API operation. 'update' and 'delete' need an Id column, 'upsert' needs external_id_field.",
+                        "enum": ["insert", "update", "upsert", "delete"]
+                    },
+                    "file_path": {
+                        "type": "string",
+                        "description": "Absolute path of the local CSV (header row with field API names) or NDJSON (one JSON object per line) file."
+                    },
+                    "file_format": {
+                        "type": "string",
+                        "description": "Format of the file. Inferred from the extension when omitted (.ndjson/.jsonl are NDJSON, anything else CSV).",
+                        "enum": ["csv", "ndjson"]
+                    },
+                    "external_id_field": {
+                        "type": "string",
+                        "description": "External ID field used to match records. Required for upsert."
+                    },
+                    "results_dir": {
+                        "type": "string",
+                        "description": "Directory for the failed/unprocessed rows files (defaults to the input file's directory)."
+                    },
+                },
+                "required": ["object_name", "operation", "file_path"]
+            }
+        ),
         types.Tool(
             name="describe_object",
-            description="Get detailed schema information for a Salesforce object, including fields, relationships, and picklist values. Returns markdown.",
+            description="Get detailed schema information for a Salesforce object, including fields, relationships, and picklist values. Returns markdown. Wide objects are paged (see field_offset/field_limit); sections and field_pattern narrow the output.",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -442,10 +671,63 @@ def get_tools():
                         "description": "Whether to include detailed field information (default: true)",
                         "default": True,
                     },
+                    "sections": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": ["summary", "fields", "relationships", "picklists"]},
+                        "description": "Sections to return (default: all). E.g. ['relationships'] for only the lookup/master-detail fields, ['picklists'] for only the picklist values.",
+                    },
+                    "field_pattern": {
+                        "type": "string",
+                        "description": "Only include fields whose API name or label matches this case-insensitive glob pattern (e.g. 'Billing*', '*__c'). Text without wildcards matches anywhere in the name.",
+                    },
+                    "field_offset": {
+                        "type": "integer",
+                        "description": "Index of the first matching field to return, to page through wide objects (default: 0).",
+                        "minimum": 0,
+                    },
+                    "field_limit": {
+                        "type": "integer",
+                        "description": "Maximum number of fields to return (default: 200; 0 returns every field). The output tells the field_offset of the next page.",
+                        "minimum": 0,
+                    },
                 },
                 "required": ["object_name"],
             },
         ),
+        types.Tool(
+            name="resolve_objects",
+            description="Resolves record ids and object names to Salesforce objects in one call: an id is matched by its 3-character key prefix, a name by API name, label or plural label (any case, with or without spaces/underscores), and unknown names get the closest object names as suggestions. Uses the cached object list, so it makes no per-value API request. Use it before describe_object or DML tools when unsure of an object's API name or of the type of a record id.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "values": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Record ids (15 or 18 characters) and/or object names or labels to resolve (e.g. ['001XXXXXXXXXXXX', 'opportunity products', 'Invoice__c'])."
+                    },
+                    "max_suggestions": {
+                        "type": "integer",
+                        "description": "Maximum number of suggested objects for a name that matches nothing (default 3).",
+                        "minimum": 1
+                    },
+                },
+                "required": ["values"]
+            }
+        ),
+        types.Tool(
+            name="get_api_usage",
+            description="Reports the org's daily API consumption (used, max, remaining) and the API requests sent by each tool of this server, with their budgets, throttling and refused calls.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "refresh": {
+                        "type": "boolean",
+                        "description": "If true, read the current limits from the org (costs one API call) instead of the last response header.",
+                        "default": False
+                    },
+                },
+            }
+        ),
         types.Tool(
             name="create_lightning_page",
             description="Creates a new Lightning App Page in Salesforce.",
@@ -459,7 +741,8 @@ def get_tools():
                     "description": {
                         "type": "string",
                         "description": "Optional description for the Lightning Page."
-                    }
+                    },
+                    **deployWaitProperties,
                 },
                 "required": ["label"]
             }
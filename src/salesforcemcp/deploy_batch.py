@@ -0,0 +1,145 @@
+import contextvars
+import threading
+import time
+import weakref
+from typing import Any, Callable, Optional
+
+from salesforcemcp.env import env_float
+from salesforcemcp.package import MetadataPackage, merge_packages
+
+# Seconds a metadata tool call waits for others to share its deploy (0 deploys immediately)
+DEPLOY_BATCH_WINDOW = env_float("SFMCP_DEPLOY_BATCH_WINDOW", 0.0)
+
+# Set by the server for the duration of a tool call to the MCP session that made it,
+# so each client has its own explicit batch.
+_batch_owner: contextvars.ContextVar[Any] = contextvars.ContextVar("sfmcp_batch_owner", default=None)
+
+def set_batch_owner(owner: Any) -> contextvars.Token:
+    return _batch_owner.set(owner)
+
+def reset_batch_owner(token: contextvars.Token):
+    _batch_owner.reset(token)
+
+class _LocalOwner:
+    """Owner of the explicit batch for calls made outside an MCP session."""
+
+class _WindowBatch:
+    """Packages collected during one batching window, and the outcome of their shared deploy."""
+
+    def __init__(self):
+        self.packages: list[MetadataPackage] = []
+        self.done = threading.Event()
+        self.deploy_id: Optional[str] = None
+        self.error: Optional[BaseException] = None
+
+class DeployBatcher:
+    """Coalesces the packages of several metadata tool calls into a single deploy.
+
+    Salesforce runs the deploys of an org one after another, so one merged deploy
+    finishes much sooner than several small ones. Packages are combined in two ways:
+
+    * Explicit batch: between begin() and commit(), submitted packages are only
+      collected; commit() merges and deploys them all at once. Each MCP session
+      has its own batch; the packages of other sessions are deployed as usual.
+    * Time window: with window > 0, the first submitted package waits that long for
+      concurrent calls, and every caller gets the id of the shared deploy.
+    """
+
+    def __init__(self, deploy: Callable[[MetadataPackage], str], window: float = DEPLOY_BATCH_WINDOW):
+        self._deploy = deploy
+        self.window = window
+        self._lock = threading.Lock()
+        # Batch owner (see set_batch_owner) -> packages of its open explicit batch
+        self._transactions: "weakref.WeakKeyDictionary[Any, list[MetadataPackage]]" = weakref.WeakKeyDictionary()
+        self._local_owner = _LocalOwner()
+        self._window_batch: Optional[_WindowBatch] = None
+
+    def _owner(self) -> Any:
+        owner = _batch_owner.get()
+        return self._local_owner if owner is None else owner
+
+    def begin(self):
+        """Opens an explicit batch.
+
+        Raises:
+            ValueError: If a batch is already open.
+        """
+        owner = self._owner()
+        with self._lock:
+            if owner in self._transactions:
+                raise ValueError(f"A deploy batch is already open with {len(self._transactions[owner])} package(s).")
+            self._transactions[owner] = []
+
+    def commit(self) -> tuple[Optional[str], int]:
+        """Closes the explicit batch and deploys its packages as one.
+
+        If the merge or the deploy fails, the batch is open again with the same packages,
+        so it can be committed once more or discarded.
+
+        Returns:
+            tuple: (deploy id, or None when the batch was empty; number of packages merged).
+        """
+        owner = self._owner()
+        with self._lock:
+            packages = self._transactions.pop(owner, None)
+            if packages is None:
+                raise ValueError("No deploy batch is open. Call begin_deploy_batch first.")
+        if not packages:
+            return None, 0
+        try:
+            return self._deploy(merge_packages(packages)), len(packages)
+        except BaseException:
+            with self._lock:
+                # A batch opened again while the deploy was running keeps its packages after these
+                self._transactions[owner] = packages + self._transactions.get(owner, [])
+            raise
+
+    def discard(self) -> int:
+        """Closes the explicit batch without deploying; returns the number of packages dropped."""
+        with self._lock:
+            packages = self._transactions.pop(self._owner(), [])
+        return len(packages)
+
+    def submit(self, package: MetadataPackage) -> Optional[str]:
+        """Deploys a package, or adds it to the current batch.
+
+        Returns:
+            str: The deploy id, or None when the package was queued in an explicit batch.
+        """
+        owner = self._owner()
+        with self._lock:
+            if owner in self._transactions:
+                self._transactions[owner].append(package)
+                return None
+            if self.window <= 0:
+                batch = None
+            elif self._window_batch is not None:
+                self._window_batch.packages.append(package)
+                batch, leader = self._window_batch, False
+            else:
+                batch = self._window_batch = _WindowBatch()
+                batch.packages.append(package)
+                leader = True
+
+        if batch is None:
+            return self._deploy(package)
+        if leader:
+            time.sleep(self.window)
+            with self._lock:
+                self._window_batch = None
+            try:
+                batch.deploy_id = self._deploy(merge_packages(batch.packages))
+            except BaseException as e:
+                batch.error = e
+            finally:
+                batch.done.set()
+        else:
+            batch.done.wait()
+        if batch.error is not None:
+            raise batch.error
+        return batch.deploy_id
+
+    def pending(self) -> int:
+        """Number of packages waiting in the explicit batch of the current session."""
+        with self._lock:
+            return len(self._transactions.get(self._owner(), []))
@@ -0,0 +1,153 @@
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from salesforcemcp.env import env_float
+from salesforcemcp.package import MetadataPackage
+
+DEPLOY_LEDGER_FILE = "deploy_ledger.sqlite3"
+
+# Seconds during which an identical package for the same org reuses the earlier deploy (0 disables)
+DEPLOY_DEDUP_WINDOW = env_float("SFMCP_DEPLOY_DEDUP_WINDOW", 300.0)
+
+FAILED_STATUSES = ("Failed", "Canceling", "Canceled")
+
+def package_digest(package: MetadataPackage) -> str:
+    """SHA-256 of a package's files, independent of the order they were added in."""
+    digest = hashlib.sha256()
+    for path in sorted(package.files):
+        content = package.files[path]
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        digest.update(path.encode("utf-8"))
+        digest.update(b"\0%d\0" % len(data))
+        digest.update(data)
+    return digest.hexdigest()
+
+@dataclass
+class LedgerEntry:
+    """A recorded deploy of one package, with its last known outcome."""
+    deploy_id: str
+    submitted_at: float
+    status: Optional[dict[str, Any]]
+    reuse_count: int
+
+    @property
+    def done(self) -> bool:
+        return bool(self.status and self.status.get("done"))
+
+    @property
+    def failed(self) -> bool:
+        return bool(self.status) and (
+            self.status.get("status") in FAILED_STATUSES or (self.done and not self.status.get("success"))
+        )
+
+    @property
+    def reusable(self) -> bool:
+        """Whether the last known status shows the deploy in progress or succeeded."""
+        return bool(self.status) and not self.failed
+
+class DeployLedger:
+    """SQLite ledger of deployed packages, keyed by org id and package digest.
+
+    Agents often repeat a metadata call after a timeout. A package identical to the
+    last one deployed to the same org within the window is not deployed again; the
+    earlier deploy id (and its outcome, once known) is returned instead. Deploying a
+    different package forgets the org's earlier entries, since it may undo them
+    (create a field, delete it, create it again), and the caller only reuses a deploy
+    whose refreshed status is in progress or succeeded.
+    """
+
+    def __init__(self, path: str = ":memory:", window: float = DEPLOY_DEDUP_WINDOW):
+        self.path = path
+        self.window = window
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS deploys (
+                    org_id TEXT NOT NULL,
+                    digest TEXT NOT NULL,
+                    deploy_id TEXT NOT NULL,
+                    submitted_at REAL NOT NULL,
+                    status TEXT,
+                    reuse_count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (org_id, digest)
+                )"""
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS deploys_by_id ON deploys (deploy_id)")
+
+    @classmethod
+    def from_env(cls) -> "DeployLedger":
+        """Opens the ledger in SFMCP_CACHE_DIR, or keeps it in memory when that is not set."""
+        cache_dir = os.getenv("SFMCP_CACHE_DIR")
+        if cache_dir:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                return cls(os.path.join(cache_dir, DEPLOY_LEDGER_FILE))
+            except (OSError, sqlite3.Error) as e:
+                print(f"Persistent deploy ledger disabled: {e}", file=sys.stderr)
+        return cls()
+
+    @staticmethod
+    def _entry(row) -> LedgerEntry:
+        deploy_id, submitted_at, status, reuse_count = row
+        return LedgerEntry(deploy_id, submitted_at, json.loads(status) if status else None, reuse_count)
+
+    def find_reusable(self, org_id: str, digest: str) -> Optional[LedgerEntry]:
+        """Returns the deploy of an identical package within the window, unless it is known to have failed.
+
+        Its status may be stale: check it (and call mark_reused) before returning its deploy id.
+        """
+        if self.window <= 0:
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT deploy_id, submitted_at, status, reuse_count FROM deploys "
+                "WHERE org_id = ? AND digest = ? AND submitted_at >= ?",
+                (org_id, digest, time.time() - self.window),
+            ).fetchone()
+        if row is None:
+            return None
+        entry = self._entry(row)
+        return None if entry.failed else entry
+
+    def mark_reused(self, org_id: str, digest: str):
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE deploys SET reuse_count = reuse_count + 1 WHERE org_id = ? AND digest = ?",
+                (org_id, digest),
+            )
+
+    def record(self, org_id: str, digest: str, deploy_id: str):
+        """Records a new deploy of a package as the org's only reusable one, and drops expired entries."""
+        now = time.time()
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM deploys WHERE org_id = ?", (org_id,))
+            self._db.execute(
+                "INSERT OR REPLACE INTO deploys (org_id, digest, deploy_id, submitted_at) VALUES (?, ?, ?, ?)",
+                (org_id, digest, deploy_id, now),
+            )
+            self._db.execute("DELETE FROM deploys WHERE submitted_at < ?", (now - max(self.window, 0),))
+
+    def get(self, deploy_id: str) -> Optional[LedgerEntry]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT deploy_id, submitted_at, status, reuse_count FROM deploys WHERE deploy_id = ?",
+                (deploy_id,),
+            ).fetchone()
+        return self._entry(row) if row else None
+
+    def update_status(self, deploy_id: str, status: dict[str, Any]):
+        """Stores the latest checkDeployStatus result of a deploy."""
+        with self._lock, self._db:
+            self._db.execute("UPDATE deploys SET status = ? WHERE deploy_id = ?", (json.dumps(status), deploy_id))
+
+    def close(self):
+        with self._lock:
+            self._db.close()
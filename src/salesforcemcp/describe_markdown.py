@@ -0,0 +1,131 @@
+import fnmatch
+from typing import Any, Iterable, Optional
+
+from salesforcemcp.env import env_int
+
+SECTIONS = ("summary", "fields", "relationships", "picklists")
+
+# Fields rendered per call unless the caller passes field_limit (0 renders every field)
+DEFAULT_FIELD_LIMIT = env_int("SFMCP_DESCRIBE_FIELD_LIMIT", 200)
+
+def _cell(value: Any) -> str:
+    # A pipe inside a label or picklist value would split the table cell
+    text = "" if value is None else str(value)
+    return text.replace("|", "\\|") if "|" in text else text
+
+def _is_relationship(field: dict[str, Any]) -> bool:
+    return field["type"] == "reference" and bool(field.get("referenceTo"))
+
+def _is_picklist(field: dict[str, Any]) -> bool:
+    return field["type"] in ("picklist", "multipicklist") and bool(field.get("picklistValues"))
+
+def normalize_sections(sections: Iterable[str]) -> tuple[str, ...]:
+    """The requested sections in rendering order; raises ValueError for unknown ones."""
+    requested = set(sections)
+    unknown = requested - set(SECTIONS)
+    if unknown:
+        raise ValueError(f"Invalid sections: {sorted(unknown)}. Must be among {list(SECTIONS)}")
+    return tuple(section for section in SECTIONS if section in requested)
+
+def select_fields(fields: list[dict[str, Any]], field_pattern: Optional[str] = None) -> list[dict[str, Any]]:
+    """The fields whose API name or label matches the glob pattern (case-insensitive), e.g. "Billing*"."""
+    if not field_pattern:
+        return fields
+    pattern = field_pattern.lower()
+    if not any(c in pattern for c in "*?["):
+        pattern = f"*{pattern}*"
+    return [
+        field for field in fields
+        if fnmatch.fnmatchcase(field["name"].lower(), pattern)
+        or fnmatch.fnmatchcase((field.get("label") or "").lower(), pattern)
+    ]
+
+def render_describe(describe: dict[str, Any], sections: Iterable[str] = SECTIONS,
+                    field_pattern: Optional[str] = None, field_offset: int = 0,
+                    field_limit: Optional[int] = None) -> str:
+    """Renders an sObject describe as markdown in a single pass.
+
+    Every line is appended to one list that is joined at the end, so the cost is
+    linear in the size of the output. Only the requested sections are rendered; the
+    fields, relationships and picklists sections cover the page of matching fields
+    selected by field_pattern, field_offset and field_limit (None uses
+    DEFAULT_FIELD_LIMIT, 0 means no limit). Without the fields section, only the
+    fields shown by the requested sections are counted and paged through.
+    """
+    sections = set(normalize_sections(sections))
+    if field_limit is None:
+        field_limit = DEFAULT_FIELD_LIMIT
+    out: list[str] = []
+    append = out.append
+
+    if "summary" in sections:
+        append(f"## {describe['label']} ({describe['name']})\n\n")
+        append(f"**Type:** {'Custom Object' if describe.get('custom') else 'Standard Object'}\n")
+        append(f"**API Name:** {describe['name']}\n")
+        append(f"**Label:** {describe['label']}\n")
+        append(f"**Plural Label:** {describe.get('labelPlural', '')}\n")
+        append(f"**Key Prefix:** {describe.get('keyPrefix', 'N/A')}\n")
+        append(f"**Createable:** {describe.get('createable')}\n")
+        append(f"**Updateable:** {describe.get('updateable')}\n")
+        append(f"**Deletable:** {describe.get('deletable')}\n\n")
+
+    if not sections & {"fields", "relationships", "picklists"}:
+        return "".join(out)
+
+    matching = select_fields(describe["fields"], field_pattern)
+    noun = "Fields"
+    if "fields" not in sections:
+        if "relationships" not in sections:
+            matching, noun = [f for f in matching if _is_picklist(f)], "Picklist fields"
+        elif "picklists" not in sections:
+            matching, noun = [f for f in matching if _is_relationship(f)], "Relationship fields"
+        else:
+            matching = [f for f in matching if _is_relationship(f) or _is_picklist(f)]
+            noun = "Relationship and picklist fields"
+    end = len(matching) if not field_limit else min(len(matching), field_offset + field_limit)
+    page = matching[field_offset:end]
+
+    if "fields" in sections:
+        append("## Fields\n\n")
+        append("| API Name | Label | Type | Required | Unique | External ID |\n")
+        append("|----------|-------|------|----------|--------|------------|\n")
+        for field in page:
+            label = field["label"]
+            if "|" in label:
+                label = _cell(label)
+            append(f"| {field['name']} | {label} | {field['type']} "
+                   f"| {'No' if field.get('nillable', True) else 'Yes'} | {'Yes' if field.get('unique') else 'No'} "
+                   f"| {'Yes' if field.get('externalId') else 'No'} |\n")
+
+    if "relationships" in sections:
+        reference_fields = [f for f in page if _is_relationship(f)]
+        if reference_fields:
+            append("\n## Relationship Fields\n\n")
+            append("| API Name | Related To | Relationship Name |\n")
+            append("|----------|-----------|-------------------|\n")
+            for field in reference_fields:
+                append(f"| {field['name']} | {', '.join(field['referenceTo'])} "
+                       f"| {field.get('relationshipName') or 'N/A'} |\n")
+
+    if "picklists" in sections:
+        picklist_fields = [f for f in page if _is_picklist(f)]
+        if picklist_fields:
+            append("\n## Picklist Fields\n\n")
+            for field in picklist_fields:
+                append(f"### {field['label']} ({field['name']})\n\n")
+                append("| Value | Label | Default |\n")
+                append("|-------|-------|--------|\n")
+                for value in field["picklistValues"]:
+                    api_value, label = value["value"], value["label"]
+                    if "|" in api_value or "|" in label:
+                        api_value, label = _cell(api_value), _cell(label)
+                    append(f"| {api_value} | {label} | {'Yes' if value.get('defaultValue') else 'No'} |\n")
+                append("\n")
+
+    if field_pattern or field_offset or end < len(matching):
+        described = f" matching '{field_pattern}'" if field_pattern else ""
+        append(f"\n_{noun} {field_offset + 1 if page else 0}-{field_offset + len(page)} of {len(matching)}{described}")
+        if end < len(matching):
+            append(f"; call again with field_offset={end} for the next page")
+        append("._\n")
+    return "".join(out)
@@ -0,0 +1,111 @@
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+DESCRIBE_STORE_FILE = "describe_cache.sqlite3"
+
+# Name under which the describeGlobal payload is stored (never a valid sObject name)
+GLOBAL_DESCRIBE = "__describe_global__"
+
+@dataclass
+class StoredDescribe:
+    """A describe payload plus the validators needed to revalidate it."""
+    payload: Any
+    last_modified: Optional[str]
+    etag: Optional[str]
+    fetched_at: float
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that turn the next describe into a conditional request."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+class DescribeStore:
+    """SQLite-backed store of describe and describeGlobal payloads.
+
+    Entries are keyed by org id, API version and object name so that several orgs
+    (or API versions) can share one cache directory. Payloads survive restarts and
+    are revalidated with If-None-Match/If-Modified-Since instead of refetched.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS describes (
+                    org_id TEXT NOT NULL,
+                    api_version TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    last_modified TEXT,
+                    etag TEXT,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (org_id, api_version, name)
+                )"""
+            )
+
+    @classmethod
+    def from_env(cls) -> Optional["DescribeStore"]:
+        """Opens the store in SFMCP_CACHE_DIR, or returns None when it is not configured."""
+        cache_dir = os.getenv("SFMCP_CACHE_DIR")
+        if not cache_dir:
+            return None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            return cls(os.path.join(cache_dir, DESCRIBE_STORE_FILE))
+        except (OSError, sqlite3.Error) as e:
+            print(f"Persistent describe cache disabled: {e}", file=sys.stderr)
+            return None
+
+    def get(self, org_id: str, api_version: str, name: str) -> Optional[StoredDescribe]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT payload, last_modified, etag, fetched_at FROM describes "
+                "WHERE org_id = ? AND api_version = ? AND name = ?",
+                (org_id, api_version, name.lower()),
+            ).fetchone()
+        if row is None:
+            return None
+        payload, last_modified, etag, fetched_at = row
+        return StoredDescribe(json.loads(payload), last_modified, etag, fetched_at)
+
+    def put(self, org_id: str, api_version: str, name: str, entry: StoredDescribe):
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO describes "
+                "(org_id, api_version, name, payload, last_modified, etag, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (org_id, api_version, name.lower(), json.dumps(entry.payload),
+                 entry.last_modified, entry.etag, entry.fetched_at),
+            )
+
+    def touch(self, org_id: str, api_version: str, name: str):
+        """Records a successful revalidation (304) without rewriting the payload."""
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE describes SET fetched_at = ? "
+                "WHERE org_id = ? AND api_version = ? AND name = ?",
+                (time.time(), org_id, api_version, name.lower()),
+            )
+
+    def invalidate(self, org_id: str, api_version: str, name: str):
+        with self._lock, self._db:
+            self._db.execute(
+                "DELETE FROM describes WHERE org_id = ? AND api_version = ? AND name = ?",
+                (org_id, api_version, name.lower()),
+            )
+
+    def close(self):
+        with self._lock:
+            self._db.close()
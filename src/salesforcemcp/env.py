@@ -0,0 +1,29 @@
+import os
+import sys
+from typing import Union
+
+Number = Union[int, float]
+
+def env_number(name: str, default: Number, minimum: Number = 0, integer: bool = False) -> Number:
+    """Reads a numeric SFMCP_* setting.
+
+    Settings are read at import time, so a malformed or out-of-range value must not
+    stop the server from starting: it is reported on stderr and the default is used.
+    """
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        number = int(value) if integer else float(value)
+    except ValueError:
+        number = None
+    if number is None or number < minimum:
+        print(f"Ignoring invalid {name} '{value}'; using {default}", file=sys.stderr)
+        return default
+    return number
+
+def env_int(name: str, default: int, minimum: int = 0) -> int:
+    return env_number(name, default, minimum, integer=True)
+
+def env_float(name: str, default: float, minimum: float = 0) -> float:
+    return env_number(name, default, minimum)
@@ -0,0 +1,103 @@
+import asyncio
+import contextvars
+import functools
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from salesforcemcp.env import env_int
+
+DEFAULT_MAX_WORKERS = 8
+
+# Tools that build and deploy a metadata package. Each call builds its package in
+# memory, so they can run concurrently; the group only exists so they can be capped
+# together (e.g. SFMCP_TOOL_CONCURRENCY=metadata_package=2).
+PACKAGE_GROUP = "metadata_package"
+PACKAGE_TOOLS = {
+    "create_object_with_fields",
+    "create_custom_field",
+    "delete_object_fields",
+    "create_custom_metadata_type",
+    "create_custom_metadata_field",
+    "create_tab",
+    "create_custom_app",
+    "create_lightning_page",
+}
+
+DEFAULT_LIMITS: dict[str, int] = {}
+
+def parse_limits(spec: Optional[str]) -> dict[str, int]:
+    """Parses a concurrency spec such as "run_soql_query=4,metadata_package=1".
+
+    Keys can be a tool name or a group name. Invalid entries are ignored.
+    """
+    limits = {}
+    if not spec:
+        return limits
+    for entry in spec.split(","):
+        key, sep, value = entry.partition("=")
+        if not sep:
+            continue
+        try:
+            limit = int(value)
+        except ValueError:
+            print(f"Ignoring invalid concurrency limit '{entry}'", file=sys.stderr)
+            continue
+        if limit > 0:
+            limits[key.strip()] = limit
+    return limits
+
+class ToolExecutor:
+    """Runs blocking tool implementations on a bounded thread pool.
+
+    Every call is dispatched off the event loop, so the stdio server keeps
+    reading requests while Salesforce round trips are in flight. Calls can be
+    capped per tool (or per group of tools) with asyncio semaphores.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, limits: Optional[dict[str, int]] = None):
+        self.max_workers = max_workers or DEFAULT_MAX_WORKERS
+        self.limits = {**DEFAULT_LIMITS, **(limits or {})}
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="sfmcp-tool")
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    @classmethod
+    def from_env(cls) -> "ToolExecutor":
+        """Builds an executor from SFMCP_MAX_WORKERS and SFMCP_TOOL_CONCURRENCY."""
+        return cls(
+            max_workers=env_int("SFMCP_MAX_WORKERS", DEFAULT_MAX_WORKERS, minimum=1),
+            limits=parse_limits(os.getenv("SFMCP_TOOL_CONCURRENCY")),
+        )
+
+    def limit_key(self, tool_name: str) -> str:
+        """Returns the key whose limit applies to the tool (tool name wins over group)."""
+        if tool_name in self.limits:
+            return tool_name
+        if tool_name in PACKAGE_TOOLS:
+            return PACKAGE_GROUP
+        return tool_name
+
+    def _semaphore(self, tool_name: str) -> Optional[asyncio.Semaphore]:
+        key = self.limit_key(tool_name)
+        limit = self.limits.get(key)
+        if limit is None:
+            return None
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(limit)
+            self._semaphores[key] = semaphore
+        return semaphore
+
+    async def run(self, tool_name: str, func: Callable[..., Any], *args: Any) -> Any:
+        """Runs func(*args) in the pool, honouring the tool's concurrency cap."""
+        loop = asyncio.get_running_loop()
+        call = functools.partial(contextvars.copy_context().run, func, *args)
+        semaphore = self._semaphore(tool_name)
+        if semaphore is None:
+            return await loop.run_in_executor(self._pool, call)
+        async with semaphore:
+            return await loop.run_in_executor(self._pool, call)
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
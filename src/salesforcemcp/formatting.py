@@ -0,0 +1,106 @@
+import csv
+import io
+import json
+from typing import IO, Any, Iterable, Optional
+
+OUTPUT_FORMATS = ("json", "columnar", "csv", "ndjson")
+
+def flatten_record(record: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+    """Drops "attributes" and flattens parent relationships into dotted keys.
+
+    {"Name": "Acme", "Owner": {"attributes": {...}, "Name": "Ann"}} becomes
+    {"Name": "Acme", "Owner.Name": "Ann"}. Child relationship subqueries
+    ({"totalSize", "records", ...}) are kept as lists of flattened records.
+    """
+    flat = {}
+    for key, value in record.items():
+        if key == "attributes":
+            continue
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            if "records" in value:
+                flat[name] = [flatten_record(child) for child in value["records"]]
+            else:
+                flat.update(flatten_record(value, f"{name}."))
+        else:
+            flat[name] = value
+    return flat
+
+def _columns(rows: list[dict[str, Any]]) -> list[str]:
+    columns = {}
+    for row in rows:
+        for key in row:
+            columns.setdefault(key, None)
+    # A relationship that is null on some rows only shows up as its dotted columns
+    parents = set()
+    for column in columns:
+        parts = column.split(".")
+        parents.update(".".join(parts[:i]) for i in range(1, len(parts)))
+    return [column for column in columns if column not in parents]
+
+def _cell(value: Any) -> Any:
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, separators=(",", ":"))
+    return value
+
+def format_records(records: Iterable[dict[str, Any]], output_format: str) -> str:
+    """Renders records as compact columnar JSON, CSV or NDJSON.
+
+    Args:
+        records: Records as returned by the REST API (with "attributes").
+        output_format: One of "columnar", "csv" or "ndjson".
+    """
+    rows = [flatten_record(record) for record in records]
+    if output_format == "ndjson":
+        return "\n".join(json.dumps(row, separators=(",", ":")) for row in rows)
+
+    columns = _columns(rows)
+    if output_format == "columnar":
+        return json.dumps(
+            {"columns": columns, "rows": [[row.get(column) for column in columns] for row in rows]},
+            separators=(",", ":"),
+        )
+    if output_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow([_cell(row.get(column)) for column in columns])
+        return buffer.getvalue().rstrip("\n")
+    raise ValueError(f"Invalid output_format: '{output_format}'. Must be one of {list(OUTPUT_FORMATS)}")
+
+class CsvWriter:
+    """Writes records to a CSV file page by page, without keeping earlier pages in memory.
+
+    The columns are those of the first page. A relationship that was null throughout the
+    first page but is set on a later row is written as a JSON object in its column.
+    """
+
+    def __init__(self, f: IO[str]):
+        self._writer = csv.writer(f, lineterminator="\n")
+        self.columns: Optional[list[str]] = None
+        self.rows = 0
+
+    def write_records(self, records: Iterable[dict[str, Any]]):
+        rows = [flatten_record(record) for record in records]
+        if self.columns is None:
+            self.columns = _columns(rows)
+            self._writer.writerow(self.columns)
+        for row in rows:
+            self._writer.writerow([_cell(_row_value(row, column)) for column in self.columns])
+        self.rows += len(rows)
+
+def _row_value(row: dict[str, Any], column: str) -> Any:
+    if column in row:
+        return row[column]
+    prefix = f"{column}."
+    nested = {key[len(prefix):]: value for key, value in row.items() if key.startswith(prefix)}
+    return nested or None
+
+def group_by_type(records: Iterable[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    """Groups SOSL search records by their sObject type, keeping the result order."""
+    groups = {}
+    for record in records:
+        object_type = record.get("attributes", {}).get("type", "Unknown")
+        groups.setdefault(object_type, []).append(record)
+    return groups
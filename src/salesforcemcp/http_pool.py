@@ -0,0 +1,144 @@
+import re
+import time
+from typing import Any, Callable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from salesforcemcp.env import env_float, env_int
+from salesforcemcp.metrics import METRICS
+
+DEFAULT_POOL_SIZE = 16
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 120.0
+
+# Error code of an expired session: a 401 from REST/Bulk, a SOAP fault (HTTP 500) from SOAP/Metadata
+EXPIRED_SESSION_CODE = b"INVALID_SESSION_ID"
+
+SOAP_SESSION_ID = re.compile(rb"sessionId>([^<]+)<")
+
+def session_expired(response: requests.Response) -> bool:
+    return response.status_code in (401, 500) and EXPIRED_SESSION_CODE in response.content
+
+def _request_session_id(kwargs: dict[str, Any]) -> Optional[str]:
+    """The session id a request was sent with: its Bearer (or Bulk API) header or the SOAP sessionId."""
+    for name, value in (kwargs.get("headers") or {}).items():
+        if name.lower() in ("authorization", "x-sfdc-session") and isinstance(value, str):
+            return value.split(" ", 1)[-1]
+    data = kwargs.get("data")
+    if hasattr(data, "session_id"):
+        return data.session_id
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if isinstance(data, bytes):
+        match = SOAP_SESSION_ID.search(data)
+        if match:
+            return match.group(1).decode("utf-8")
+    return None
+
+def _with_session_id(kwargs: dict[str, Any], stale: str, fresh: str) -> dict[str, Any]:
+    """A copy of the request arguments with the stale session id replaced."""
+    kwargs = dict(kwargs)
+    if kwargs.get("headers"):
+        kwargs["headers"] = {
+            name: value.replace(stale, fresh) if isinstance(value, str) else value
+            for name, value in kwargs["headers"].items()
+        }
+    data = kwargs.get("data")
+    if hasattr(data, "with_session_id"):
+        kwargs["data"] = data.with_session_id(fresh)
+    elif isinstance(data, bytes):
+        kwargs["data"] = data.replace(stale.encode("utf-8"), fresh.encode("utf-8"))
+    elif isinstance(data, str):
+        kwargs["data"] = data.replace(stale, fresh)
+    return kwargs
+
+def _body_position(data: Any) -> Optional[int]:
+    """Where a file-object body starts, so it can be rewound for a replay (None if it cannot be)."""
+    try:
+        return data.tell() if data.seekable() else None
+    except (AttributeError, OSError, ValueError):
+        return None
+
+def _rewind_body(data: Any, position: Optional[int]):
+    """Prepares a sent body for a replay; a body that was consumed and cannot be rewound raises."""
+    if data is None or isinstance(data, (str, bytes, dict, list, tuple)) or hasattr(data, "with_session_id"):
+        return
+    if position is None:
+        # Replaying would send whatever is left of the body, usually nothing
+        raise ValueError("The Salesforce session expired while sending a body that cannot be resent; "
+                         "a new session was opened, retry the call.")
+    data.seek(position)
+
+def _request_size(response: requests.Response) -> int:
+    # requests sets Content-Length for every sized body, including a streamed DeployEnvelope
+    return int(response.request.headers.get("Content-Length") or 0)
+
+def _response_size(response: requests.Response, kwargs: dict[str, Any]) -> int:
+    if kwargs.get("stream"):
+        # Reading .content would consume a body the caller streams
+        return int(response.headers.get("Content-Length") or 0)
+    return len(response.content)
+
+class PooledSession(requests.Session):
+    """requests.Session with a sized keep-alive connection pool and default timeouts.
+
+    One instance is shared by every Salesforce call (REST, SOAP, Metadata, Bulk), so
+    the TCP/TLS connection to the instance is reused instead of renegotiated per call.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout: float = DEFAULT_READ_TIMEOUT):
+        super().__init__()
+        self.timeout = (connect_timeout, read_timeout)
+        # Only failed connection attempts are retried; a request that reached Salesforce is not replayed
+        retries = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.3)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retries)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+        # Set by the owner of the session: (expired session id) -> new session id, or None
+        self.renew_session: Optional[Callable[[str], Optional[str]]] = None
+        # Set by the owner of the session to pace and count requests (an ApiScheduler)
+        self.api_scheduler = None
+
+    @classmethod
+    def from_env(cls) -> "PooledSession":
+        """Builds a session from SFMCP_HTTP_POOL_SIZE, SFMCP_HTTP_CONNECT_TIMEOUT and SFMCP_HTTP_READ_TIMEOUT."""
+        return cls(
+            pool_size=env_int("SFMCP_HTTP_POOL_SIZE", DEFAULT_POOL_SIZE, minimum=1),
+            connect_timeout=env_float("SFMCP_HTTP_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT, minimum=0.1),
+            read_timeout=env_float("SFMCP_HTTP_READ_TIMEOUT", DEFAULT_READ_TIMEOUT, minimum=0.1),
+        )
+
+    def _send(self, method: str, url: str, *args: Any, **kwargs: Any) -> requests.Response:
+        scheduler = self.api_scheduler
+        if scheduler is not None:
+            scheduler.before_request()
+        start = time.perf_counter()
+        response = super().request(method, url, *args, **kwargs)
+        METRICS.record_request(time.perf_counter() - start, _request_size(response), _response_size(response, kwargs))
+        if scheduler is not None:
+            scheduler.after_response(response)
+        return response
+
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> requests.Response:
+        # simple-salesforce and zeep pass no timeout (or timeout=None), which would wait forever
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        data = kwargs.get("data")
+        position = _body_position(data) if hasattr(data, "read") else None
+        response = self._send(method, url, *args, **kwargs)
+        if self.renew_session is None or args or not session_expired(response):
+            return response
+
+        # The session expired: log in again (once for all concurrent callers) and replay
+        # the request with the new session id, so REST, SOAP, Metadata and Bulk calls
+        # all recover transparently
+        stale = _request_session_id(kwargs)
+        fresh = self.renew_session(stale) if stale else None
+        if not fresh or fresh == stale:
+            return response
+        _rewind_body(data, position)
+        return self._send(method, url, **_with_session_id(kwargs, stale, fresh))
@@ -1,11 +1,35 @@
 import salesforcemcp.sfdc_client as sfdc_client
+import salesforcemcp.query as sfquery
+import salesforcemcp.bulk as sfbulk
+import salesforcemcp.formatting as sfformat
+import salesforcemcp.sobject_collections as sfcollections
+import salesforcemcp.metadata_soap as sfsoap
+import salesforcemcp.describe_markdown as sfdescribe
 from salesforcemcp.sfdc_client import OrgHandler
 import mcp.types as types
 from simple_salesforce import Salesforce
 from simple_salesforce.exceptions import SalesforceError# import metadata API helper classes
 import json
+import sys
+import time
 from simple_salesforce import SalesforceError
-from typing import Any
+from typing import Any, Optional
+
+def _deploy_result_text(sf_client: OrgHandler, deploy_id: Optional[str], arguments: dict[str, Any], prepared: str) -> str:
+    """Reports a submitted deploy, waiting for its outcome when wait_for_deploy is set."""
+    if deploy_id is None:
+        return (f"Package queued in the open deploy batch ({sf_client.deploy_batcher.pending()} pending); "
+                "call commit_deploy_batch to deploy it.")
+    entry = sf_client.deploy_ledger.get(deploy_id)
+    if entry is not None and entry.reuse_count:
+        prepared += (f" An identical package was deployed {time.time() - entry.submitted_at:.0f}s ago; "
+                     "it was not deployed again.")
+    if entry is not None and entry.done:
+        return f"{prepared}\n{sfsoap.summarize_deploy(entry.status)}"
+    if not arguments.get("wait_for_deploy"):
+        return f"{prepared} Deploy id: {deploy_id} (track it with get_deploy_status)."
+    status = sf_client.deploy_status(deploy_id, wait=True)
+    return f"{prepared}\n{sfsoap.summarize_deploy(status)}"
 
 def create_object_impl(sf_client: sfdc_client.OrgHandler, arguments: dict[str, str]):
     """Creates a new custom object via the Salesforce Tooling API using the simple-salesforce client."""
@@ -62,13 +86,16 @@ def create_object_with_fields_impl(sf_client: sfdc_client.OrgHandler, arguments:
     if not sf_client.connection:
         raise ValueError("Salesforce connection is not active. Cannot perform metadata deployment.")
     sfdc_client.write_to_file(json.dumps(json_obj))
-    sfdc_client.create_metadata_package(json_obj)
-    sfdc_client.create_send_to_server(sf_client.connection)
+    package = sfdc_client.create_metadata_package(json_obj)
+    deploy_id = sf_client.submit_package(package)
+    text = _deploy_result_text(sf_client, deploy_id, arguments,
+                               f"Custom Object '{api_name}' creation package prepared and deployment initiated.")
+    sf_client.invalidate_describe(api_name)
 
     return [
         types.TextContent(
             type="text",
-            text=f"Custom Object '{api_name}' creation package prepared and deployment initiated."
+            text=text
         )
     ]
 
@@ -85,13 +112,16 @@ def delete_object_fields_impl(sf_client: sfdc_client.OrgHandler, arguments: dict
 
     if not sf_client.connection:
         raise ValueError("Salesforce connection is not active. Cannot perform metadata deployment.")
-    sfdc_client.delete_fields(json_obj)
-    sfdc_client.delete_send_to_server(sf_client.connection)
+    package = sfdc_client.delete_fields(json_obj)
+    deploy_id = sf_client.submit_package(package)
+    text = _deploy_result_text(sf_client, deploy_id, arguments,
+                               f"Delete Object fields on '{api_name}' creation package prepared and deployment initiated.")
+    sf_client.invalidate_describe(api_name)
 
     return [
         types.TextContent(
             type="text",
-            text=f"Delete Object fields on '{api_name}' creation package prepared and deployment initiated."
+            text=text
         )
     ]
 
@@ -139,16 +169,17 @@ def create_tab_impl(sf_client: sfdc_client.OrgHandler, arguments: dict[str, str]
         raise ValueError("Salesforce connection is not active. Cannot perform metadata deployment.")
 
     try:
-        sfdc_client.create_tab_package(json_obj)
-        sfdc_client.create_send_to_server(sf_client.connection)
+        package = sfdc_client.create_tab_package(json_obj)
+        deploy_id = sf_client.submit_package(package)
         return [
             types.TextContent(
                 type="text",
-                text=f"Custom Tab '{tab_api_name}' creation package prepared and deployment initiated."
+                text=_deploy_result_text(sf_client, deploy_id, arguments,
+                                         f"Custom Tab '{tab_api_name}' creation package prepared and deployment initiated.")
             )
         ]
     except Exception as e:
-        print(f"Error during Custom Tab creation/deployment: {e}")
+        print(f"Error during Custom Tab creation/deployment: {e}", file=sys.stderr)
         raise ValueError(f"Failed to create or deploy Custom Tab '{tab_api_name}'. Error: {str(e)}")
 
 def create_custom_metadata_type_impl(sf_client: sfdc_client.OrgHandler, arguments: dict[str, str]):
@@ -179,10 +210,13 @@ def create_custom_metadata_type_impl(sf_client: sfdc_client.OrgHandler, argument
         "fields": fields
     }
     # Use the Custom Metadata Type package generator
-    sfdc_client.create_custom_metadata_type_package(json_obj)
-    # Deploy the prepared package (deployment_package) via the Metadata API
-    sfdc_client.deploy_package_from_deploy_dir(sf_client.connection)
-    return [types.TextContent(type="text", text=f"Custom Metadata Type '{api_name}' creation package prepared and deployment initiated.")]
+    package = sfdc_client.create_custom_metadata_type_package(json_obj)
+    # Deploy the prepared package via the Metadata API
+    deploy_id = sf_client.submit_package(package)
+    text = _deploy_result_text(sf_client, deploy_id, arguments,
+                               f"Custom Metadata Type '{api_name}' creation package prepared and deployment initiated.")
+    sf_client.invalidate_describe(api_name)
+    return [types.TextContent(type="text", text=text)]
 
 def create_custom_app_impl(sf_client: OrgHandler, arguments: dict[str, str]):
     """
@@ -228,16 +262,17 @@ def create_custom_app_impl(sf_client: OrgHandler, arguments: dict[str, str]):
         raise ValueError("Salesforce connection is not active. Cannot perform metadata deployment.")
 
     try:
-        sfdc_client.create_custom_app_package(json_obj)
-        sfdc_client.create_send_to_server(sf_client.connection)
+        package = sfdc_client.create_custom_app_package(json_obj)
+        deploy_id = sf_client.submit_package(package)
         return [
             types.TextContent(
                 type="text",
-                text=f"Custom Application '{api_name}' creation package prepared and deployment initiated."
+                text=_deploy_result_text(sf_client, deploy_id, arguments,
+                                         f"Custom Application '{api_name}' creation package prepared and deployment initiated.")
             )
         ]
     except Exception as e:
-        print(f"Error during Custom Application creation/deployment: {e}")
+        print(f"Error during Custom Application creation/deployment: {e}", file=sys.stderr)
         raise ValueError(f"Failed to create or deploy Custom Application '{api_name}'. Error: {str(e)}")
 
 def create_report_folder_impl(sf_client: sfdc_client.OrgHandler, arguments: dict[str, str]):
@@ -313,29 +348,107 @@ def create_lightning_page_impl(sf_client, arguments):
     try:
         page_label = arguments.get("label", "Simple Lightning App Page")
         description = arguments.get("description", "")
-        ok = sfdc_client.deploy_lightning_page(page_label, description)
-        if not ok:
+        package = sfdc_client.deploy_lightning_page(page_label, description)
+        if package is None:
             return [types.TextContent(type="text", text="Failed to create Lightning Page package.")]
-        sfdc_client.deploy_package_from_deploy_dir(sf_client.connection)
-        return [types.TextContent(type="text", text=f"Successfully created new Lightning App Page with label: {page_label}!")]
+        deploy_id = sf_client.submit_package(package)
+        return [types.TextContent(type="text", text=_deploy_result_text(
+            sf_client, deploy_id, arguments, f"Successfully created new Lightning App Page with label: {page_label}!"))]
     except Exception as e:
         return [types.TextContent(type="text", text=f"Error creating Lightning App Page: {str(e)}")]
 
+def get_deploy_status_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
+    """Returns the status of a Metadata API deploy, with its component and test failures."""
+    deploy_id = arguments.get("deploy_id")
+    if not deploy_id:
+        raise ValueError("Missing 'deploy_id' argument")
+    if not sf_client.connection:
+        raise ValueError("Salesforce connection not established.")
+    try:
+        status = sf_client.deploy_status(deploy_id, wait=bool(arguments.get("wait")), timeout=arguments.get("timeout"))
+        return [types.TextContent(
+            type="text",
+            text=f"{sfsoap.summarize_deploy(status)}\n\n{json.dumps(status, indent=2)}"
+        )]
+    except Exception as e:
+        return [types.TextContent(type="text", text=f"Error checking deploy status: {e}")]
+
+def begin_deploy_batch_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
+    """Starts collecting metadata packages so they are deployed together by commit_deploy_batch."""
+    sf_client.deploy_batcher.begin()
+    return [types.TextContent(
+        type="text",
+        text="Deploy batch opened. Metadata tools now queue their packages; call commit_deploy_batch to deploy them as one."
+    )]
+
+def commit_deploy_batch_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
+    """Merges the packages of the open batch into one package and deploys it."""
+    if not sf_client.connection:
+        raise ValueError("Salesforce connection is not active. Cannot perform metadata deployment.")
+    if arguments.get("discard"):
+        dropped = sf_client.deploy_batcher.discard()
+        return [types.TextContent(type="text", text=f"Deploy batch discarded ({dropped} package(s) dropped).")]
+    deploy_id, count = sf_client.deploy_batcher.commit()
+    if deploy_id is None:
+        return [types.TextContent(type="text", text="Deploy batch closed; it was empty, nothing was deployed.")]
+    return [types.TextContent(
+        type="text",
+        text=_deploy_result_text(sf_client, deploy_id, arguments, f"{count} package(s) merged and deployment initiated.")
+    )]
+
 # --- Data Operations ---
 
+def _soql_budget(arguments: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "max_rows": arguments.get("max_rows"),
+        "max_bytes": arguments.get("max_bytes"),
+        "page_size": arguments.get("page_size"),
+    }
+
+def _output_format(arguments: dict[str, Any]) -> str:
+    output_format = arguments.get("output_format") or "json"
+    if output_format not in sfformat.OUTPUT_FORMATS:
+        raise ValueError(f"Invalid output_format: '{output_format}'. Must be one of {list(sfformat.OUTPUT_FORMATS)}")
+    return output_format
+
+def _soql_result_text(results: dict[str, Any], output_format: str = "json") -> str:
+    if "outputFile" in results:
+        return (f"SOQL Query Results: {results['recordsWritten']} records written as CSV to "
+                f"{results['outputFile']} (via {'Bulk API 2.0 job ' + results['jobId'] if 'jobId' in results else 'REST API'}).")
+    if output_format == "json":
+        text = f"SOQL Query Results (JSON):\\n{json.dumps(results, indent=2)}"
+    else:
+        text = (f"SOQL Query Results ({output_format}, {len(results['records'])} of {results['totalSize']} records):\n"
+                f"{sfformat.format_records(results['records'], output_format)}")
+    if not results.get("done", True):
+        text += f"\n\nReturned {len(results['records'])} of {results['totalSize']} records. "
+        if "nextRecordsUrl" in results:
+            text += f"Call query_more with next_records_url '{results['nextRecordsUrl']}' to fetch more."
+        else:
+            text += "Raise max_rows/max_bytes or pass output_file to extract every row."
+    return text
+
 def run_soql_query_impl(sf_client: OrgHandler, arguments: dict[str, str]):
     query = arguments.get("query")
     if not query:
         raise ValueError("Missing 'query' argument")
     if not sf_client.connection:
         raise ValueError("Salesforce connection not established.")
+    output_format = _output_format(arguments)
     try:
-        results = sf_client.connection.query_all(query)
-        # Consider limits on result size? Truncate or summarize if too large?
+        # Large results are routed to Bulk API 2.0; smaller ones are paged over REST
+        results = sfquery.run_query(
+            sf_client.connection,
+            query,
+            use_bulk=arguments.get("use_bulk"),
+            bulk_threshold=arguments.get("bulk_threshold"),
+            output_file=arguments.get("output_file"),
+            **_soql_budget(arguments),
+        )
         return [
             types.TextContent(
                 type="text",
-                text=f"SOQL Query Results (JSON):\\n{json.dumps(results, indent=2)}"
+                text=_soql_result_text(results, output_format)
             )
         ]
     except SalesforceError as e:
@@ -343,18 +456,48 @@ def run_soql_query_impl(sf_client: OrgHandler, arguments: dict[str, str]):
     except Exception as e:
         return [types.TextContent(type="text", text=f"Error executing SOQL: {e}")]
 
+def query_more_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
+    """Fetches the next pages of a SOQL result from the nextRecordsUrl cursor of a previous call."""
+    next_records_url = arguments.get("next_records_url")
+    if not next_records_url:
+        raise ValueError("Missing 'next_records_url' argument")
+    if not sf_client.connection:
+        raise ValueError("Salesforce connection not established.")
+    output_format = _output_format(arguments)
+    try:
+        results = sfquery.stream_query(sf_client.connection, next_records_url=next_records_url, **_soql_budget(arguments))
+        return [
+            types.TextContent(
+                type="text",
+                text=_soql_result_text(results, output_format)
+            )
+        ]
+    except SalesforceError as e:
+        return [types.TextContent(type="text", text=f"SOQL Error: {e.status} {e.resource_name} {e.content}")]
+    except Exception as e:
+        return [types.TextContent(type="text", text=f"Error fetching more SOQL results: {e}")]
+
 def run_sosl_search_impl(sf_client: OrgHandler, arguments: dict[str, str]):
     search = arguments.get("search")
     if not search:
         raise ValueError("Missing 'search' argument")
     if not sf_client.connection:
         raise ValueError("Salesforce connection not established.")
+    output_format = _output_format(arguments)
     try:
         results = sf_client.connection.search(search)
+        if output_format == "json":
+            text = f"SOSL Search Results (JSON):\\n{json.dumps(results, indent=2)}"
+        else:
+            # Records of different objects have different columns, so render one block per object
+            groups = sfformat.group_by_type(results.get("searchRecords", []))
+            text = f"SOSL Search Results ({output_format}):"
+            for object_type, records in groups.items():
+                text += f"\n\n### {object_type} ({len(records)} records)\n{sfformat.format_records(records, output_format)}"
         return [
             types.TextContent(
                 type="text",
-                text=f"SOSL Search Results (JSON):\\n{json.dumps(results, indent=2)}"
+                text=text
             )
         ]
     except SalesforceError as e:
@@ -368,6 +511,7 @@ def get_object_fields_impl(sf_client: OrgHandler, arguments: dict[str, str]):
         raise ValueError("Missing 'object_name' argument")
     try:
         # Use the caching method from OrgHandler
+        object_name = sf_client.resolve_object_name(object_name)
         results = sf_client.get_object_fields_cached(object_name)
         return [
             types.TextContent(
@@ -376,7 +520,7 @@ def get_object_fields_impl(sf_client: OrgHandler, arguments: dict[str, str]):
             )
         ]
     except Exception as e: # Catches errors from get_object_fields_cached
-         return [types.TextContent(type="text", text=f"Error getting fields for {object_name}: {e}")]
+         return [types.TextContent(type="text", text=f"Error getting fields for {object_name}: {e}{sf_client.object_name_hint(object_name)}")]
 
 def create_record_impl(sf_client: OrgHandler, arguments: dict[str, Any]): # Data can be complex
     object_name = arguments.get("object_name")
@@ -388,6 +532,7 @@ def create_record_impl(sf_client: OrgHandler, arguments: dict[str, Any]): # Data
     if not isinstance(data, dict):
          raise ValueError("'data' argument must be a dictionary/object.")
     try:
+        object_name = sf_client.resolve_object_name(object_name)
         sf_object = getattr(sf_client.connection, object_name)
         results = sf_object.create(data)
         # Result usually {'id': '...', 'success': True, 'errors': []}
@@ -398,11 +543,11 @@ def create_record_impl(sf_client: OrgHandler, arguments: dict[str, Any]): # Data
             )
         ]
     except SalesforceError as e:
-        return [types.TextContent(type="text", text=f"Create Record Error: {e.status} {e.resource_name} {e.content}")]
+        return [types.TextContent(type="text", text=f"Create Record Error: {e.status} {e.resource_name} {e.content}{sf_client.object_name_hint(object_name)}")]
     except AttributeError:
-         return [types.TextContent(type="text", text=f"Error: Object type '{object_name}' not found or accessible via API.")]
+         return [types.TextContent(type="text", text=f"Error: Object type '{object_name}' not found or accessible via API.{sf_client.object_name_hint(object_name)}")]
     except Exception as e:
-        return [types.TextContent(type="text", text=f"Error creating {object_name} record: {e}")]
+        return [types.TextContent(type="text", text=f"Error creating {object_name} record: {e}{sf_client.object_name_hint(object_name)}")]
 
 def update_record_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
     object_name = arguments.get("object_name")
@@ -415,6 +560,7 @@ def update_record_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
     if not isinstance(data, dict):
          raise ValueError("'data' argument must be a dictionary/object.")
     try:
+        object_name = sf_client.resolve_object_name(object_name)
         sf_object = getattr(sf_client.connection, object_name)
         # Update returns status code (204 No Content on success)
         status_code = sf_object.update(record_id, data)
@@ -422,11 +568,11 @@ def update_record_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
         message = f"Update {object_name} record {record_id}: Status Code {status_code} - {'Success' if success else 'Failed'}"
         return [types.TextContent(type="text", text=message)]
     except SalesforceError as e:
-        return [types.TextContent(type="text", text=f"Update Record Error: {e.status} {e.resource_name} {e.content}")]
+        return [types.TextContent(type="text", text=f"Update Record Error: {e.status} {e.resource_name} {e.content}{sf_client.object_name_hint(object_name)}")]
     except AttributeError:
-         return [types.TextContent(type="text", text=f"Error: Object type '{object_name}' not found or accessible via API.")]
+         return [types.TextContent(type="text", text=f"Error: Object type '{object_name}' not found or accessible via API.{sf_client.object_name_hint(object_name)}")]
     except Exception as e:
-        return [types.TextContent(type="text", text=f"Error updating {object_name} record {record_id}: {e}")]
+        return [types.TextContent(type="text", text=f"Error updating {object_name} record {record_id}: {e}{sf_client.object_name_hint(object_name)}")]
 
 def delete_record_impl(sf_client: OrgHandler, arguments: dict[str, str]):
     object_name = arguments.get("object_name")
@@ -436,6 +582,7 @@ def delete_record_impl(sf_client: OrgHandler, arguments: dict[str, str]):
     if not sf_client.connection:
         raise ValueError("Salesforce connection not established.")
     try:
+        object_name = sf_client.resolve_object_name(object_name)
         sf_object = getattr(sf_client.connection, object_name)
         # Delete returns status code (204 No Content on success)
         status_code = sf_object.delete(record_id)
@@ -444,11 +591,112 @@ def delete_record_impl(sf_client: OrgHandler, arguments: dict[str, str]):
         return [types.TextContent(type="text", text=message)]
     except SalesforceError as e:
         # Handle common delete errors (e.g., protected record)
-        return [types.TextContent(type="text", text=f"Delete Record Error: {e.status} {e.resource_name} {e.content}")]
+        return [types.TextContent(type="text", text=f"Delete Record Error: {e.status} {e.resource_name} {e.content}{sf_client.object_name_hint(object_name)}")]
     except AttributeError:
-         return [types.TextContent(type="text", text=f"Error: Object type '{object_name}' not found or accessible via API.")]
+         return [types.TextContent(type="text", text=f"Error: Object type '{object_name}' not found or accessible via API.{sf_client.object_name_hint(object_name)}")]
+    except Exception as e:
+        return [types.TextContent(type="text", text=f"Error deleting {object_name} record {record_id}: {e}{sf_client.object_name_hint(object_name)}")]
+
+def _collection_result_text(action: str, object_name: str, results: list[dict[str, Any]]) -> str:
+    succeeded = sum(1 for result in results if result.get("success"))
+    # Keep the input position so failures can be matched back to the submitted records
+    indexed = [{"index": index, **result} for index, result in enumerate(results)]
+    target = f"{object_name} records" if object_name else "records"
+    return (f"{action} {target}: {succeeded} succeeded, {len(results) - succeeded} failed.\n"
+            f"Results (JSON):\n{json.dumps(indexed, indent=2)}")
+
+def _collection_records(arguments: dict[str, Any], key: str) -> list[Any]:
+    items = arguments.get(key)
+    if not isinstance(items, list) or not items:
+        raise ValueError(f"'{key}' argument must be a non-empty list.")
+    return items
+
+def create_records_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
+    """Creates many records of one object through sObject Collections (200 per request)."""
+    object_name = arguments.get("object_name")
+    if not object_name:
+        raise ValueError("Missing 'object_name' argument")
+    records = _collection_records(arguments, "records")
+    if not all(isinstance(record, dict) for record in records):
+        raise ValueError("Every item of 'records' must be a dictionary/object.")
+    if not sf_client.connection:
+        raise ValueError("Salesforce connection not established.")
+    try:
+        results = sfcollections.create_records(sf_client.connection, object_name, records,
+                                               bool(arguments.get("all_or_none", False)))
+        return [types.TextContent(type="text", text=_collection_result_text("Create", object_name, results))]
+    except SalesforceError as e:
+        return [types.TextContent(type="text", text=f"Create Records Error: {e.status} {e.resource_name} {e.content}")]
     except Exception as e:
-        return [types.TextContent(type="text", text=f"Error deleting {object_name} record {record_id}: {e}")]
+        return [types.TextContent(type="text", text=f"Error creating {object_name} records: {e}")]
+
+def update_records_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
+    """Updates many records of one object through sObject Collections (200 per request)."""
+    object_name = arguments.get("object_name")
+    if not object_name:
+        raise ValueError("Missing 'object_name' argument")
+    records = _collection_records(arguments, "records")
+    if not all(isinstance(record, dict) for record in records):
+        raise ValueError("Every item of 'records' must be a dictionary/object.")
+    if not sf_client.connection:
+        raise ValueError("Salesforce connection not established.")
+    try:
+        results = sfcollections.update_records(sf_client.connection, object_name, records,
+                                               bool(arguments.get("all_or_none", False)))
+        return [types.TextContent(type="text", text=_collection_result_text("Update", object_name, results))]
+    except SalesforceError as e:
+        return [types.TextContent(type="text", text=f"Update Records Error: {e.status} {e.resource_name} {e.content}")]
+    except Exception as e:
+        return [types.TextContent(type="text", text=f"Error updating {object_name} records: {e}")]
+
+def delete_records_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
+    """Deletes many records by Id through sObject Collections (200 per request)."""
+    record_ids = _collection_records(arguments, "record_ids")
+    object_name = arguments.get("object_name", "")
+    if not sf_client.connection:
+        raise ValueError("Salesforce connection not established.")
+    try:
+        results = sfcollections.delete_records(sf_client.connection, record_ids,
+                                               bool(arguments.get("all_or_none", False)))
+        return [types.TextContent(type="text", text=_collection_result_text("Delete", object_name, results))]
+    except SalesforceError as e:
+        return [types.TextContent(type="text", text=f"Delete Records Error: {e.status} {e.resource_name} {e.content}")]
+    except Exception as e:
+        return [types.TextContent(type="text", text=f"Error deleting records: {e}")]
+
+def bulk_ingest_file_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
+    """Loads a local CSV/NDJSON file into Salesforce through Bulk API 2.0 ingest jobs."""
+    object_name = arguments.get("object_name")
+    operation = arguments.get("operation")
+    file_path = arguments.get("file_path")
+    if not object_name or not operation or not file_path:
+        raise ValueError("Missing 'object_name', 'operation' or 'file_path' argument")
+    if not sf_client.connection:
+        raise ValueError("Salesforce connection not established.")
+    try:
+        jobs = sfbulk.ingest_file(
+            sf_client.connection,
+            object_name,
+            operation,
+            file_path,
+            file_format=arguments.get("file_format"),
+            external_id_field=arguments.get("external_id_field"),
+            results_dir=arguments.get("results_dir"),
+            timeout=sfquery.BULK_TIMEOUT,
+        )
+        uploaded = sum(job["recordsUploaded"] for job in jobs)
+        failed = sum(job.get("recordsFailed", 0) for job in jobs)
+        return [
+            types.TextContent(
+                type="text",
+                text=(f"Bulk {operation} of {uploaded} {object_name} records from {file_path} "
+                      f"in {len(jobs)} job(s), {failed} failed.\nJobs (JSON):\n{json.dumps(jobs, indent=2)}")
+            )
+        ]
+    except SalesforceError as e:
+        return [types.TextContent(type="text", text=f"Bulk Ingest Error: {e.status} {e.resource_name} {e.content}")]
+    except Exception as e:
+        return [types.TextContent(type="text", text=f"Error loading {file_path} into {object_name}: {e}")]
 
 def describe_object_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
     """
@@ -458,68 +706,70 @@ def describe_object_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
         arguments: dict with keys:
             - object_name (str): API name of the object (e.g., 'Account')
             - include_field_details (bool, optional): Whether to include detailed field info (default True)
+            - sections (list, optional): Sections to render among summary, fields, relationships and picklists (default all)
+            - field_pattern (str, optional): Only fields whose API name or label matches this glob (e.g. 'Billing*')
+            - field_offset (int, optional): Index of the first matching field to render (default 0)
+            - field_limit (int, optional): Matching fields rendered per call (default SFMCP_DESCRIBE_FIELD_LIMIT, 0 for all)
     Returns:
         List with a single types.TextContent containing the markdown schema description or error message.
     """
     object_name = arguments.get("object_name")
-    include_field_details = arguments.get("include_field_details", True)
     if not object_name:
         return [types.TextContent(type="text", text="Missing 'object_name' argument")]  
     if not sf_client.connection:
         return [types.TextContent(type="text", text="Salesforce connection not established.")]
+    sections = arguments.get("sections") or list(sfdescribe.SECTIONS)
+    if not arguments.get("include_field_details", True):
+        sections = ["summary"]
+    field_limit = arguments.get("field_limit")
     try:
-        sf_object = getattr(sf_client.connection, object_name)
-        describe = sf_object.describe()
-        # Basic object info
-        result = f"## {describe['label']} ({describe['name']})\n\n"
-        result += f"**Type:** {'Custom Object' if describe.get('custom') else 'Standard Object'}\n"
-        result += f"**API Name:** {describe['name']}\n"
-        result += f"**Label:** {describe['label']}\n"
-        result += f"**Plural Label:** {describe.get('labelPlural', '')}\n"
-        result += f"**Key Prefix:** {describe.get('keyPrefix', 'N/A')}\n"
-        result += f"**Createable:** {describe.get('createable')}\n"
-        result += f"**Updateable:** {describe.get('updateable')}\n"
-        result += f"**Deletable:** {describe.get('deletable')}\n\n"
-        if include_field_details:
-            # Fields table
-            result += "## Fields\n\n"
-            result += "| API Name | Label | Type | Required | Unique | External ID |\n"
-            result += "|----------|-------|------|----------|--------|------------|\n"
-            for field in describe["fields"]:
-                required = "Yes" if not field.get("nillable", True) else "No"
-                unique = "Yes" if field.get("unique", False) else "No"
-                external_id = "Yes" if field.get("externalId", False) else "No"
-                result += f"| {field['name']} | {field['label']} | {field['type']} | {required} | {unique} | {external_id} |\n"
-            # Relationship fields
-            reference_fields = [
-                f for f in describe["fields"] if f["type"] == "reference" and f.get("referenceTo")
-            ]
-            if reference_fields:
-                result += "\n## Relationship Fields\n\n"
-                result += "| API Name | Related To | Relationship Name |\n"
-                result += "|----------|-----------|-------------------|\n"
-                for field in reference_fields:
-                    related_to = ", ".join(field["referenceTo"])
-                    rel_name = field.get("relationshipName", "N/A")
-                    result += f"| {field['name']} | {related_to} | {rel_name} |\n"
-            # Picklist fields
-            picklist_fields = [
-                f for f in describe["fields"]
-                if f["type"] in ("picklist", "multipicklist") and f.get("picklistValues")
-            ]
-            if picklist_fields:
-                result += "\n## Picklist Fields\n\n"
-                for field in picklist_fields:
-                    result += f"### {field['label']} ({field['name']})\n\n"
-                    result += "| Value | Label | Default |\n"
-                    result += "|-------|-------|--------|\n"
-                    for value in field["picklistValues"]:
-                        is_default = "Yes" if value.get("defaultValue", False) else "No"
-                        result += f"| {value['value']} | {value['label']} | {is_default} |\n"
-                    result += "\n"
+        object_name = sf_client.resolve_object_name(object_name)
+        result = sf_client.describe_markdown(
+            object_name,
+            sections=sections,
+            field_pattern=arguments.get("field_pattern"),
+            field_offset=max(int(arguments.get("field_offset") or 0), 0),
+            field_limit=int(field_limit) if field_limit is not None else None,
+        )
         return [types.TextContent(type="text", text=result)]
     except Exception as e:
-        return [types.TextContent(type="text", text=f"Error describing object {object_name}: {str(e)}")]
+        return [types.TextContent(type="text", text=f"Error describing object {object_name}: {str(e)}{sf_client.object_name_hint(object_name)}")]
+
+def get_api_usage_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
+    """Reports the org's remaining daily API calls and the requests sent by each tool."""
+    refresh = bool(arguments.get("refresh"))
+    if refresh and not sf_client.connection:
+        raise ValueError("Salesforce connection is not active. Cannot read the org limits.")
+    try:
+        usage = sf_client.api_usage(refresh=refresh)
+    except SalesforceError as e:
+        return [types.TextContent(type="text", text=f"Error reading the org limits: {e}")]
+    org = usage["org"]
+    if org["remaining"] is None:
+        summary = "The org's API usage is not known yet (no Salesforce response seen; use refresh to read it)."
+    else:
+        summary = f"Org API usage: {org['used']} of {org['max']} daily calls used, {org['remaining']} remaining."
+    return [types.TextContent(type="text", text=f"{summary}\n\n{json.dumps(usage, indent=2)}")]
+
+def resolve_objects_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
+    """Resolves record ids and object names to their sObjects from the cached describeGlobal index."""
+    values = arguments.get("values")
+    if not values or not isinstance(values, list):
+        raise ValueError("Missing 'values' argument (a list of record ids or object names)")
+    if not sf_client.connection:
+        raise ValueError("Salesforce connection not established.")
+    limit = int(arguments.get("max_suggestions") or 3)
+    try:
+        index = sf_client.object_index()
+    except SalesforceError as e:
+        return [types.TextContent(type="text", text=f"Error reading the org's object list: {e}")]
+    resolutions = [index.resolve(str(value), limit).to_dict() for value in values]
+    resolved = sum(1 for resolution in resolutions if resolution["match"])
+    return [types.TextContent(
+        type="text",
+        text=f"Resolved {resolved} of {len(resolutions)} values ({len(index)} objects indexed):\n"
+             f"{json.dumps(resolutions, indent=2)}"
+    )]
 
 def define_tabs_on_app_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
     """
@@ -0,0 +1,244 @@
+import base64
+import os
+import time
+import xml.etree.ElementTree as ET
+from typing import Any, Iterator, Optional
+from xml.sax.saxutils import escape
+
+from salesforcemcp.env import env_float
+from salesforcemcp.progress import report_progress
+
+METADATA_API_VERSION = "58.0"
+
+MET = "{http://soap.sforce.com/2006/04/metadata}"
+SOAP_ENV = "{http://schemas.xmlsoap.org/soap/envelope/}"
+
+DEPLOY_DONE_STATUSES = ("Succeeded", "SucceededPartial", "Failed", "Canceled")
+DEPLOY_TIMEOUT = env_float("SFMCP_DEPLOY_TIMEOUT", 600.0, minimum=1)
+
+# Raw zip bytes encoded per chunk; a multiple of 3 so the base64 chunks concatenate cleanly
+ENCODE_CHUNK_BYTES = 3 * 64 * 1024
+
+# Deploy request/response logging is off unless SFMCP_DEPLOY_LOG is set to a file path
+DEPLOY_LOG = os.getenv("SFMCP_DEPLOY_LOG")
+DEPLOY_LOG_PREVIEW = 2000
+
+DEFAULT_DEPLOY_OPTIONS = {
+    "allowMissingFiles": False,
+    "autoUpdatePackage": False,
+    "checkOnly": False,
+    "ignoreWarnings": False,
+    "performRetrieve": False,
+    "purgeOnDelete": False,
+    "rollbackOnError": True,
+    "singlePackage": True,
+}
+
+SOAP_HEADERS = {
+    "Content-Type": "text/xml; charset=utf-8",
+    "SOAPAction": '""',
+}
+
+def metadata_endpoint(instance: str, api_version: str = METADATA_API_VERSION) -> str:
+    return f"https://{instance}/services/Soap/m/{api_version}"
+
+class DeployEnvelope:
+    """The SOAP deploy() request body, streamed instead of formatted into one string.
+
+    The zip is base64-encoded chunk by chunk while requests sends the body, so the
+    only full-size copy in memory is the zip itself. __len__ gives requests the exact
+    Content-Length (no chunked transfer encoding), and every iteration starts over,
+    so the body can be resent if the connection has to be retried.
+    """
+
+    def __init__(self, session_id: str, zip_bytes: bytes, options: Optional[dict[str, bool]] = None):
+        self.session_id = session_id
+        self.zip_bytes = zip_bytes
+        self.options = options
+        deploy_options = {**DEFAULT_DEPLOY_OPTIONS, **(options or {})}
+        options_xml = "".join(
+            f"<met:{name}>{str(value).lower()}</met:{name}>" for name, value in deploy_options.items()
+        )
+        self.head = (
+            '<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" '
+            'xmlns:met="http://soap.sforce.com/2006/04/metadata">'
+            f"<soapenv:Header><met:SessionHeader><met:sessionId>{escape(session_id)}</met:sessionId>"
+            "</met:SessionHeader></soapenv:Header>"
+            "<soapenv:Body><met:deploy><met:ZipFile>"
+        ).encode("utf-8")
+        self.tail = (
+            f"</met:ZipFile><met:DeployOptions>{options_xml}</met:DeployOptions>"
+            "</met:deploy></soapenv:Body></soapenv:Envelope>"
+        ).encode("utf-8")
+
+    def with_session_id(self, session_id: str) -> "DeployEnvelope":
+        """The same request for another session (used to replay it after a re-login)."""
+        return DeployEnvelope(session_id, self.zip_bytes, self.options)
+
+    def __len__(self) -> int:
+        return len(self.head) + 4 * ((len(self.zip_bytes) + 2) // 3) + len(self.tail)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.head
+        view = memoryview(self.zip_bytes)
+        for start in range(0, len(view), ENCODE_CHUNK_BYTES):
+            yield base64.b64encode(view[start:start + ENCODE_CHUNK_BYTES])
+        yield self.tail
+
+    def preview(self, limit: int = DEPLOY_LOG_PREVIEW) -> str:
+        """A truncated, loggable view of the body with the session id redacted."""
+        head = self.head.decode("utf-8")
+        start, end = head.find("<met:sessionId>"), head.find("</met:sessionId>")
+        if start != -1 and end != -1:
+            head = head[:start + len("<met:sessionId>")] + "***" + head[end:]
+        zip_preview = base64.b64encode(self.zip_bytes[:max(0, limit) // 4 * 3]).decode("ascii")
+        return f"{head}{zip_preview}...[{len(self)} bytes]...{self.tail.decode('utf-8')}"
+
+def log_deploy(envelope: DeployEnvelope, status_code: int, response_text: str):
+    """Appends a truncated record of a deploy call to SFMCP_DEPLOY_LOG, when it is set."""
+    if not DEPLOY_LOG:
+        return
+    with open(DEPLOY_LOG, "a", encoding="utf-8") as f:
+        f.write(f"--- deploy request ---\n{envelope.preview()}\n")
+        f.write(f"--- deploy response ({status_code}) ---\n{response_text[:DEPLOY_LOG_PREVIEW]}\n")
+
+def soap_fault_message(status_code: int, text: str) -> str:
+    """Describes a failed SOAP call, using the soapenv:Fault when the body has one."""
+    fault_message = f"HTTP Error {status_code}."
+    try:
+        fault = ET.fromstring(text).find(f".//{SOAP_ENV}Fault")
+        if fault is not None:
+            faultcode = fault.findtext("{*}faultcode")
+            faultstring = fault.findtext("{*}faultstring")
+            fault_message = f"SOAP Fault: Code='{faultcode}', Message='{faultstring}' (HTTP Status: {status_code})"
+    except ET.ParseError:
+        fault_message += f" Response Text: {text[:500]}..."
+    return fault_message
+
+def parse_deploy_id(text: str) -> Optional[str]:
+    """Returns the AsyncResult id from a deploy() response."""
+    try:
+        return ET.fromstring(text).findtext(f".//{MET}deployResponse/{MET}result/{MET}id")
+    except ET.ParseError:
+        return None
+
+def _text(element: ET.Element, name: str) -> Optional[str]:
+    return element.findtext(f"{MET}{name}")
+
+def _int(element: ET.Element, name: str) -> int:
+    value = _text(element, name)
+    return int(value) if value else 0
+
+def _bool(element: ET.Element, name: str) -> bool:
+    return _text(element, name) == "true"
+
+def parse_deploy_result(result: ET.Element) -> dict[str, Any]:
+    """Turns a DeployResult element into a dict with its counters and failures."""
+    status = {
+        "id": _text(result, "id"),
+        "status": _text(result, "status"),
+        "done": _bool(result, "done"),
+        "success": _bool(result, "success"),
+        "stateDetail": _text(result, "stateDetail"),
+        "numberComponentsTotal": _int(result, "numberComponentsTotal"),
+        "numberComponentsDeployed": _int(result, "numberComponentsDeployed"),
+        "numberComponentErrors": _int(result, "numberComponentErrors"),
+        "numberTestsTotal": _int(result, "numberTestsTotal"),
+        "numberTestsCompleted": _int(result, "numberTestsCompleted"),
+        "numberTestErrors": _int(result, "numberTestErrors"),
+        "createdDate": _text(result, "createdDate"),
+        "completedDate": _text(result, "completedDate"),
+    }
+    if _text(result, "errorMessage"):
+        status["errorMessage"] = _text(result, "errorMessage")
+        status["errorStatusCode"] = _text(result, "errorStatusCode")
+
+    details = result.find(f"{MET}details")
+    if details is not None:
+        status["componentFailures"] = [
+            {
+                "componentType": _text(failure, "componentType"),
+                "fullName": _text(failure, "fullName"),
+                "fileName": _text(failure, "fileName"),
+                "problemType": _text(failure, "problemType"),
+                "problem": _text(failure, "problem"),
+                "lineNumber": _int(failure, "lineNumber") or None,
+                "columnNumber": _int(failure, "columnNumber") or None,
+            }
+            for failure in details.findall(f"{MET}componentFailures")
+        ]
+        status["testFailures"] = [
+            {
+                "name": _text(failure, "name"),
+                "methodName": _text(failure, "methodName"),
+                "message": _text(failure, "message"),
+                "stackTrace": _text(failure, "stackTrace"),
+            }
+            for failure in details.findall(f"{MET}runTestResult/{MET}failures")
+        ]
+    return status
+
+def check_deploy_status(sf, deploy_id: str, include_details: bool = True) -> dict[str, Any]:
+    """Calls checkDeployStatus for a deploy id and returns the parsed DeployResult.
+
+    Raises:
+        ValueError: If the call fails or the response carries no result.
+    """
+    body = (
+        '<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" '
+        'xmlns:met="http://soap.sforce.com/2006/04/metadata">'
+        f"<soapenv:Header><met:SessionHeader><met:sessionId>{escape(sf.session_id)}</met:sessionId>"
+        "</met:SessionHeader></soapenv:Header>"
+        f"<soapenv:Body><met:checkDeployStatus><met:asyncProcessId>{escape(deploy_id)}</met:asyncProcessId>"
+        f"<met:includeDetails>{str(include_details).lower()}</met:includeDetails>"
+        "</met:checkDeployStatus></soapenv:Body></soapenv:Envelope>"
+    )
+    response = sf.session.post(metadata_endpoint(sf.sf_instance), data=body.encode("utf-8"), headers=SOAP_HEADERS)
+    if response.status_code >= 400:
+        raise ValueError(f"checkDeployStatus failed: {soap_fault_message(response.status_code, response.text)}")
+    result = ET.fromstring(response.content).find(f".//{MET}checkDeployStatusResponse/{MET}result")
+    if result is None:
+        raise ValueError(f"checkDeployStatus returned no result for deploy {deploy_id}.")
+    return parse_deploy_result(result)
+
+def wait_for_deploy(sf, deploy_id: str, timeout: Optional[float] = None,
+                    poll_interval: float = 1.0, max_interval: float = 15.0) -> dict[str, Any]:
+    """Polls checkDeployStatus with exponential backoff until the deploy is done.
+
+    Component counts are sent as progress notifications while it runs. When the
+    timeout is reached the last (unfinished) status is returned.
+    """
+    deadline = time.monotonic() + (timeout or DEPLOY_TIMEOUT)
+    interval = poll_interval
+    while True:
+        # Details are only needed once, for the final result
+        status = check_deploy_status(sf, deploy_id, include_details=False)
+        if status["done"] or status["status"] in DEPLOY_DONE_STATUSES:
+            return check_deploy_status(sf, deploy_id)
+        processed = (status["numberComponentsDeployed"] + status["numberComponentErrors"]
+                     + status["numberTestsCompleted"] + status["numberTestErrors"])
+        total = status["numberComponentsTotal"] + status["numberTestsTotal"]
+        message = f"Deploy {deploy_id} {status['status']}"
+        if status["stateDetail"]:
+            message += f": {status['stateDetail']}"
+        report_progress(processed, total or None, message)
+        if time.monotonic() + interval > deadline:
+            return status
+        time.sleep(interval)
+        interval = min(interval * 2, max_interval)
+
+def summarize_deploy(status: dict[str, Any]) -> str:
+    """One-line outcome of a deploy, followed by one line per component or test failure."""
+    lines = [
+        f"Deploy {status['id']}: {status['status']} "
+        f"({status['numberComponentsDeployed']}/{status['numberComponentsTotal']} components deployed, "
+        f"{status['numberComponentErrors']} errors)"
+    ]
+    if status.get("errorMessage"):
+        lines.append(f"Error: {status['errorMessage']}")
+    for failure in status.get("componentFailures", []):
+        location = f" (line {failure['lineNumber']})" if failure.get("lineNumber") else ""
+        lines.append(f"- {failure['componentType']} {failure['fullName']}: {failure['problem']}{location}")
+    for failure in status.get("testFailures", []):
+        lines.append(f"- Test {failure['name']}.{failure['methodName']}: {failure['message']}")
+    return "\n".join(lines)
@@ -0,0 +1,228 @@
+import io
+from typing import Any, Callable, Iterable, Mapping, Optional, TextIO, Union
+from xml.sax.saxutils import escape
+
+MD_NS = "http://soap.sforce.com/2006/04/metadata"
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+INDENT = "    "
+
+PACKAGE_API_VERSION = "63.0"
+
+# Properties every custom object created by the server gets
+CUSTOM_OBJECT_DEFAULTS = {
+    "allowInChatterGroups": False,
+    "compactLayoutAssignment": "SYSTEM",
+    "deploymentStatus": "Deployed",
+    "enableActivities": True,
+    "enableBulkApi": True,
+    "enableFeeds": False,
+    "enableHistory": True,
+    "enableLicensing": False,
+    "enableReports": True,
+    "enableSearch": True,
+    "enableSharing": True,
+    "enableStreamingApi": True,
+    "externalSharingModel": "Private",
+}
+
+def _text(value: Any) -> str:
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    text = value if type(value) is str else str(value)
+    # Most values (API names, labels, flags) need no escaping; skip the three replace passes
+    if "&" in text or "<" in text or ">" in text:
+        return escape(text)
+    return text
+
+class Fragment:
+    """Constant elements rendered once per indentation depth, then copied as text.
+
+    The parts of metadata files that are the same in every package (object defaults,
+    common field types) are compiled once per process, so building a file only formats
+    its variable values. A Fragment can be used as a dict value under any key (the key
+    is not written) or as the type properties of custom_field().
+    """
+
+    def __init__(self, content: Mapping[str, Any]):
+        self.content = dict(content)
+        self._texts: dict[int, str] = {}
+
+    def text(self, depth: int) -> str:
+        text = self._texts.get(depth)
+        if text is None:
+            parts: list[str] = []
+            for tag, value in self.content.items():
+                _write_element(parts.append, tag, value, depth)
+            text = self._texts[depth] = "".join(parts)
+        return text
+
+def _write_element(append: Callable[[str], Any], tag: str, value: Any, depth: int):
+    """Writes one element for value.
+
+    A dict becomes nested child elements (in its order), a list or tuple repeats the
+    element once per item, a Fragment is copied as is, None writes nothing and
+    anything else is escaped text.
+    """
+    if value is None:
+        return
+    value_type = type(value)
+    if value_type is Fragment:
+        append(value.text(depth))
+        return
+    if value_type is list or value_type is tuple:
+        for item in value:
+            _write_element(append, tag, item, depth)
+        return
+    pad = INDENT * depth
+    if value_type is not dict:
+        append(f"{pad}<{tag}>{_text(value)}</{tag}>\n")
+        return
+    if not value:
+        append(f"{pad}<{tag}/>\n")
+        return
+    append(f"{pad}<{tag}>\n")
+    child_pad = pad + INDENT
+    for child_tag, child_value in value.items():
+        # Scalar children (the bulk of every file) are written inline, without another call
+        child_type = type(child_value)
+        if child_type is str:
+            if "&" in child_value or "<" in child_value or ">" in child_value:
+                child_value = escape(child_value)
+            append(f"{child_pad}<{child_tag}>{child_value}</{child_tag}>\n")
+        elif child_type is bool:
+            append(f"{child_pad}<{child_tag}>{'true' if child_value else 'false'}</{child_tag}>\n")
+        elif child_type is Fragment:
+            append(child_value.text(depth + 1))
+        elif child_type is dict or child_type is list or child_type is tuple or child_value is None:
+            _write_element(append, child_tag, child_value, depth + 1)
+        else:
+            append(f"{child_pad}<{child_tag}>{_text(child_value)}</{child_tag}>\n")
+    append(f"{pad}</{tag}>\n")
+
+def write_metadata(out: TextIO, root: str, content: dict[str, Any]):
+    """Writes a complete metadata file (declaration, namespaced root, content) to out."""
+    out.write(XML_DECLARATION)
+    out.write(f'<{root} xmlns="{MD_NS}">\n')
+    for tag, value in content.items():
+        _write_element(out.write, tag, value, 1)
+    out.write(f"</{root}>\n")
+
+def metadata_xml(root: str, content: dict[str, Any]) -> str:
+    """Returns a metadata file as a string; see write_metadata()."""
+    out = io.StringIO()
+    write_metadata(out, root, content)
+    return out.getvalue()
+
+_OBJECT_DEFAULTS = Fragment(CUSTOM_OBJECT_DEFAULTS)
+_FIELD_FLAGS = Fragment({"required": False, "trackTrending": False})
+
+# Type properties of the fixed-size field types the package builders create
+TEXT_FIELD = Fragment({"type": "Text", "length": 100})
+NUMBER_FIELD = Fragment({"precision": 18, "scale": 0, "type": "Number"})
+URL_FIELD = Fragment({"type": "Url"})
+DATE_FIELD = Fragment({"type": "Date"})
+
+def package_manifest(types: Mapping[str, Iterable[str]], version: Optional[str] = PACKAGE_API_VERSION) -> str:
+    """A package.xml (or destructiveChanges.xml) listing {metadata type: member names}."""
+    return metadata_xml("Package", {
+        "types": [{"members": list(members), "name": name} for name, members in types.items()],
+        "version": version,
+    })
+
+def custom_field(api_name: str, label: str, type_properties: Union[Mapping[str, Any], Fragment]) -> dict[str, Any]:
+    """The <fields> entry of a custom field; type_properties holds <type> and its settings
+    (a Fragment such as NUMBER_FIELD for the common constant types)."""
+    field = {"fullName": api_name, "externalId": False, "label": label, "flags": _FIELD_FLAGS}
+    if type(type_properties) is Fragment:
+        field["type"] = type_properties
+    else:
+        field.update(type_properties)
+    field["unique"] = False
+    return field
+
+def custom_object(label: str, plural_label: str, description: Optional[str], fields: Iterable[Mapping[str, Any]]) -> str:
+    """A .object file for a custom object with an auto-number name field."""
+    return metadata_xml("CustomObject", {
+        "description": description or "",
+        "defaults": _OBJECT_DEFAULTS,
+        "label": label,
+        "nameField": {
+            "displayFormat": f"{label}-{{000000}}",
+            "label": f"{label} Name",
+            "trackHistory": False,
+            "type": "AutoNumber",
+        },
+        "pluralLabel": plural_label,
+        "searchLayouts": {},
+        "sharingModel": "ReadWrite",
+        "visibility": "Public",
+        "fields": list(fields),
+    })
+
+def custom_metadata_type(label: str, plural_label: str, description: Optional[str], fields: Iterable[Mapping[str, Any]]) -> str:
+    """A .object file for a custom metadata type (__mdt)."""
+    return metadata_xml("CustomObject", {
+        "description": description or "",
+        "label": label,
+        "pluralLabel": plural_label,
+        "visibility": "Public",
+        "fields": list(fields),
+    })
+
+def profile(name: str = "Admin", field_permissions: Iterable[str] = (), tab_visibilities: Iterable[str] = (),
+            application_visibilities: Iterable[str] = ()) -> str:
+    """A profile granting edit access to fields, DefaultOn tabs and visible default apps.
+
+    Entries follow fullName in the alphabetical order the Metadata API expects.
+    """
+    return metadata_xml("Profile", {
+        "fullName": name,
+        "applicationVisibilities": [
+            {"application": application, "default": True, "visible": True} for application in application_visibilities
+        ],
+        "fieldPermissions": [
+            {"editable": True, "field": field, "readable": True} for field in field_permissions
+        ],
+        "tabVisibilities": [
+            {"tab": tab, "visibility": "DefaultOn"} for tab in tab_visibilities
+        ],
+    })
+
+def custom_tab(label: str, motif: str, type_properties: Mapping[str, Any], description: Optional[str] = None) -> str:
+    """A .tab-meta.xml file; type_properties is customObject, page or url/urlEncodingKey."""
+    return metadata_xml("CustomTab", {
+        "label": label,
+        "motif": motif,
+        **type_properties,
+        "description": description or None,
+    })
+
+def custom_application(label: str, description: str, tabs: Iterable[str], nav_type: str = "Standard",
+                       form_factors: Iterable[str] = ("Small", "Large"), setup_experience: str = "all",
+                       header_color: Optional[str] = None) -> str:
+    """A Lightning .app-meta.xml file."""
+    brand = {"headerColor": header_color, "shouldOverrideOrgTheme": True} if header_color else None
+    return metadata_xml("CustomApplication", {
+        "brand": brand,
+        "description": description,
+        "formFactors": list(form_factors),
+        "isNavAutoTempTabsDisabled": False,
+        "isNavPersonalizationDisabled": False,
+        "label": label,
+        "navType": nav_type,
+        "tabs": list(tabs),
+        "setupExperience": setup_experience,
+        "uiType": "Lightning",
+    })
+
+def flexipage(label: str, description: Optional[str] = None) -> str:
+    """A .flexipage file for a Lightning App Page with an empty main region."""
+    return metadata_xml("FlexiPage", {
+        "description": description or None,
+        "flexiPageRegions": {"name": "main", "type": "Region"},
+        "masterLabel": label,
+        "template": {"name": "flexipage:defaultAppHomeTemplate"},
+        "type": "AppPage",
+    })
@@ -0,0 +1,240 @@
+import contextlib
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Iterator, Optional
+
+from salesforcemcp.api_limits import NO_TOOL
+
+# Upper bounds of the histogram buckets, Prometheus style (cumulative, plus +Inf)
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+ROUND_TRIP_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Most recent observations kept per series to compute the quantiles
+QUANTILE_WINDOW = 1024
+
+DEFAULT_METRICS_INTERVAL = 15.0
+
+def parse_interval(value: Optional[str]) -> float:
+    """Parses SFMCP_METRICS_INTERVAL; an invalid or non-positive value falls back to the default."""
+    if not value:
+        return DEFAULT_METRICS_INTERVAL
+    try:
+        interval = float(value)
+    except ValueError:
+        interval = 0
+    if interval <= 0:
+        print(f"Ignoring invalid SFMCP_METRICS_INTERVAL '{value}'", file=sys.stderr)
+        return DEFAULT_METRICS_INTERVAL
+    return interval
+
+# Prometheus text file rewritten every SFMCP_METRICS_INTERVAL seconds (unset: not written)
+METRICS_FILE = os.getenv("SFMCP_METRICS_FILE")
+METRICS_INTERVAL = parse_interval(os.getenv("SFMCP_METRICS_INTERVAL"))
+
+class Histogram:
+    """Cumulative bucket counts plus a window of recent values for p50/p95/p99."""
+
+    def __init__(self, bounds: tuple):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._recent: deque = deque(maxlen=QUANTILE_WINDOW)
+
+    def observe(self, value: float):
+        index = 0
+        for bound in self.bounds:
+            if value <= bound:
+                break
+            index += 1
+        self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+        self._recent.append(value)
+
+    def quantiles(self) -> dict[float, float]:
+        recent = sorted(self._recent)
+        if not recent:
+            return {}
+        return {q: recent[min(int(q * len(recent)), len(recent) - 1)] for q in QUANTILES}
+
+class CallStats:
+    """Salesforce round trips and bytes of one tool call, shared with the threads it uses."""
+
+    def __init__(self, tool: str):
+        self.tool = tool
+        self.round_trips = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self._lock = threading.Lock()
+
+    def add(self, sent: int, received: int):
+        with self._lock:
+            self.round_trips += 1
+            self.bytes_sent += sent
+            self.bytes_received += received
+
+# Set by tool_call() for the duration of a tool call; worker threads see it through the copied context
+_current_call: contextvars.ContextVar[Optional[CallStats]] = contextvars.ContextVar("sfmcp_call_stats", default=None)
+
+def _payload_size(value: Any) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, list):
+        # Tool results are lists of TextContent
+        return sum(len(getattr(item, "text", "") or "") for item in value)
+    return len(json.dumps(value, default=str))
+
+class ToolMetrics:
+    """Process-wide latency, round-trip and payload metrics, per tool.
+
+    handle_call_tool wraps every call in tool_call(), and the pooled HTTP session
+    reports each Salesforce request with record_request(). The metrics are exported
+    in the Prometheus text format (prometheus()) or as a JSON summary (summary()).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started = time.time()
+        self._calls: dict[tuple[str, str], int] = {}
+        self._latency: dict[str, Histogram] = {}
+        self._round_trips: dict[str, Histogram] = {}
+        self._payload: dict[tuple[str, str], int] = {}
+        self._requests: dict[str, int] = {}
+        self._request_latency: dict[str, Histogram] = {}
+        self._transfer: dict[tuple[str, str], int] = {}
+
+    @contextlib.contextmanager
+    def tool_call(self, tool: str, arguments: Any = None) -> Iterator[dict[str, Any]]:
+        """Measures one tool call; the caller stores the tool's result under "result"."""
+        stats = CallStats(tool)
+        token = _current_call.set(stats)
+        call: dict[str, Any] = {"result": None}
+        outcome = "error"
+        start = time.perf_counter()
+        try:
+            yield call
+            outcome = "ok"
+        finally:
+            elapsed = time.perf_counter() - start
+            _current_call.reset(token)
+            request_size = _payload_size(arguments)
+            response_size = _payload_size(call["result"])
+            with self._lock:
+                self._calls[(tool, outcome)] = self._calls.get((tool, outcome), 0) + 1
+                self._histogram(self._latency, tool, LATENCY_BUCKETS).observe(elapsed)
+                self._histogram(self._round_trips, tool, ROUND_TRIP_BUCKETS).observe(stats.round_trips)
+                self._payload[(tool, "request")] = self._payload.get((tool, "request"), 0) + request_size
+                self._payload[(tool, "response")] = self._payload.get((tool, "response"), 0) + response_size
+
+    def record_request(self, seconds: float, sent: int, received: int):
+        """Records one Salesforce HTTP round trip against the current tool call."""
+        stats = _current_call.get()
+        tool = stats.tool if stats else NO_TOOL
+        if stats:
+            stats.add(sent, received)
+        with self._lock:
+            self._requests[tool] = self._requests.get(tool, 0) + 1
+            self._histogram(self._request_latency, tool, LATENCY_BUCKETS).observe(seconds)
+            self._transfer[(tool, "sent")] = self._transfer.get((tool, "sent"), 0) + sent
+            self._transfer[(tool, "received")] = self._transfer.get((tool, "received"), 0) + received
+
+    @staticmethod
+    def _histogram(histograms: dict[str, Histogram], tool: str, bounds: tuple) -> Histogram:
+        histogram = histograms.get(tool)
+        if histogram is None:
+            histogram = histograms[tool] = Histogram(bounds)
+        return histogram
+
+    def summary(self) -> dict[str, Any]:
+        """Per-tool calls, latency quantiles, round trips and bytes, as a JSON-serializable dict."""
+        with self._lock:
+            tools = {}
+            for tool in sorted({tool for tool, _ in self._calls} | set(self._requests)):
+                entry: dict[str, Any] = {
+                    "calls": self._calls.get((tool, "ok"), 0) + self._calls.get((tool, "error"), 0),
+                    "errors": self._calls.get((tool, "error"), 0),
+                }
+                latency = self._latency.get(tool)
+                if latency:
+                    entry["latencySeconds"] = {f"p{int(q * 100)}": round(v, 4) for q, v in latency.quantiles().items()}
+                    entry["roundTripsPerCall"] = round(self._round_trips[tool].sum / self._round_trips[tool].count, 2)
+                entry["salesforceRequests"] = self._requests.get(tool, 0)
+                request_latency = self._request_latency.get(tool)
+                if request_latency:
+                    entry["salesforceLatencySeconds"] = {
+                        f"p{int(q * 100)}": round(v, 4) for q, v in request_latency.quantiles().items()
+                    }
+                entry["bytes"] = {
+                    "toolRequest": self._payload.get((tool, "request"), 0),
+                    "toolResponse": self._payload.get((tool, "response"), 0),
+                    "salesforceSent": self._transfer.get((tool, "sent"), 0),
+                    "salesforceReceived": self._transfer.get((tool, "received"), 0),
+                }
+                tools[tool] = entry
+            return {"sinceSecondsAgo": round(time.time() - self._started), "tools": tools}
+
+    def prometheus(self) -> str:
+        """The metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            lines += _family("sfmcp_tool_calls_total", "counter", "Tool calls by outcome.")
+            for (tool, outcome), value in sorted(self._calls.items()):
+                lines.append(f'sfmcp_tool_calls_total{{tool="{tool}",outcome="{outcome}"}} {value}')
+            lines += _histogram_lines("sfmcp_tool_latency_seconds", "Tool call latency.", self._latency)
+            lines += _quantile_lines("sfmcp_tool_latency_recent_seconds",
+                                     f"Tool call latency quantiles over the last {QUANTILE_WINDOW} calls.", self._latency)
+            lines += _histogram_lines("sfmcp_tool_round_trips", "Salesforce round trips per tool call.", self._round_trips)
+            lines += _family("sfmcp_tool_payload_bytes_total", "counter", "MCP argument and result sizes.")
+            for (tool, direction), value in sorted(self._payload.items()):
+                lines.append(f'sfmcp_tool_payload_bytes_total{{tool="{tool}",direction="{direction}"}} {value}')
+            lines += _family("sfmcp_salesforce_requests_total", "counter", "Salesforce HTTP requests.")
+            for tool, value in sorted(self._requests.items()):
+                lines.append(f'sfmcp_salesforce_requests_total{{tool="{tool}"}} {value}')
+            lines += _histogram_lines("sfmcp_salesforce_request_seconds", "Salesforce request latency.",
+                                      self._request_latency)
+            lines += _family("sfmcp_salesforce_bytes_total", "counter", "Bytes sent to and received from Salesforce.")
+            for (tool, direction), value in sorted(self._transfer.items()):
+                lines.append(f'sfmcp_salesforce_bytes_total{{tool="{tool}",direction="{direction}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def write_file(self, path: str):
+        """Writes prometheus() to path (for the node_exporter textfile collector), atomically."""
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(self.prometheus())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Could not write the metrics file: {e}", file=sys.stderr)
+
+def _family(name: str, kind: str, description: str) -> list[str]:
+    return [f"# HELP {name} {description}", f"# TYPE {name} {kind}"]
+
+def _histogram_lines(name: str, description: str, histograms: dict[str, Histogram]) -> list[str]:
+    lines = _family(name, "histogram", description)
+    for tool, histogram in sorted(histograms.items()):
+        cumulative = 0
+        for bound, count in zip(histogram.bounds + (None,), histogram.counts):
+            cumulative += count
+            le = "+Inf" if bound is None else f"{bound:g}"
+            lines.append(f'{name}_bucket{{tool="{tool}",le="{le}"}} {cumulative}')
+        lines.append(f'{name}_sum{{tool="{tool}"}} {histogram.sum:.6f}')
+        lines.append(f'{name}_count{{tool="{tool}"}} {histogram.count}')
+    return lines
+
+def _quantile_lines(name: str, description: str, histograms: dict[str, Histogram]) -> list[str]:
+    lines = _family(name, "gauge", description)
+    for tool, histogram in sorted(histograms.items()):
+        for q, value in histogram.quantiles().items():
+            lines.append(f'{name}{{tool="{tool}",quantile="{q:g}"}} {value:.6f}')
+    return lines
+
+METRICS = ToolMetrics()
@@ -0,0 +1,139 @@
+import difflib
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+# Record ids are 15 (case-sensitive) or 18 (case-insensitive) alphanumeric characters
+RECORD_ID = re.compile(r"^[a-zA-Z0-9]{15}(?:[a-zA-Z0-9]{3})?$")
+
+# Minimum difflib similarity for a name to be suggested
+FUZZY_CUTOFF = 0.6
+
+def _normalize(text: str) -> str:
+    """Lower case with spaces, underscores and other separators removed ("Line Item" -> "lineitem")."""
+    return re.sub(r"[^a-z0-9]", "", text.lower())
+
+@dataclass(frozen=True)
+class ObjectInfo:
+    """The describeGlobal entry of one sObject."""
+    name: str
+    label: str
+    label_plural: str
+    key_prefix: Optional[str]
+    custom: bool
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "label": self.label,
+            "labelPlural": self.label_plural,
+            "keyPrefix": self.key_prefix,
+            "custom": self.custom,
+        }
+
+@dataclass
+class Resolution:
+    """The object an input resolved to (if any), how it matched and the closest names otherwise."""
+    input: str
+    kind: str  # "id" or "name"
+    match: Optional[ObjectInfo] = None
+    matched_by: Optional[str] = None
+    suggestions: tuple[ObjectInfo, ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            "input": self.input,
+            "kind": self.kind,
+            "match": self.match.to_dict() if self.match else None,
+        }
+        if self.matched_by:
+            result["matchedBy"] = self.matched_by
+        if self.suggestions:
+            result["suggestions"] = [info.name for info in self.suggestions]
+        return result
+
+class ObjectIndex:
+    """In-memory lookup tables built from one describeGlobal payload.
+
+    Maps record key prefixes, API names, labels and plural labels to their sObject,
+    and suggests the closest objects for names that match nothing, so guesses and
+    bare record ids are resolved without any further API request.
+    """
+
+    def __init__(self, describe_global: dict[str, Any]):
+        self.source = describe_global
+        self.built_at = time.monotonic()
+        self.by_name: dict[str, ObjectInfo] = {}
+        self.by_prefix: dict[str, ObjectInfo] = {}
+        # (normalized label or plural label) -> objects, which may be several (e.g. a label reused by a custom object)
+        self.by_label: dict[str, list[ObjectInfo]] = {}
+        # normalized API name, label or plural label -> API names, for the fuzzy lookup
+        self._fuzzy_keys: dict[str, list[str]] = {}
+        for sobject in describe_global.get("sobjects", []):
+            info = ObjectInfo(
+                name=sobject["name"],
+                label=sobject.get("label") or sobject["name"],
+                label_plural=sobject.get("labelPlural") or "",
+                key_prefix=sobject.get("keyPrefix"),
+                custom=bool(sobject.get("custom")),
+            )
+            self.by_name[info.name.lower()] = info
+            if info.key_prefix:
+                self.by_prefix[info.key_prefix] = info
+            for label in {_normalize(info.label), _normalize(info.label_plural)} - {""}:
+                self.by_label.setdefault(label, []).append(info)
+            for key in {_normalize(info.name), _normalize(info.label), _normalize(info.label_plural)} - {""}:
+                names = self._fuzzy_keys.setdefault(key, [])
+                if info.name not in names:
+                    names.append(info.name)
+
+    def __len__(self) -> int:
+        return len(self.by_name)
+
+    def get(self, name: str) -> Optional[ObjectInfo]:
+        """The object with this API name (case-insensitive), or None."""
+        return self.by_name.get(name.lower())
+
+    def suggest(self, text: str, limit: int = 3) -> list[ObjectInfo]:
+        """The objects whose API name, label or plural label is closest to text."""
+        suggestions: list[ObjectInfo] = []
+        for key in difflib.get_close_matches(_normalize(text), self._fuzzy_keys, n=limit * 2, cutoff=FUZZY_CUTOFF):
+            for name in self._fuzzy_keys[key]:
+                info = self.by_name[name.lower()]
+                if info not in suggestions:
+                    suggestions.append(info)
+        return suggestions[:limit]
+
+    def resolve_id(self, record_id: str) -> Resolution:
+        """Finds the object of a record id from its three-character key prefix."""
+        match = self.by_prefix.get(record_id[:3]) if RECORD_ID.match(record_id) else None
+        return Resolution(record_id, "id", match, "keyPrefix" if match else None)
+
+    def resolve_name(self, text: str, limit: int = 3) -> Resolution:
+        """Finds an object by API name, then label or plural label, then the same ignoring
+        case and separators; when nothing matches, the closest names are suggested."""
+        info = self.get(text.strip())
+        if info:
+            return Resolution(text, "name", info, "apiName")
+        normalized = _normalize(text)
+        labelled = self.by_label.get(normalized, [])
+        if len(labelled) == 1:
+            return Resolution(text, "name", labelled[0], "label")
+        for candidate in (normalized, f"{normalized}c"):
+            names = self._fuzzy_keys.get(candidate, [])
+            if len(names) == 1:
+                return Resolution(text, "name", self.by_name[names[0].lower()], "normalizedName")
+        # Ambiguous labels are offered as suggestions rather than picked
+        return Resolution(text, "name", suggestions=tuple(labelled[:limit] or self.suggest(text, limit)))
+
+    def resolve(self, value: str, limit: int = 3) -> Resolution:
+        """Resolves a record id or an object name; an id-shaped value with an unknown prefix is tried as a name."""
+        value = value.strip()
+        if not RECORD_ID.match(value):
+            return self.resolve_name(value, limit)
+        resolution = self.resolve_id(value)
+        if resolution.match:
+            return resolution
+        by_name = self.resolve_name(value, limit)
+        return by_name if by_name.match else resolution
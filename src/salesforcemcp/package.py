@@ -0,0 +1,166 @@
+import io
+import os
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Optional, Union
+
+from salesforcemcp.metadata_xml import MD_NS
+
+ET.register_namespace("", MD_NS)
+
+# Files listing the components of a deploy rather than defining one
+MANIFESTS = ("package.xml", "destructiveChanges.xml", "destructiveChangesPre.xml", "destructiveChangesPost.xml")
+
+# Child elements that identify a repeated entry of a metadata file (a field, a tab visibility...)
+ENTRY_KEYS = ("fullName", "field", "tab", "application", "object", "apexClass", "apexPage", "recordType", "layout", "name")
+
+class MetadataPackage:
+    """A Metadata API deploy package assembled in memory.
+
+    Files are kept as {path inside the zip: content} and only zipped when the package
+    is deployed, so building a package never touches the filesystem.
+    """
+
+    def __init__(self, files: Optional[dict[str, Union[str, bytes]]] = None):
+        self.files: dict[str, Union[str, bytes]] = dict(files or {})
+
+    def add(self, path: str, content: Union[str, bytes]):
+        self.files[path] = content
+
+    def read(self, path: str) -> str:
+        content = self.files[path]
+        return content.decode("utf-8") if isinstance(content, bytes) else content
+
+    def remove(self, path: str):
+        self.files.pop(path, None)
+
+    def rename(self, old_path: str, new_path: str):
+        self.files[new_path] = self.files.pop(old_path)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self.files
+
+    def to_zip(self) -> bytes:
+        """Returns the package as zip bytes, with package.xml and the members at the root."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+            for path in sorted(self.files):
+                zf.writestr(path, self.files[path])
+        return buffer.getvalue()
+
+def _q(tag: str) -> str:
+    return f"{{{MD_NS}}}{tag}"
+
+def _serialize(root: ET.Element) -> str:
+    ET.indent(root, space="    ")
+    return '<?xml version="1.0" encoding="UTF-8"?>\n' + ET.tostring(root, encoding="unicode") + "\n"
+
+def merge_manifests(texts: list[str]) -> str:
+    """Merges package.xml (or destructiveChanges.xml) files: the union of members per type, highest version."""
+    members: dict[str, set[str]] = {}
+    version = None
+    for text in texts:
+        root = ET.fromstring(text)
+        for types_element in root.findall(_q("types")):
+            name = types_element.findtext(_q("name"))
+            members.setdefault(name, set()).update(
+                member.text for member in types_element.findall(_q("members")) if member.text
+            )
+        text_version = root.findtext(_q("version"))
+        if text_version and (version is None or float(text_version) > float(version)):
+            version = text_version
+
+    root = ET.Element(_q("Package"))
+    for name in sorted(members):
+        types_element = ET.SubElement(root, _q("types"))
+        for member in sorted(members[name]):
+            ET.SubElement(types_element, _q("members")).text = member
+        ET.SubElement(types_element, _q("name")).text = name
+    if version:
+        ET.SubElement(root, _q("version")).text = version
+    return _serialize(root)
+
+def _canonical(element: ET.Element) -> str:
+    return ET.canonicalize(ET.tostring(element, encoding="unicode"), strip_text=True)
+
+def _entry_key(element: ET.Element, repeated: set[str]) -> tuple:
+    for key in ENTRY_KEYS:
+        value = element.findtext(_q(key))
+        if value is not None:
+            return (element.tag, key, value)
+    if element.tag in repeated:
+        # An unkeyed list entry (e.g. the <tabs> of an app): identical copies are merged
+        return (element.tag, _canonical(element))
+    # A single-valued element such as <label> or <nameField>
+    return (element.tag,)
+
+def merge_metadata_files(texts: list[str]) -> str:
+    """Merges several versions of one metadata file (an object, a profile...).
+
+    Repeated entries are matched by their identifying child (fields by fullName, field
+    permissions by field, tab visibilities by tab...), so fragments from different
+    packages add up and a later definition of the same entry replaces the earlier one.
+    Single-valued elements (<label>, <nameField>, <sharingModel>...) are kept once.
+
+    Raises:
+        ValueError: If two files give a single-valued element different values.
+    """
+    roots = [ET.fromstring(text) for text in texts]
+    repeated = set()
+    for root in roots:
+        seen = set()
+        for child in root:
+            if child.tag in seen:
+                repeated.add(child.tag)
+            seen.add(child.tag)
+    entries: dict[tuple, ET.Element] = {}
+    for root in roots:
+        for child in root:
+            key = _entry_key(child, repeated)
+            if len(key) == 1 and key in entries and _canonical(entries[key]) != _canonical(child):
+                tag = child.tag.rpartition("}")[2]
+                raise ValueError(f"Conflicting <{tag}> values in the merged {root.tag.rpartition('}')[2]} files")
+            entries[key] = child
+
+    merged = roots[0]
+    for child in list(merged):
+        merged.remove(child)
+    # Loose text between entries (e.g. an unfilled ##placeholder##) is not valid metadata
+    merged.text = None
+    children = list(entries.values())
+    for child in children:
+        child.tail = None
+    if merged.tag == _q("Profile"):
+        # Profile elements must follow the (alphabetical) order of the Metadata API schema
+        children.sort(key=lambda child: (child.tag != _q("fullName"), child.tag))
+    merged.extend(children)
+    return _serialize(merged)
+
+def _canonical_path(path: str) -> str:
+    # Some builders emit source-format profile names; one profile file per deploy is kept
+    if path.endswith(".profile-meta.xml"):
+        return path[:-len("-meta.xml")]
+    return path
+
+def merge_packages(packages: list[MetadataPackage]) -> MetadataPackage:
+    """Combines several packages into one deployable package.
+
+    Manifests are merged member by member and files present in several packages
+    (typically the Admin profile) are merged entry by entry.
+    """
+    if len(packages) == 1:
+        return packages[0]
+    versions: dict[str, list[str]] = {}
+    for package in packages:
+        for path in package.files:
+            versions.setdefault(_canonical_path(path), []).append(package.read(path))
+
+    merged = MetadataPackage()
+    for path, texts in versions.items():
+        if len(texts) == 1:
+            merged.add(path, texts[0])
+        elif os.path.basename(path) in MANIFESTS:
+            merged.add(path, merge_manifests(texts))
+        else:
+            merged.add(path, merge_metadata_files(texts))
+    return merged
@@ -0,0 +1,24 @@
+import contextvars
+from typing import Callable, Optional
+
+# (progress, total, message) -> None
+ProgressReporter = Callable[[float, Optional[float], Optional[str]], None]
+
+# Set by the server for the duration of a tool call whose client asked for progress.
+# Tool implementations run with a copy of the caller's context, so this is visible
+# from the worker thread as well.
+_reporter: contextvars.ContextVar[Optional[ProgressReporter]] = contextvars.ContextVar(
+    "sfmcp_progress_reporter", default=None
+)
+
+def set_reporter(reporter: Optional[ProgressReporter]) -> contextvars.Token:
+    return _reporter.set(reporter)
+
+def reset_reporter(token: contextvars.Token):
+    _reporter.reset(token)
+
+def report_progress(progress: float, total: Optional[float] = None, message: Optional[str] = None):
+    """Sends an MCP progress notification for the current tool call, if the client asked for them."""
+    reporter = _reporter.get()
+    if reporter is not None:
+        reporter(progress, total, message)
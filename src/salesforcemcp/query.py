@@ -0,0 +1,195 @@
+import json
+import re
+import sys
+from typing import Any, Optional
+from urllib.parse import unquote, urlsplit
+
+from simple_salesforce import Salesforce
+from simple_salesforce.exceptions import SalesforceMalformedRequest
+
+import salesforcemcp.bulk as sfbulk
+from salesforcemcp.env import env_float, env_int
+import salesforcemcp.formatting as sfformat
+
+DEFAULT_MAX_ROWS = env_int("SFMCP_SOQL_MAX_ROWS", 2000, minimum=1)
+DEFAULT_MAX_BYTES = env_int("SFMCP_SOQL_MAX_BYTES", 1000000, minimum=1)
+DEFAULT_BULK_THRESHOLD = env_int("SFMCP_BULK_QUERY_THRESHOLD", 10000, minimum=1)
+BULK_TIMEOUT = env_float("SFMCP_BULK_TIMEOUT", 600.0, minimum=1)
+
+BULK_MODES = ("auto", "always", "never")
+
+# Salesforce accepts query batch sizes between 200 and 2000 rows
+MIN_BATCH_SIZE = 200
+MAX_BATCH_SIZE = 2000
+
+def _query_options(page_size: Optional[int]) -> dict[str, str]:
+    if not page_size:
+        return {}
+    batch_size = max(MIN_BATCH_SIZE, min(MAX_BATCH_SIZE, int(page_size)))
+    return {"Sforce-Query-Options": f"batchSize={batch_size}"}
+
+def _collect_pages(connection: Salesforce, page: dict[str, Any], max_rows: int, max_bytes: int,
+                   headers: dict[str, str]) -> dict[str, Any]:
+    """Keeps reading pages after `page` until the result is done or a budget is reached."""
+    records = []
+    size = 0
+    while True:
+        page_records = page.get("records", [])
+        records.extend(page_records)
+        size += len(json.dumps(page_records))
+        if page.get("done", True) or len(records) >= max_rows or size >= max_bytes:
+            break
+        page = connection.query_more(page["nextRecordsUrl"], identifier_is_url=True, headers=headers)
+
+    result = {
+        "totalSize": page.get("totalSize", len(records)),
+        "done": page.get("done", True),
+        "records": records,
+    }
+    if not result["done"]:
+        result["nextRecordsUrl"] = page["nextRecordsUrl"]
+    return result
+
+def _write_pages(connection: Salesforce, page: dict[str, Any], headers: dict[str, str],
+                 output_file: str) -> dict[str, Any]:
+    """Writes `page` and every following page to a CSV file as they are fetched."""
+    with open(output_file, "w", encoding="utf-8", newline="") as f:
+        writer = sfformat.CsvWriter(f)
+        while True:
+            writer.write_records(page.get("records", []))
+            if page.get("done", True):
+                break
+            page = connection.query_more(page["nextRecordsUrl"], identifier_is_url=True, headers=headers)
+    return {"totalSize": page.get("totalSize", writer.rows), "done": True, "api": "rest",
+            "outputFile": output_file, "recordsWritten": writer.rows}
+
+# Cursor returned when an in-memory Bulk API 2.0 result is cut short
+_BULK_CURSOR = re.compile(r"/jobs/query/(\w+)/results\?locator=([^&\s]+)$")
+
+def _bulk_cursor(bulk: sfbulk.Bulk2Client, job_id: str, locator: str) -> str:
+    return f"{urlsplit(bulk.base_url).path}query/{job_id}/results?locator={locator}"
+
+def _collect_bulk_pages(bulk: sfbulk.Bulk2Client, job_id: str, locator: Optional[str], total: int,
+                        max_rows: int, max_bytes: int) -> dict[str, Any]:
+    """Reads result pages of a query job from `locator` until it is done or a budget is reached."""
+    records = []
+    size = 0
+    while True:
+        page_size = min(max(max_rows - len(records), 1), sfbulk.MAX_RESULT_PAGE)
+        text, locator, _ = bulk.query_results_page(job_id, locator, page_size)
+        records.extend(sfbulk.csv_page_records(text))
+        size += len(text)
+        if locator is None or len(records) >= max_rows or size >= max_bytes:
+            break
+
+    result = {"totalSize": total, "done": locator is None, "records": records, "api": "bulk2", "jobId": job_id}
+    if locator:
+        result["nextRecordsUrl"] = _bulk_cursor(bulk, job_id, locator)
+    return result
+
+def stream_query(
+    connection: Salesforce,
+    query: Optional[str] = None,
+    next_records_url: Optional[str] = None,
+    max_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    page_size: Optional[int] = None,
+) -> dict[str, Any]:
+    """Pages through a SOQL result with query/query_more until a row or byte budget is hit.
+
+    Either a new query or the nextRecordsUrl cursor of a previous call must be given.
+    Whole pages are kept, so the budget can be exceeded by up to one page; the first
+    page is always returned. When the result is cut short, the returned dict has
+    done=False and the nextRecordsUrl to resume from; cursors of Bulk API 2.0 results
+    resume from the job's result locator.
+
+    Returns:
+        dict: {"totalSize", "done", "records"} like query_all, plus "nextRecordsUrl"
+        when more records are available.
+    """
+    headers = _query_options(page_size)
+
+    if next_records_url:
+        if not next_records_url.startswith("/services/data/"):
+            raise ValueError("'next_records_url' must be the nextRecordsUrl returned by a previous query.")
+        bulk_cursor = _BULK_CURSOR.search(next_records_url)
+        if bulk_cursor:
+            job_id, locator = bulk_cursor.group(1), unquote(bulk_cursor.group(2))
+            bulk = sfbulk.Bulk2Client(connection)
+            total = bulk.get_job("query", job_id).get("numberRecordsProcessed", 0)
+            return _collect_bulk_pages(bulk, job_id, locator, total, max_rows or DEFAULT_MAX_ROWS,
+                                       max_bytes or DEFAULT_MAX_BYTES)
+        page = connection.query_more(next_records_url, identifier_is_url=True, headers=headers)
+    elif query:
+        page = connection.query(query, headers=headers)
+    else:
+        raise ValueError("Missing 'query' or 'next_records_url' argument")
+
+    return _collect_pages(connection, page, max_rows or DEFAULT_MAX_ROWS, max_bytes or DEFAULT_MAX_BYTES, headers)
+
+def bulk_query(connection: Salesforce, query: str, max_rows: Optional[int] = None,
+               max_bytes: Optional[int] = None, output_file: Optional[str] = None) -> dict[str, Any]:
+    """Runs the query as a Bulk API 2.0 query job.
+
+    With output_file every row is streamed to that CSV file page by page. Otherwise records
+    are read into memory until the row/byte budget is reached.
+    """
+    bulk = sfbulk.Bulk2Client(connection)
+    job_id = bulk.create_query_job(query)
+    job = bulk.wait_for_job("query", job_id, timeout=BULK_TIMEOUT)
+    if job.get("state") != "JobComplete":
+        raise ValueError(f"Bulk query job {job_id} {job.get('state')}: {job.get('errorMessage')}")
+    total = job.get("numberRecordsProcessed", 0)
+
+    if output_file:
+        written = 0
+        with open(output_file, "w", encoding="utf-8", newline="") as f:
+            for index, (page, count) in enumerate(bulk.iter_query_results(job_id)):
+                f.write(page if index == 0 else sfbulk.strip_csv_header(page))
+                written += count
+        return {"totalSize": total, "done": True, "api": "bulk2", "jobId": job_id,
+                "outputFile": output_file, "recordsWritten": written}
+
+    return _collect_bulk_pages(bulk, job_id, None, total, max_rows or DEFAULT_MAX_ROWS, max_bytes or DEFAULT_MAX_BYTES)
+
+def run_query(
+    connection: Salesforce,
+    query: str,
+    max_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    page_size: Optional[int] = None,
+    use_bulk: Optional[str] = None,
+    bulk_threshold: Optional[int] = None,
+    output_file: Optional[str] = None,
+) -> dict[str, Any]:
+    """Runs a SOQL query over REST or Bulk API 2.0, whichever suits the result size.
+
+    The first REST page carries the full totalSize, which is used as the size estimate:
+    in "auto" mode, when more rows are wanted than bulk_threshold (all rows with
+    output_file, otherwise up to max_rows), the rest is read through a Bulk API 2.0 job.
+    Queries Bulk API 2.0 rejects (aggregates, child subqueries...) fall back to REST.
+    """
+    use_bulk = use_bulk or "auto"
+    if use_bulk not in BULK_MODES:
+        raise ValueError(f"Invalid use_bulk: '{use_bulk}'. Must be one of {list(BULK_MODES)}")
+    if use_bulk == "always":
+        return bulk_query(connection, query, max_rows, max_bytes, output_file)
+
+    max_rows = max_rows or DEFAULT_MAX_ROWS
+    max_bytes = max_bytes or DEFAULT_MAX_BYTES
+    threshold = bulk_threshold or DEFAULT_BULK_THRESHOLD
+    headers = _query_options(page_size)
+    page = connection.query(query, headers=headers)
+
+    total = page.get("totalSize", 0)
+    wanted = total if output_file else min(total, max_rows)
+    if use_bulk == "auto" and not page.get("done", True) and wanted >= threshold:
+        try:
+            return bulk_query(connection, query, max_rows, max_bytes, output_file)
+        except SalesforceMalformedRequest as e:
+            print(f"Bulk API 2.0 rejected the query, continuing over REST: {e}", file=sys.stderr)
+
+    if output_file:
+        return _write_pages(connection, page, headers, output_file)
+
+    return _collect_pages(connection, page, max_rows, max_bytes, headers)
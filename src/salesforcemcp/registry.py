@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import mcp.types as types
+
+import salesforcemcp.definitions as sfmcpdef
+import salesforcemcp.implementations as sfmcpimpl
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """A registered tool: its schema, its implementation and whether it needs a live org."""
+    name: str
+    handler: Optional[Callable[..., Any]]
+    needs_connection: bool = False
+    tool: Optional[types.Tool] = None
+
+# name -> (handler, needs live connection)
+# Tools listed here but missing from definitions.get_tools() can be called but are not advertised.
+TOOL_HANDLERS: dict[str, tuple[Callable[..., Any], bool]] = {
+    # --- Metadata Tools ---
+    "create_object": (sfmcpimpl.create_object_impl, False),
+    "create_object_with_fields": (sfmcpimpl.create_object_with_fields_impl, False),
+    "create_custom_field": (sfmcpimpl.create_object_with_fields_impl, False),
+    "delete_object_fields": (sfmcpimpl.delete_object_fields_impl, True),
+    "create_custom_metadata_type": (sfmcpimpl.create_custom_metadata_type_impl, False),
+    "create_custom_metadata_field": (sfmcpimpl.create_custom_metadata_type_impl, False),
+    "create_tab": (sfmcpimpl.create_tab_impl, True),
+    "define_tabs_on_app": (sfmcpimpl.define_tabs_on_app_impl, False),
+    "create_custom_app": (sfmcpimpl.create_custom_app_impl, True),
+    "create_report_folder": (sfmcpimpl.create_report_folder_impl, False),
+    "create_lightning_page": (sfmcpimpl.create_lightning_page_impl, False),
+    "create_dashboard_folder": (sfmcpimpl.create_dashboard_folder_impl, False),
+    "get_deploy_status": (sfmcpimpl.get_deploy_status_impl, True),
+    "begin_deploy_batch": (sfmcpimpl.begin_deploy_batch_impl, True),
+    "commit_deploy_batch": (sfmcpimpl.commit_deploy_batch_impl, True),
+
+    # --- Standard Data Tools ---
+    "run_soql_query": (sfmcpimpl.run_soql_query_impl, False),
+    "query_more": (sfmcpimpl.query_more_impl, False),
+    "run_sosl_search": (sfmcpimpl.run_sosl_search_impl, False),
+    "get_object_fields": (sfmcpimpl.get_object_fields_impl, False),
+    "create_record": (sfmcpimpl.create_record_impl, True),
+    "update_record": (sfmcpimpl.update_record_impl, False),
+    "delete_record": (sfmcpimpl.delete_record_impl, False),
+    "create_records": (sfmcpimpl.create_records_impl, True),
+    "update_records": (sfmcpimpl.update_records_impl, False),
+    "delete_records": (sfmcpimpl.delete_records_impl, False),
+    "bulk_ingest_file": (sfmcpimpl.bulk_ingest_file_impl, True),
+    "describe_object": (sfmcpimpl.describe_object_impl, False),
+    "get_api_usage": (sfmcpimpl.get_api_usage_impl, False),
+    "resolve_objects": (sfmcpimpl.resolve_objects_impl, True),
+}
+
+class ToolRegistry:
+    """Maps tool names to their specs and keeps the advertised catalogs precomputed.
+
+    The connected and disconnected tool lists are built once, so list_tools does not
+    rebuild any schema and call_tool finds its handler with a single dict lookup.
+    """
+
+    def __init__(self, specs: list[ToolSpec]):
+        self._specs = {spec.name: spec for spec in specs}
+        advertised = [spec for spec in specs if spec.tool is not None]
+        self._connected_tools = [spec.tool for spec in advertised]
+        self._disconnected_tools = [spec.tool for spec in advertised if not spec.needs_connection]
+
+    def get(self, name: str) -> Optional[ToolSpec]:
+        return self._specs.get(name)
+
+    def list_tools(self, connected: bool) -> list[types.Tool]:
+        """Returns the cached catalog for the given connection state."""
+        return self._connected_tools if connected else self._disconnected_tools
+
+def build_registry() -> ToolRegistry:
+    """Builds the registry from the schemas in definitions and the TOOL_HANDLERS table.
+
+    Schemas without a handler are still advertised (their calls fail as unknown tools),
+    matching the catalog clients have always seen.
+    """
+    specs = []
+    for tool in sfmcpdef.get_tools():
+        handler, needs_connection = TOOL_HANDLERS.get(tool.name, (None, False))
+        specs.append(ToolSpec(tool.name, handler, needs_connection, tool))
+    advertised = {spec.name for spec in specs}
+    for name, (handler, needs_connection) in TOOL_HANDLERS.items():
+        if name not in advertised:
+            specs.append(ToolSpec(name, handler, needs_connection))
+    return ToolRegistry(specs)
@@ -0,0 +1,97 @@
+import base64
+import hashlib
+import json
+import os
+import sys
+import time
+from typing import Optional
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # optional: the session cache is disabled without it
+    Fernet = None
+
+SESSION_CACHE_FILE = "session.bin"
+SALT_BYTES = 16
+KDF_ITERATIONS = 200_000
+
+class SessionCache:
+    """Encrypted on-disk copy of the last Salesforce session id and instance.
+
+    Reusing a still valid session saves the SOAP login on every start. The file is
+    encrypted with Fernet, using SFMCP_SESSION_KEY when it is set, or else a key
+    derived (PBKDF2 with a random per-file salt) from the login credentials, so a
+    changed password simply makes the cached session unreadable.
+    """
+
+    def __init__(self, path: str, secret: bytes, username: str = ""):
+        self.path = path
+        self.username = username
+        self._secret = secret
+        self._keys: dict[bytes, Fernet] = {}
+
+    @classmethod
+    def from_env(cls, username: Optional[str], password: Optional[str],
+                 security_token: Optional[str]) -> Optional["SessionCache"]:
+        """Opens the cache in SFMCP_CACHE_DIR, or returns None when it cannot be used.
+
+        It is off when SFMCP_CACHE_DIR is unset, SFMCP_SESSION_CACHE is "0" or the
+        optional cryptography package is not installed.
+        """
+        cache_dir = os.getenv("SFMCP_CACHE_DIR")
+        if not cache_dir or os.getenv("SFMCP_SESSION_CACHE", "1") == "0":
+            return None
+        if Fernet is None:
+            print("Session cache disabled: the 'cryptography' package is not installed "
+                  "(pip install 'salesforce-mcp[session-cache]')", file=sys.stderr)
+            return None
+        secret = os.getenv("SFMCP_SESSION_KEY") or f"{username}\0{password}\0{security_token}"
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+        except OSError as e:
+            print(f"Session cache disabled: {e}", file=sys.stderr)
+            return None
+        return cls(os.path.join(cache_dir, SESSION_CACHE_FILE), secret.encode("utf-8"), username or "")
+
+    def _fernet(self, salt: bytes) -> "Fernet":
+        fernet = self._keys.get(salt)
+        if fernet is None:
+            key = hashlib.pbkdf2_hmac("sha256", self._secret, salt, KDF_ITERATIONS)
+            fernet = self._keys[salt] = Fernet(base64.urlsafe_b64encode(key))
+        return fernet
+
+    def load(self) -> Optional[tuple[str, str]]:
+        """Returns the cached (session id, instance), or None if there is no usable entry."""
+        try:
+            with open(self.path, "rb") as f:
+                blob = f.read()
+        except OSError:
+            return None
+        salt, token = blob[:SALT_BYTES], blob[SALT_BYTES:]
+        try:
+            entry = json.loads(self._fernet(salt).decrypt(token))
+        except (InvalidToken, ValueError):
+            return None
+        if entry.get("username") != self.username:
+            return None
+        return entry["session_id"], entry["instance"]
+
+    def save(self, session_id: str, instance: str):
+        salt = os.urandom(SALT_BYTES)
+        entry = {"username": self.username, "session_id": session_id, "instance": instance, "saved_at": time.time()}
+        blob = salt + self._fernet(salt).encrypt(json.dumps(entry).encode("utf-8"))
+        try:
+            # Written to a private temporary file first, so a crash never leaves a partial cache
+            tmp_path = f"{self.path}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Could not write the session cache: {e}", file=sys.stderr)
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
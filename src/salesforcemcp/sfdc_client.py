@@ -1,73 +1,379 @@
-import json
 import time
-import shutil
 import os
-import base64
-import zipfile
-from simple_salesforce import Salesforce
-from typing import Optional, Any
-import xml.etree.ElementTree as ET
+import sys
+import threading
+from simple_salesforce import Salesforce, SalesforceLogin
+from simple_salesforce.util import exception_handler
+from typing import Optional, Any, Iterable
+from salesforcemcp.cache import DescribeCache
+from salesforcemcp.env import env_float, env_int
+from salesforcemcp.describe_markdown import SECTIONS, normalize_sections, render_describe
+from salesforcemcp.object_index import ObjectIndex
+from salesforcemcp.describe_store import DescribeStore, StoredDescribe, GLOBAL_DESCRIBE
+from salesforcemcp.http_pool import PooledSession
+from salesforcemcp.api_limits import ApiScheduler
+from salesforcemcp.session_cache import SessionCache
+from salesforcemcp.package import MetadataPackage
+import salesforcemcp.metadata_xml as mdxml
+from salesforcemcp.deploy_batch import DeployBatcher
+from salesforcemcp.deploy_ledger import DeployLedger, LedgerEntry, package_digest
+import salesforcemcp.metadata_soap as metadata_soap
 
 BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DEPLOY_DIR = "deployment_package"
 
-def _clean_deploy_dir():
-    """Removes and recreates the deployment directory."""
-    deploy_path = os.path.join(BASE_PATH, DEPLOY_DIR)
-    if os.path.exists(deploy_path):
-        shutil.rmtree(deploy_path)
-    os.makedirs(deploy_path, exist_ok=True)
+class PooledSalesforce(Salesforce):
+    """Salesforce connection whose Metadata API (zeep) client shares the connection's session.
+
+    simple-salesforce builds the zeep client with a default transport that opens its own
+    connections; this points that transport at the pooled session instead.
+    """
+
+    @property
+    def mdapi(self):
+        mdapi = super().mdapi
+        transport = mdapi._client.transport
+        if transport.session is not self.session:
+            transport.session = self.session
+        return mdapi
 
 class OrgHandler:
     """Manages interactions and caching for a Salesforce org."""
 
     def __init__(self):
         self.connection: Optional[Salesforce] = None
-        self.metadata_cache: dict[str, Any] = {}
+        self.http_session = PooledSession.from_env()
+        # Any call answered with INVALID_SESSION_ID logs in again and is replayed
+        self.http_session.renew_session = self._renew_session
+        # Every request is paced and counted per tool against the org's daily API allocation
+        self.api_scheduler = ApiScheduler.from_env()
+        self.http_session.api_scheduler = self.api_scheduler
+        self._login_lock = threading.Lock()
+        self.session_cache = SessionCache.from_env(
+            os.getenv("USERNAME"), os.getenv("PASSWORD"), os.getenv("SECURITY_TOKEN")
+        )
+        self.metadata_cache = DescribeCache(
+            max_entries=env_int("SFMCP_DESCRIBE_CACHE_SIZE", 128, minimum=1),
+            ttl=env_float("SFMCP_DESCRIBE_CACHE_TTL", 900.0),
+        )
+        self._object_index: Optional[ObjectIndex] = None
+        self.describe_store = DescribeStore.from_env()
+        # Object name -> (revalidation token, describe payload it belongs to)
+        self._describe_tokens: dict[str, tuple[str, Any]] = {}
+        # Rendered describe_object pages, keyed by revalidation token (entries never expire on their own)
+        self.markdown_cache = DescribeCache(
+            max_entries=env_int("SFMCP_DESCRIBE_MARKDOWN_CACHE_SIZE", 256, minimum=1), ttl=0
+        )
+        self.deploy_ledger = DeployLedger.from_env()
+        # Package digest -> [lock, number of callers holding or waiting for it]
+        self._digest_locks: dict[str, list] = {}
+        self._digest_locks_guard = threading.Lock()
+        self.deploy_batcher = DeployBatcher(self._deploy_once)
 
     def establish_connection(self) -> bool:
         """Initiates and authenticates the connection to the Salesforce org.
 
+        A session saved by an earlier run (see SessionCache) is reused without logging in;
+        if it has expired, the first call renews it transparently.
+
         Returns:
             bool: Returns True upon successful authentication, False otherwise.
         """
         try:
-            self.connection = Salesforce(
-                username=os.getenv("USERNAME"),
-                password=os.getenv("PASSWORD"),
-                security_token=os.getenv("SECURITY_TOKEN")
-            )
+            with self._login_lock:
+                cached = self.session_cache.load() if self.session_cache else None
+                if cached:
+                    self._connect(*cached)
+                    print("Reusing the cached Salesforce session.", file=sys.stderr)
+                    return True
+                self._connect(*self._login())
+                self._save_session()
             return True
         except Exception as e:
-            print(f"Failed to establish Salesforce connection: {str(e)}")
+            print(f"Failed to establish Salesforce connection: {str(e)}", file=sys.stderr)
             self.connection = None
             return False
 
+    def _login(self) -> tuple[str, str]:
+        """Runs the SOAP username/password login and returns (session id, instance)."""
+        return SalesforceLogin(
+            username=os.getenv("USERNAME"),
+            password=os.getenv("PASSWORD"),
+            security_token=os.getenv("SECURITY_TOKEN"),
+            session=self.http_session,
+        )
+
+    def _connect(self, session_id: str, instance: str):
+        self.connection = PooledSalesforce(session_id=session_id, instance=instance, session=self.http_session)
+
+    def _save_session(self):
+        if self.session_cache and self.connection:
+            self.session_cache.save(self.connection.session_id, self.connection.sf_instance)
+
+    def _renew_session(self, stale_session_id: str) -> Optional[str]:
+        """Logs in again after stale_session_id expired and returns the new session id.
+
+        Concurrent calls that hit the expiry share a single login: the first one logs
+        in, the others find the session already renewed.
+        """
+        with self._login_lock:
+            connection = self.connection
+            if connection is None:
+                return None
+            if connection.session_id != stale_session_id:
+                return connection.session_id
+            try:
+                session_id, instance = self._login()
+            except Exception as e:
+                print(f"Salesforce session expired and the new login failed: {e}", file=sys.stderr)
+                return None
+            if instance == connection.sf_instance:
+                # Update the shared connection in place; callers may hold a reference to it
+                connection.session_id = session_id
+                connection.headers["Authorization"] = "Bearer " + session_id
+                connection._mdapi = None
+            else:
+                self._connect(session_id, instance)
+            self._save_session()
+            print("Salesforce session expired; logged in again.", file=sys.stderr)
+            return session_id
+
+    @property
+    def org_id(self) -> Optional[str]:
+        """The org id, taken from the session id (which is prefixed with it)."""
+        if not self.connection:
+            return None
+        session_id = self.connection.session_id or ""
+        if session_id.startswith("00D") and "!" in session_id:
+            return session_id.split("!", 1)[0]
+        return self.connection.sf_instance
+
+    def _fetch_describe(self, path: str, name: str) -> Any:
+        """GETs a describe resource, revalidating the persisted copy when there is one.
+
+        A stored payload is sent back as If-None-Match/If-Modified-Since, so an unchanged
+        describe costs a 304 instead of the full download.
+        """
+        if not self.connection:
+            raise ValueError("Salesforce connection not established.")
+        store = self.describe_store
+        org_id, api_version = self.org_id, self.connection.sf_version
+        stored = store.get(org_id, api_version, name) if store else None
+
+        headers = {k: v for k, v in self.connection.headers.items() if k != "X-PrettyPrint"}
+        if stored:
+            headers.update(stored.conditional_headers())
+        response = self.connection.session.get(self.connection.base_url + path, headers=headers)
+
+        if response.status_code == 304 and stored:
+            store.touch(org_id, api_version, name)
+            self._describe_tokens[name.lower()] = (stored.etag or stored.last_modified, stored.payload)
+            return stored.payload
+        if response.status_code >= 300:
+            exception_handler(response, name)
+
+        payload = response.json()
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        # Date has a one-second resolution, too coarse to tell two fetches apart
+        self._describe_tokens[name.lower()] = (etag or last_modified or f"fetched-{time.time()}", payload)
+        last_modified = last_modified or response.headers.get("Date")
+        if store:
+            store.put(org_id, api_version, name, StoredDescribe(payload, last_modified, etag, time.time()))
+        return payload
+
+    def describe_object(self, object_name: str) -> dict[str, Any]:
+        """Returns the sObject describe for object_name, served from the cache when fresh.
+
+        Raises:
+            ValueError: If there is no active connection.
+            SalesforceError: If the describe call fails (e.g. unknown object).
+        """
+        describe = self.metadata_cache.get(object_name)
+        if describe is not None:
+            return describe
+        describe = self._fetch_describe(f"sobjects/{object_name}/describe", object_name)
+        self.metadata_cache.put(object_name, describe)
+        return describe
+
+    def describe_markdown(self, object_name: str, sections: Iterable[str] = SECTIONS,
+                          field_pattern: Optional[str] = None, field_offset: int = 0,
+                          field_limit: Optional[int] = None) -> str:
+        """Returns the describe of object_name rendered as markdown (see render_describe()).
+
+        Rendered pages are cached under the describe's revalidation token (its ETag or
+        Last-Modified), so they are reused for as long as the describe is unchanged and
+        rendered again once a refetch brings a new version.
+        """
+        sections = normalize_sections(sections)
+        describe = self.describe_object(object_name)
+        token, tokened_describe = self._describe_tokens.get(object_name.lower(), (None, None))
+        if token is None or tokened_describe is not describe:
+            return render_describe(describe, sections, field_pattern, field_offset, field_limit)
+        key = "\0".join((self.org_id or "", object_name, token, ",".join(sections), field_pattern or "",
+                          str(field_offset), str(field_limit)))
+        markdown = self.markdown_cache.get(key)
+        if markdown is None:
+            markdown = render_describe(describe, sections, field_pattern, field_offset, field_limit)
+            self.markdown_cache.put(key, markdown)
+        return markdown
+
+    def describe_global(self) -> dict[str, Any]:
+        """Returns the describeGlobal payload (list of all sObjects), cached like describe_object."""
+        describe = self.metadata_cache.get(GLOBAL_DESCRIBE)
+        if describe is not None:
+            return describe
+        describe = self._fetch_describe("sobjects", GLOBAL_DESCRIBE)
+        self.metadata_cache.put(GLOBAL_DESCRIBE, describe)
+        return describe
+
+    def object_index(self) -> ObjectIndex:
+        """The object index of the current describeGlobal payload, rebuilt when the payload is refetched."""
+        describe = self.describe_global()
+        index = self._object_index
+        if index is None or index.source is not describe:
+            index = self._object_index = ObjectIndex(describe)
+        return index
+
+    def _cached_object_index(self) -> Optional[ObjectIndex]:
+        try:
+            return self.object_index()
+        except Exception as e:
+            # Without describeGlobal (e.g. no permission) names are used as given
+            print(f"Object index unavailable: {e}", file=sys.stderr)
+            return None
+
+    def resolve_object_name(self, object_name: str) -> str:
+        """Maps a label, plural label or wrongly cased name to its API name using the object index.
+
+        The index only remaps: a name it does not know (an object created after
+        describeGlobal was fetched, or one it does not list) is returned as given and
+        left for Salesforce to accept or reject; object_name_hint() then adds the
+        closest names to the error.
+        """
+        index = self._cached_object_index()
+        if index is None:
+            return object_name
+        resolution = index.resolve_name(object_name)
+        return resolution.match.name if resolution.match else object_name
+
+    def object_name_hint(self, object_name: str) -> str:
+        """The closest object names, as text to append to an error, for a name the object index does not know."""
+        index = self._object_index
+        if index is None:
+            return ""
+        resolution = index.resolve_name(object_name)
+        if resolution.match or not resolution.suggestions:
+            return ""
+        return f" Did you mean: {', '.join(info.name for info in resolution.suggestions)}?"
+
+    def invalidate_describe(self, object_name: str):
+        """Forgets the cached describe of an object after its metadata changed."""
+        self.metadata_cache.invalidate(object_name)
+        self._describe_tokens.pop(object_name.lower(), None)
+        index = self._object_index
+        if index is not None and index.get(object_name) is None:
+            # A newly deployed object: the next name resolution refetches the object list
+            self.metadata_cache.invalidate(GLOBAL_DESCRIBE)
+        if self.describe_store and self.connection:
+            self.describe_store.invalidate(self.org_id, self.connection.sf_version, object_name)
+
+    def get_object_fields_cached(self, object_name: str) -> list[dict[str, Any]]:
+        """Returns the field metadata of object_name from the cached describe."""
+        return self.describe_object(object_name)["fields"]
+
+    def submit_package(self, package: Optional[MetadataPackage]) -> Optional[str]:
+        """Deploys a package through the deploy batcher.
+
+        Returns:
+            str: The deploy id (possibly shared with other packages of the same batching
+            window), or None when the package was added to an open deploy batch.
+        """
+        if package is None:
+            raise ValueError("Deployment failed: no package was prepared.")
+        if not self.connection:
+            raise ValueError("Salesforce connection is not active. Cannot perform metadata deployment.")
+        return self.deploy_batcher.submit(package)
+
+    def _deploy_once(self, package: MetadataPackage) -> str:
+        """Deploys a package unless an identical one went to this org within the dedup window.
+
+        Identical packages submitted at the same time wait for each other, so only the
+        first one is deployed.
+        """
+        digest = package_digest(package)
+        with self._digest_locks_guard:
+            holder = self._digest_locks.setdefault(digest, [threading.Lock(), 0])
+            holder[1] += 1
+        try:
+            with holder[0]:
+                org_id = self.org_id
+                entry = self.deploy_ledger.find_reusable(org_id, digest)
+                if entry is not None and self._still_reusable(entry):
+                    self.deploy_ledger.mark_reused(org_id, digest)
+                    print(f"Identical package deployed {time.time() - entry.submitted_at:.0f}s ago; "
+                          f"reusing deploy {entry.deploy_id}.", file=sys.stderr)
+                    return entry.deploy_id
+                deploy_id = deploy_package(package, self.connection)
+                self.deploy_ledger.record(org_id, digest, deploy_id)
+                return deploy_id
+        finally:
+            with self._digest_locks_guard:
+                holder[1] -= 1
+                if not holder[1]:
+                    del self._digest_locks[digest]
+
+    def _still_reusable(self, entry: LedgerEntry) -> bool:
+        """Refreshes the status of a ledger entry; only a deploy in progress or succeeded is reused."""
+        try:
+            entry.status = self.deploy_status(entry.deploy_id)
+        except Exception as e:
+            print(f"Could not check deploy {entry.deploy_id}, deploying again: {e}", file=sys.stderr)
+            return False
+        return entry.reusable
+
+    def deploy_status(self, deploy_id: str, wait: bool = False, timeout: Optional[float] = None) -> dict[str, Any]:
+        """Returns the status of a deploy (see deploy_status()) and records it in the deploy ledger.
+
+        A deploy the ledger already knows to be finished is answered without calling Salesforce.
+        """
+        entry = self.deploy_ledger.get(deploy_id)
+        if entry is not None and entry.done:
+            return entry.status
+        status = deploy_status(self.connection, deploy_id, wait=wait, timeout=timeout)
+        self.deploy_ledger.update_status(deploy_id, status)
+        return status
+
+    def api_usage(self, refresh: bool = False) -> dict[str, Any]:
+        """Returns the API usage tracked by the scheduler.
+
+        The org-wide figures come from the last response header; with refresh they are
+        read from the /limits resource first (which itself costs one API call).
+        """
+        if refresh and self.connection:
+            daily = self.connection.limits().get("DailyApiRequests", {})
+            if "Max" in daily and "Remaining" in daily:
+                self.api_scheduler.update_org_limits(daily["Max"] - daily["Remaining"], daily["Max"])
+        return self.api_scheduler.usage()
+
+_log_lock = threading.Lock()
+
 def write_to_file(content):
-    with open(f"{BASE_PATH}/mylog.txt", 'a') as f:
+    # Tool calls run concurrently; keep their log entries from interleaving
+    with _log_lock, open(f"{BASE_PATH}/mylog.txt", 'a') as f:
         f.write(content)
 
-def zip_directory(filepath):
-    source_directory = filepath
-    output_zip_name = f"{BASE_PATH}/pack"
-    shutil.make_archive(output_zip_name, 'zip', source_directory)
+import requests
 
-def binary_to_base64(file_path):
-    try:
-        with open(file_path, "rb") as binary_file:
-            binary_data = binary_file.read()
-            base64_encoded = base64.b64encode(binary_data)
-            return base64_encoded.decode('utf-8')
-    except FileNotFoundError:
-        print(f"File not found: {file_path}")
-        return None
+def deploy(zip_bytes: bytes, sf) -> str:
+    """Deploys the zipped package using the provided simple_salesforce connection.
 
-import requests
+    The SOAP envelope is streamed (see DeployEnvelope) rather than built as one string.
 
-def deploy(b64, sf):
-    """Deploys the zipped package using the provided simple_salesforce connection."""
+    Returns:
+        str: The id of the asynchronous deploy, to pass to checkDeployStatus.
+    """
     if not sf:
-         print("Error: Salesforce connection object (sf) not provided to deploy function.")
+         print("Error: Salesforce connection object (sf) not provided to deploy function.", file=sys.stderr)
          raise ValueError("Deployment failed: Invalid Salesforce connection.")
 
     try:
@@ -79,135 +385,74 @@ def deploy(b64, sf):
              raise ValueError("Could not retrieve instance URL from Salesforce connection.")
 
         # Ensure API version matches package.xml if necessary (using 58.0 here)
-        metadata_api_version = "58.0" 
-        endpoint = f"https://{instance_url}/services/Soap/m/{metadata_api_version}"
-        print(f"Using dynamic endpoint: {endpoint}") # Log the endpoint being used
+        endpoint = metadata_soap.metadata_endpoint(instance_url)
+        print(f"Using dynamic endpoint: {endpoint}", file=sys.stderr) # Log the endpoint being used
     except AttributeError as e:
-         print(f"Error accessing connection attributes: {e}")
+         print(f"Error accessing connection attributes: {e}", file=sys.stderr)
          raise ValueError("Deployment failed: Could not get session details from Salesforce connection.")
 
-    headers = {
-        "Content-Type": "text/xml; charset=utf-8",
-        'SOAPAction': '""'
-    }
-
-    xml_body_template = """<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" xmlns:met="http://soap.sforce.com/2006/04/metadata">
-   <soapenv:Header>
-      <met:SessionHeader>
-         <met:sessionId>{session_id}</met:sessionId> <!-- Dynamic Session ID -->
-      </met:SessionHeader>
-   </soapenv:Header>
-   <soapenv:Body>
-      <met:deploy>
-         <met:ZipFile>{base64_zip}</met:ZipFile>
-         <met:DeployOptions>
-            <met:allowMissingFiles>false</met:allowMissingFiles>
-            <met:autoUpdatePackage>false</met:autoUpdatePackage>
-            <met:checkOnly>false</met:checkOnly>
-            <met:ignoreWarnings>false</met:ignoreWarnings>
-            <met:performRetrieve>false</met:performRetrieve>
-            <met:purgeOnDelete>false</met:purgeOnDelete>
-            <met:rollbackOnError>true</met:rollbackOnError>
-            <met:singlePackage>true</met:singlePackage>
-         </met:DeployOptions>
-      </met:deploy>
-   </soapenv:Body>
-</soapenv:Envelope>
-    """
-
-    if b64 is None:
-        print("Error: Base64 package data is None. Cannot deploy.")
+    if not zip_bytes:
+        print("Error: Package data is empty. Cannot deploy.", file=sys.stderr)
         raise ValueError("Deployment failed: Invalid package data.")
 
-    # Populate the template
-    xml_body = xml_body_template.format(session_id=session_id, base64_zip=b64)
-
-    # Log the request body (optional, good for debugging but might log session ID)
-    # print(f"SOAP Request Body:\n{xml_body}")
-    with open(f"{BASE_PATH}/deploy.log", "w", encoding="utf-8") as file:
-        file.write(xml_body)
+    envelope = metadata_soap.DeployEnvelope(session_id, zip_bytes)
 
     try:
-        response = requests.post(endpoint, data=xml_body, headers=headers)
+        # Reuse the connection's pooled keep-alive session instead of a new TLS connection per deploy
+        response = sf.session.post(endpoint, data=envelope, headers=metadata_soap.SOAP_HEADERS)
         
-        print(f"Deployment API Response Status: {response.status_code}")
-        print(f"Deployment API Response Text:\n{response.text}")
-        with open(f"{BASE_PATH}/deploy_http.log", "w", encoding="utf-8") as file:
-            file.write(response.text)
+        print(f"Deployment API Response Status: {response.status_code} ({len(envelope)} bytes sent)", file=sys.stderr)
+        metadata_soap.log_deploy(envelope, response.status_code, response.text)
 
-        # --- Add Robust Error Checking --- 
         if response.status_code >= 400:
-             # Try to parse for a SOAP fault message for better error reporting
-             fault_message = f"HTTP Error {response.status_code}."
-             try:
-                 root = ET.fromstring(response.text)
-                 # Look for soapenv:Fault (adjust namespace prefixes if needed)
-                 fault = root.find('.//{http://schemas.xmlsoap.org/soap/envelope/}Fault')
-                 if fault is not None:
-                     faultcode = fault.findtext('{*}faultcode')
-                     faultstring = fault.findtext('{*}faultstring')
-                     fault_message = f"SOAP Fault: Code='{faultcode}', Message='{faultstring}' (HTTP Status: {response.status_code})"
-             except ET.ParseError:
-                 fault_message += " Additionally, the response body was not valid XML." # Or just use raw text
-             except Exception as parse_e:
-                 print(f"Minor error parsing SOAP fault: {parse_e}") # Log parsing error but continue
-                 fault_message += f" Response Text: {response.text[:500]}..." # Include snippet of raw text
-             
+             fault_message = metadata_soap.soap_fault_message(response.status_code, response.text)
              raise ValueError(f"Salesforce deployment API call failed: {fault_message}")
-        # Add checks for specific deployment success/failure messages within the SOAP body if needed
-        # For now, we assume non-error status code means the deployment was accepted (though it might fail asynchronously)
-        print("Deployment request submitted successfully to Salesforce.")
-        # --- End Error Checking --- 
+
+        # The deploy runs asynchronously; its id is what checkDeployStatus tracks
+        deploy_id = metadata_soap.parse_deploy_id(response.text)
+        if not deploy_id:
+            raise ValueError(f"Salesforce deployment API call returned no deploy id: {response.text[:500]}")
+        print(f"Deployment request submitted successfully to Salesforce (deploy id {deploy_id}).", file=sys.stderr)
+        return deploy_id
 
     except requests.exceptions.RequestException as req_e:
-         print(f"Network error during deployment API call: {req_e}")
+         print(f"Network error during deployment API call: {req_e}", file=sys.stderr)
          raise ValueError(f"Deployment failed: Network error contacting Salesforce API. Details: {str(req_e)}")
     except Exception as e:
         # Catch any other unexpected errors during the process
-        print(f"Unexpected error during deployment call: {e}")
+        print(f"Unexpected error during deployment call: {e}", file=sys.stderr)
         raise
 
-def create_send_to_server(sf):
-    """Zips the current package and sends it for deployment using the provided sf connection."""
-    zip_directory(f"{BASE_PATH}/current")
-    b64 = binary_to_base64(f"{BASE_PATH}/pack.zip")
-    deploy(b64, sf) # Pass sf connection
+def deploy_status(sf, deploy_id: str, wait: bool = False, timeout: Optional[float] = None) -> dict[str, Any]:
+    """Returns the status of a deploy, optionally waiting (with backoff) until it is done."""
+    if not sf:
+        raise ValueError("Salesforce connection is not active.")
+    if wait:
+        return metadata_soap.wait_for_deploy(sf, deploy_id, timeout=timeout)
+    return metadata_soap.check_deploy_status(sf, deploy_id)
+
+def deploy_package(package: Optional[MetadataPackage], sf) -> str:
+    """Zips the in-memory package and deploys it using the provided sf connection.
 
-def delete_send_to_server(sf):
-    """Zips the current delete package and sends it for deployment using the provided sf connection."""
-    zip_directory(f"{BASE_PATH}/current_delete")
-    b64 = binary_to_base64(f"{BASE_PATH}/pack.zip")
-    deploy(b64, sf) # Pass sf connection
+    Returns:
+        str: The deploy id.
+    """
+    if package is None:
+        raise ValueError("Deployment failed: no package was prepared.")
+    return deploy(package.to_zip(), sf)
 
-def delete_fields(json_obj):
+def delete_fields(json_obj) -> MetadataPackage:
     api_name = json_obj["api_name"]
     fields = json_obj["fields"]
 
-    members = ""
-
-    for field in fields:
-        field_name = field["api_name"]
-        members = members + f"<members>{api_name}.{field_name}</members>\n"
-
-    try:
-        shutil.rmtree(f"{BASE_PATH}/current_delete/")
-    except:
-        print("the current directory doesn't exist")
-
-    source = f"{BASE_PATH}/assets/delete_fields_tmpl/"
-    destination = f"{BASE_PATH}/current_delete/"
-
-    shutil.copytree(source, destination)
+    members = [f"{api_name}.{field['api_name']}" for field in fields]
 
-    with open(f"{BASE_PATH}/current_delete/destructiveChanges.xml", "r", encoding="utf-8") as file:
-        destructive = file.read()
+    package = MetadataPackage()
+    package.add("package.xml", mdxml.package_manifest({}))
+    package.add("destructiveChanges.xml", mdxml.package_manifest({"CustomField": members}, version=None))
+    return package
 
-    destructive = destructive.replace("##fields##", members)
-        
-    with open(f"{BASE_PATH}/current_delete/destructiveChanges.xml", "w", encoding="utf-8") as file:
-        file.write(destructive)
-
-def create_tab_package(json_obj):
+def create_tab_package(json_obj) -> Optional[MetadataPackage]:
     tab_api_name = json_obj["tab_api_name"]
     tab_type = json_obj["tab_type"]
     label = json_obj["label"]
@@ -221,151 +466,48 @@ def create_tab_package(json_obj):
     # --- Basic Validation (keep this) --- 
     valid_types = ['CustomObject', 'VisualforcePage', 'Web']
     if tab_type not in valid_types:
-        print(f"Invalid tab_type: {tab_type}. Must be one of {valid_types}")
+        print(f"Invalid tab_type: {tab_type}. Must be one of {valid_types}", file=sys.stderr)
         return
     if tab_type == 'CustomObject' and tab_api_name != object_name:
-         print(f"Error: For CustomObject tabs, tab_api_name ('{tab_api_name}') must match the object_name ('{object_name}')")
+         print(f"Error: For CustomObject tabs, tab_api_name ('{tab_api_name}') must match the object_name ('{object_name}')", file=sys.stderr)
          return
     if tab_type == 'VisualforcePage' and not vf_page_name:
-        print(f"Error: vf_page_name is required for VisualforcePage tabs.")
+        print(f"Error: vf_page_name is required for VisualforcePage tabs.", file=sys.stderr)
         return
     if tab_type == 'Web' and not web_url:
-        print(f"Error: web_url is required for Web tabs.")
+        print(f"Error: web_url is required for Web tabs.", file=sys.stderr)
         return
     # Add motif format validation if needed
 
-    # --- Prepare Environment (keep this) --- 
-    try:
-        shutil.rmtree(f"{BASE_PATH}/current/")
-    except FileNotFoundError:
-        print("The 'current' directory doesn't exist, proceeding.")
-    except Exception as e:
-        print(f"Error removing directory: {e}")
-        return
-
-    source = f"{BASE_PATH}/assets/create_tab_tmpl/"
-    destination = f"{BASE_PATH}/current/"
-
-    try:
-        shutil.copytree(source, destination)
-    except Exception as e:
-        print(f"Error copying template directory: {e}")
-        return
+    # --- Prepare Package --- 
+    package = MetadataPackage()
 
-    # Define target filename
-    new_tab_meta_name = f"{destination}/tabs/{tab_api_name}.tab-meta.xml"
-    # Ensure the target directory exists
-    try:
-        os.makedirs(os.path.dirname(new_tab_meta_name), exist_ok=True)
-    except OSError as e:
-        print(f"Error creating target directory: {e}")
-        return
-
-    # We can delete the copied template file as we won't use it
-    old_tab_meta_name = f"{destination}/tabs/Template.tab-meta.xml"
-    if os.path.exists(old_tab_meta_name):
-        try:
-            os.remove(old_tab_meta_name)
-        except OSError as e:
-             print(f"Warning: Could not remove template file {old_tab_meta_name}: {e}")
-
-    # --- Update package.xml (keep this) --- 
-    package_path = f"{destination}/package.xml"
-    try:
-        with open(package_path, "r", encoding="utf-8") as file:
-            pack_tmpl = file.read()
-        pack_tmpl = pack_tmpl.replace("##tab_api_name##", tab_api_name)
-        with open(package_path, "w", encoding="utf-8") as file:
-            file.write(pack_tmpl)
-    except Exception as e:
-        print(f"Error processing package.xml: {e}")
-        return
-
-    # --- Manually Construct Tab Meta XML --- 
-    xml_lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<CustomTab xmlns="http://soap.sforce.com/2006/04/metadata">',
-        f'    <label>{label}</label>',
-        f'    <motif>{motif}</motif>'
-    ]
-    
-    # Add type-specific tag
+    # Type-specific tab properties
     if tab_type == 'CustomObject':
-        xml_lines.append('    <customObject>true</customObject>')
+        type_properties = {"customObject": True}
     elif tab_type == 'VisualforcePage':
-        xml_lines.append(f'    <page>{vf_page_name}</page>')
-    elif tab_type == 'Web':
-        xml_lines.append(f'    <url>{web_url}</url>')
-        xml_lines.append(f'    <urlEncodingKey>{url_encoding_key}</urlEncodingKey>')
-        
-    # Add optional description
-    if description:
-        xml_lines.append(f'    <description>{description}</description>')
-        
-    xml_lines.append('</CustomTab>')
-    
-    final_xml_content = "\n".join(xml_lines)
-    # --- End XML Construction --- 
-
-    # --- Write Constructed XML to File --- 
-    try:
-        with open(new_tab_meta_name, "w", encoding="utf-8") as file:
-            file.write(final_xml_content)
-    except Exception as e:
-        print(f"Error writing .tab-meta.xml file: {e}")
-        return
-    # --- End Write XML ---
-
-    # --- Create or Update Profile with Tab Visibility ---
-    profiles_dir = os.path.join(destination, "profiles")
-    os.makedirs(profiles_dir, exist_ok=True)
-    profile_file = os.path.join(profiles_dir, "Admin.profile-meta.xml")
-
-    tab_visibility_xml = f"""    <tabVisibilities>\n        <tab>{tab_api_name}</tab>\n        <visibility>DefaultOn</visibility>\n    </tabVisibilities>\n"""
-
-    if os.path.exists(profile_file):
-        # Parse and append if not already present
-        tree = ET.parse(profile_file)
-        root = tree.getroot()
-        ns = {'sf': 'http://soap.sforce.com/2006/04/metadata'}
-        # Register namespace for writing
-        ET.register_namespace('', 'http://soap.sforce.com/2006/04/metadata')
-        exists = any(
-            tv.find('tab').text == tab_api_name
-            for tv in root.findall('sf:tabVisibilities', ns)
-            if tv.find('tab') is not None
-        )
-        if not exists:
-            tab_vis = ET.SubElement(root, 'tabVisibilities')
-            tab = ET.SubElement(tab_vis, 'tab')
-            tab.text = tab_api_name
-            vis = ET.SubElement(tab_vis, 'visibility')
-            vis.text = 'DefaultOn'
-            tree.write(profile_file, encoding='utf-8', xml_declaration=True)
+        type_properties = {"page": vf_page_name}
     else:
-        # Use template as before
-        with open(os.path.join(BASE_PATH, "assets", "profile.tmpl"), "r", encoding="utf-8") as f:
-            profile_template = f.read()
-        profile_xml = profile_template.replace("##fieldPermissions##", "")
-        profile_xml = profile_xml.replace("##tabVisibilities##", tab_visibility_xml)
-        with open(profile_file, "w", encoding="utf-8") as f:
-            f.write(profile_xml)
+        type_properties = {"url": web_url, "urlEncodingKey": url_encoding_key}
+
+    package.add(f"tabs/{tab_api_name}.tab-meta.xml", mdxml.custom_tab(label, motif, type_properties, description))
 
-    # Update package.xml to include profile
-    package_xml = """<?xml version="1.0" encoding="UTF-8"?>\n<Package xmlns="http://soap.sforce.com/2006/04/metadata">\n    <types>\n        <members>##tab_api_name##</members>\n        <name>CustomTab</name>\n    </types>\n    <types>\n        <members>Admin</members>\n        <name>Profile</name>\n    </types>\n    <version>58.0</version>\n</Package>"""
+    # Profile with Tab Visibility
+    package.add("profiles/Admin.profile-meta.xml", mdxml.profile(tab_visibilities=[tab_api_name]))
 
-    with open(package_path, "w", encoding="utf-8") as f:
-        f.write(package_xml.replace("##tab_api_name##", tab_api_name))
+    # package.xml includes the profile
+    package.add("package.xml", mdxml.package_manifest({"CustomTab": [tab_api_name], "Profile": ["Admin"]}, version="58.0"))
+    return package
 
-def create_custom_app_package(json_obj):
+def create_custom_app_package(json_obj) -> Optional[MetadataPackage]:
     """Prepares a package to deploy a single Custom Application.
 
     Args:
         json_obj (dict): Contains app parameters like api_name, label, nav_type, tabs, etc.
-    """
 
-    with open(f"{BASE_PATH}/check.txt", "w", encoding="utf-8") as f:
-        f.write(f"paso por aqui")
+    Returns:
+        MetadataPackage: The package, or None if the parameters are invalid.
+    """
 
     # Extract parameters
     api_name = json_obj.get("api_name")
@@ -379,416 +521,145 @@ def create_custom_app_package(json_obj):
 
     # Basic validation
     if not all([api_name, label, tabs]):
-        print("Error: Missing required app parameters: api_name, label, tabs.")
+        print("Error: Missing required app parameters: api_name, label, tabs.", file=sys.stderr)
         return
     if nav_type not in ["Standard", "Console"]:
-        print(f"Warning: Invalid nav_type '{nav_type}'. Defaulting to Standard.")
+        print(f"Warning: Invalid nav_type '{nav_type}'. Defaulting to Standard.", file=sys.stderr)
         nav_type = "Standard"
     if not isinstance(tabs, list) or not all(isinstance(t, str) for t in tabs):
-         print("Error: 'tabs' parameter must be a list of strings (tab API names).")
+         print("Error: 'tabs' parameter must be a list of strings (tab API names).", file=sys.stderr)
          return
     if not isinstance(form_factors, list) or not all(f in ["Small", "Large"] for f in form_factors):
-        print("Warning: Invalid form_factors. Defaulting to ['Small', 'Large'].")
+        print("Warning: Invalid form_factors. Defaulting to ['Small', 'Large'].", file=sys.stderr)
         form_factors = ["Small", "Large"]
     if setup_experience not in ["all", "none"]:
-        print(f"Warning: Invalid setup_experience '{setup_experience}'. Defaulting to 'all'.")
+        print(f"Warning: Invalid setup_experience '{setup_experience}'. Defaulting to 'all'.", file=sys.stderr)
         setup_experience = "all"
 
-    # --- Prepare environment --- 
-    try:
-        shutil.rmtree(f"{BASE_PATH}/current/")
-    except FileNotFoundError:
-        print("The 'current' directory doesn't exist, proceeding.")
-    except Exception as e:
-        print(f"Error removing directory: {e}")
-        return
+    package = MetadataPackage()
+    package.add("package.xml", mdxml.package_manifest({"CustomApplication": [api_name], "Profile": ["Admin"]}))
+    package.add(f"applications/{api_name}.app-meta.xml", mdxml.custom_application(
+        label,
+        description=api_name,
+        tabs=tabs,
+        nav_type=nav_type,
+        form_factors=form_factors,
+        setup_experience=setup_experience,
+        header_color=header_color,
+    ))
+    # The app is visible (and the default) for the Admin profile
+    package.add("profiles/Admin.profile-meta.xml", mdxml.profile(application_visibilities=[api_name]))
+    return package
+
+def create_metadata_package(json_obj) -> MetadataPackage:
+    name = json_obj["name"]
+    plural_name = json_obj["plural_name"]
+    description = json_obj["description"]
+    api_name = json_obj["api_name"]
+    fields = json_obj["fields"]
 
-    source_tmpl_dir = f"{BASE_PATH}/assets/create_custom_app_tmpl/"
-    destination = f"{BASE_PATH}/current/"
-    try:
-        shutil.copytree(source_tmpl_dir, destination)
-    except Exception as e:
-        with open(f"{BASE_PATH}/check.txt", "w", encoding="utf-8") as f:
-            f.write(f"{e}")
-        print(f"Error copying template directory: {e}")
-        return
-        
-    # Rename app template file
-    old_app_file = f"{destination}/applications/Template.app-meta.xml"
-    new_app_file = f"{destination}/applications/{api_name}.app-meta.xml"
-    try:
-        # Ensure directory exists (needed if copytree didn't create it fully)
-        os.makedirs(os.path.dirname(new_app_file), exist_ok=True) 
-        os.rename(old_app_file, new_app_file)
-    except OSError as e:
-        with open(f"{BASE_PATH}/check.txt", "w", encoding="utf-8") as f:
-            f.write(f"{e}")
-        print(f"Error renaming app template file: {e}")
-        return
-        
-    # --- Update package.xml to include Profile --- 
-    package_xml = """<?xml version="1.0" encoding="UTF-8"?>
-<Package xmlns="http://soap.sforce.com/2006/04/metadata">
-    <types>
-        <members>{api_name}</members>
-        <name>CustomApplication</name>
-    </types>
-    <types>
-        <members>Admin</members>
-        <name>Profile</name>
-    </types>
-    <version>63.0</version>
-</Package>""".format(api_name=api_name)
-
-    with open(os.path.join(destination, "package.xml"), "w", encoding="utf-8") as f:
-        f.write(package_xml)
-        
-    # --- Prepare App XML using Template --- 
-    try:
-        with open(new_app_file, "r", encoding="utf-8") as file:
-            app_tmpl = file.read()
-            
-        # Replace simple placeholders
-        app_tmpl = app_tmpl.replace("##label##", label)
-        app_tmpl = app_tmpl.replace("##description##", api_name)
-        
-        # Set navType based on the provided value
-        app_tmpl = app_tmpl.replace("<navType>Standard</navType>", f"<navType>{nav_type}</navType>")
-        
-        # Set setupExperience based on the provided value
-        app_tmpl = app_tmpl.replace("<setupExperience>all</setupExperience>", f"<setupExperience>{setup_experience}</setupExperience>")
-        
-        # Generate brand XML (optional)
-        brand_xml = ""
-        if header_color:
-             # Basic color validation could be added here (#ABCDEF format)
-             brand_xml = f"    <brand>\n        <headerColor>{header_color}</headerColor>\n        <shouldOverrideOrgTheme>true</shouldOverrideOrgTheme>\n    </brand>"
-        app_tmpl = app_tmpl.replace("<!-- ##brand_placeholder## -->", brand_xml)
-        
-        # Generate form factors XML - ensure it's properly placed in the XML structure
-        form_factors_xml = "\n".join([f"    <formFactors>{ff}</formFactors>" for ff in form_factors])
-        # Remove the placeholder comment and add the form factors
-        app_tmpl = app_tmpl.replace("<!-- ##form_factors_placeholder## -->", form_factors_xml)
-        
-        # Generate tabs XML
-        tabs_xml = "\n".join([f"    <tabs>{tab}</tabs>" for tab in tabs])
-        app_tmpl = app_tmpl.replace("<!-- ##tabs_placeholder## -->", tabs_xml)
-
-        # Clean up potentially empty lines from removed placeholders
-        app_tmpl = "\n".join(line for line in app_tmpl.splitlines() if line.strip())
-
-        # Write the final XML
-        with open(new_app_file, "w", encoding="utf-8") as file:
-            file.write(app_tmpl)
-        print(f"Custom App XML generated and written to: {new_app_file}")
-
-        # Create profiles directory with proper structure
-        profiles_dir = os.path.join(destination, "profiles")
-        os.makedirs(profiles_dir, exist_ok=True)
-
-        # Create application permissions XML
-        app_permissions = f"""    <applicationVisibilities>
-        <application>{api_name}</application>
-        <default>true</default>
-        <visible>true</visible>
-    </applicationVisibilities>
-"""
-
-        # Read the profile template
-        with open(os.path.join(BASE_PATH, "assets", "profile.tmpl"), "r", encoding="utf-8") as f:
-            profile_template = f.read()
-
-        # Add application permissions to the profile
-        profile_xml = profile_template.replace("##fieldPermissions##", "")
-        profile_xml = profile_xml.replace("##objectPermissions##", "")
-        profile_xml = profile_xml.replace("</Profile>", f"{app_permissions}</Profile>")
-
-        # Write profile XML with proper name
-        profile_file = os.path.join(profiles_dir, "Admin.profile-meta.xml")
-        with open(profile_file, "w", encoding="utf-8") as f:
-            f.write(profile_xml)
-            
-        with open(f"{BASE_PATH}/check.txt", "w", encoding="utf-8") as f:
-            f.write(f"OK")
+    field_entries = []
+    field_names = []  # Track field names for profile permissions
 
-    except Exception as e:
-        print(f"Error processing app template or writing file: {e}")
-        with open(f"{BASE_PATH}/check.txt", "w", encoding="utf-8") as f:
-            f.write(f"{e}")
-        return
+    for field in fields:
+        type_def = ""
 
-def create_metadata_package(json_obj):
-    try:
-        name = json_obj["name"]
-        plural_name = json_obj["plural_name"]
-        description = json_obj["description"]
-        api_name = json_obj["api_name"]
-        fields = json_obj["fields"]
+        f_name = field["label"]
+        f_type = field["type"]
+        f_api_name = field["api_name"]
+        field_names.append(f_api_name)  # Add field name to list
 
-        try:
-            shutil.rmtree(f"{BASE_PATH}/current/")
-        except:
-            print("the current directory doesn't exist")
-
-        source = f"{BASE_PATH}/assets/create_object_tmpl/"
-        destination = f"{BASE_PATH}/current/"
-
-        shutil.copytree(source, destination)
-
-        old_name = f"{BASE_PATH}/current/objects/##api_name##.object"
-        new_name = f"{BASE_PATH}/current/objects/{api_name}.object"
-
-        os.rename(old_name, new_name)
-
-        with open(f"{BASE_PATH}/assets/field.tmpl", "r", encoding="utf-8") as file:
-            field_tmpl = file.read()
-
-        fields_str = ""
-        field_names = []  # Track field names for profile permissions
-
-        for field in fields:
-            type_def = ""
-
-            f_name = field["label"]
-            f_type = field["type"]
-            f_api_name = field["api_name"]
-            field_names.append(f_api_name)  # Add field name to list
-
-            with open(f"{BASE_PATH}/check.txt", 'a') as f:
-                f.write("1")
-
-            if f_type == "Text":
-                type_def = """<type>Text</type>\n                    <length>100</length>"""
-            elif f_type == "URL":
-                type_def = "<type>Url</type>"
-            elif f_type == "Checkbox":
-                default_val = field.get("defaultValue", False)
-                type_def = f"<type>Checkbox</type>\n                    <defaultValue>{str(default_val).lower()}</defaultValue>"
-            elif f_type == "Lookup":
-                reference_to = field.get("referenceTo", "")
-                relationship_label = field.get("relationshipLabel", "")
-                relationship_name = field.get("relationshipName", "")
-                type_def = f"<type>Lookup</type>\n                    <referenceTo>{reference_to}</referenceTo>"
-                if relationship_label:
-                    type_def += f"\n                    <relationshipLabel>{relationship_label}</relationshipLabel>"
-                if relationship_name:
-                    type_def += f"\n                    <relationshipName>{relationship_name}</relationshipName>"
-            else:
-                if f_type == "Picklist":
-                    with open(f"{BASE_PATH}/check.txt", 'a') as f:
-                        f.write("2")
-
-                    f_picklist_values = field["picklist_values"]
-
-                    picklist_values_str = ""
-                    for picklist_value in f_picklist_values:
-                        val = f"""<value>
-                                    <fullName>{picklist_value}</fullName>
-                                    <default>false</default>
-                                    <label>{picklist_value}</label>
-                                </value>
-                                """
-                        picklist_values_str = picklist_values_str + val
-
-                    type_def = f"""
-                        <type>Picklist</type>
-                        <valueSet>
-                            <restricted>true</restricted>
-                            <valueSetDefinition>
-                                <sorted>false</sorted>
-                                {picklist_values_str}
-                            </valueSetDefinition>
-                        </valueSet>
-                        """
-                else:
-                    with open(f"{BASE_PATH}/check.txt", 'a') as f:
-                        f.write("4")
-                    type_def = """<precision>18</precision>
-                        <scale>0</scale>
-                        <type>Number</type>"""
-
-            new_field = field_tmpl.replace("##api_name##", f_api_name)
-            new_field = new_field.replace("##name##", f_name)
-            new_field = new_field.replace("##type##", type_def)
-            fields_str = fields_str + new_field
-
-        with open(f"{BASE_PATH}/fields_str.txt", 'a') as f:
-            f.write(json.dumps(fields_str))
-
-        # Update package.xml to include both object and profile
-        package_xml = """<?xml version="1.0" encoding="UTF-8"?>
-<Package xmlns="http://soap.sforce.com/2006/04/metadata">
-    <types>
-        <members>{api_name}</members>
-        <name>CustomObject</name>
-    </types>
-    <types>
-        <members>Admin</members>
-        <name>Profile</name>
-    </types>
-    <version>63.0</version>
-</Package>""".format(api_name=api_name)
-
-        with open(f"{BASE_PATH}/current/package.xml", "w", encoding="utf-8") as file:
-            file.write(package_xml)
-
-        obj_path = f"{BASE_PATH}/current/objects/{api_name}.object"
-
-        with open(obj_path, "r", encoding="utf-8") as file:
-            obj_tmpl = file.read()
-
-        if description is None:
-            description = ""
-
-        obj_tmpl = obj_tmpl.replace("##description##", description)
-        obj_tmpl = obj_tmpl.replace("##name##", name)
-        obj_tmpl = obj_tmpl.replace("##plural_name##", plural_name)
-        obj_tmpl = obj_tmpl.replace("##fields##", fields_str)
-
-        with open(obj_path, "w", encoding="utf-8") as file:
-            file.write(obj_tmpl)
-
-        # Create profiles directory in the deployment package
-        profiles_dir = os.path.join(f"{BASE_PATH}/current", "profiles")
-        os.makedirs(profiles_dir, exist_ok=True)
-
-        # Create field permissions XML
-        field_permissions = ""
-        for field in field_names:
-            field_permissions += f"""    <fieldPermissions>
-        <editable>true</editable>
-        <field>{api_name}.{field}</field>
-        <readable>true</readable>
-    </fieldPermissions>
-"""
-
-        # Create profile XML using template
-        with open(os.path.join(BASE_PATH, "assets", "profile.tmpl"), "r", encoding="utf-8") as f:
-            profile_template = f.read()
-
-        profile_xml = profile_template.replace("##fieldPermissions##", field_permissions)
-
-        # Write profile XML
-        with open(os.path.join(profiles_dir, "Admin.profile"), "w", encoding="utf-8") as f:
-            f.write(profile_xml)
+        if f_type == "Text":
+            type_def = mdxml.TEXT_FIELD
+        elif f_type == "URL":
+            type_def = mdxml.URL_FIELD
+        elif f_type == "Checkbox":
+            type_def = {"type": "Checkbox", "defaultValue": str(field.get("defaultValue", False)).lower()}
+        elif f_type == "Lookup":
+            type_def = {
+                "type": "Lookup",
+                "referenceTo": field.get("referenceTo", ""),
+                "relationshipLabel": field.get("relationshipLabel") or None,
+                "relationshipName": field.get("relationshipName") or None,
+            }
+        elif f_type == "Picklist":
+            type_def = {
+                "type": "Picklist",
+                "valueSet": {
+                    "restricted": True,
+                    "valueSetDefinition": {
+                        "sorted": False,
+                        "value": [
+                            {"fullName": value, "default": False, "label": value}
+                            for value in field["picklist_values"]
+                        ],
+                    },
+                },
+            }
+        else:
+            type_def = mdxml.NUMBER_FIELD
 
-    except Exception as e:
-        err_msg = f"An error occurred: {e}"
-        with open(f"{BASE_PATH}/check.txt", 'a') as f:
-            f.write(err_msg)
+        field_entries.append(mdxml.custom_field(f_api_name, f_name, type_def))
+
+    package = MetadataPackage()
+    # package.xml includes both object and profile
+    package.add("package.xml", mdxml.package_manifest({"CustomObject": [api_name], "Profile": ["Admin"]}))
+    package.add(f"objects/{api_name}.object", mdxml.custom_object(name, plural_name, description, field_entries))
+    package.add("profiles/Admin.profile", mdxml.profile(
+        field_permissions=[f"{api_name}.{field}" for field in field_names]
+    ))
+    return package
 
-def create_custom_metadata_type_package(json_obj):
+def create_custom_metadata_type_package(json_obj) -> MetadataPackage:
     """Prepares the deployment package for a new Custom Metadata Type."""
-    # 1. Clean and prepare deploy directory
-    _clean_deploy_dir()
     api_name = json_obj.get("api_name")
     label = json_obj.get("name")
     plural_name = json_obj.get("plural_name")
     description = json_obj.get("description", "")
     fields = json_obj.get("fields", [])
-    # 2. Copy custom metadata type template
-    source_dir = os.path.join(BASE_PATH, "assets", "create_custom_metadata_type_tmpl")
-    deploy_dir = os.path.join(BASE_PATH, DEPLOY_DIR)
-    os.makedirs(deploy_dir, exist_ok=True)
-    shutil.copytree(source_dir, deploy_dir, dirs_exist_ok=True)
-    # 3. Process package.xml
-    pkg_path = os.path.join(deploy_dir, "package.xml")
-    with open(pkg_path, "r", encoding="utf-8") as f:
-        pkg = f.read()
-    pkg = pkg.replace("##api_name##", api_name)
-    with open(pkg_path, "w", encoding="utf-8") as f:
-        f.write(pkg)
-    # 4. Rename object file
-    tmpl_obj = os.path.join(deploy_dir, "objects", "##api_name##.object")
-    final_obj = os.path.join(deploy_dir, "objects", f"{api_name}.object")
-    os.rename(tmpl_obj, final_obj)
-    # 5. Build fields XML
-    with open(os.path.join(BASE_PATH, "assets", "field.tmpl"), "r", encoding="utf-8") as f:
-        field_tmpl = f.read()
-    fields_str = ""
+    # 1. Build field entries
+    field_entries = []
     for field in fields:
         f_api = field.get("api_name")
         f_label = field.get("label")
         f_type = field.get("type")
         # Determine type definition
         if f_type == "Text":
-            type_def = "<type>Text</type><length>100</length>"
+            type_def = mdxml.TEXT_FIELD
         elif f_type == "Number":
-            type_def = "<type>Number</type><precision>18</precision><scale>0</scale>"
+            type_def = mdxml.NUMBER_FIELD
         elif f_type == "Checkbox":
-            default_val = field.get("defaultValue", False)
-            type_def = f"<type>Checkbox</type><defaultValue>{str(default_val).lower()}</defaultValue>"
+            type_def = {"type": "Checkbox", "defaultValue": str(field.get("defaultValue", False)).lower()}
         elif f_type == "Date":
-            type_def = "<type>Date</type>"
+            type_def = mdxml.DATE_FIELD
         elif f_type == "Picklist":
             # Build picklist valueSet from provided 'values' list
             values = field.get("values", [])
             if not values:
                 raise ValueError(f"Picklist field '{f_api}' requires a 'values' list in the JSON.")
-            values_xml = ""
+            value_entries = []
             for val in values:
                 if isinstance(val, dict):
-                    full_name = val.get("fullName", val.get("label"))
-                    default_flag = str(val.get("default", False)).lower()
+                    value_entries.append({
+                        "fullName": val.get("fullName", val.get("label")),
+                        "default": str(val.get("default", False)).lower(),
+                    })
                 else:
-                    full_name = val
-                    default_flag = "false"
-                values_xml += (
-                    "<value>"
-                    f"<fullName>{full_name}</fullName>"
-                    f"<default>{default_flag}</default>"
-                    "</value>"
-                )
-            type_def = (
-                "<type>Picklist</type>"
-                "<valueSet>"
-                "<valueSetDefinition><sorted>false</sorted>"
-                f"{values_xml}"
-                "</valueSetDefinition>"
-                "</valueSet>"
-            )
+                    value_entries.append({"fullName": val, "default": False})
+            type_def = {
+                "type": "Picklist",
+                "valueSet": {"valueSetDefinition": {"sorted": False, "value": value_entries}},
+            }
         else:
-            type_def = f"<type>{f_type}</type>"
-        # Render field XML
-        new_field = field_tmpl.replace("##api_name##", f_api)
-        new_field = new_field.replace("##name##", f_label)
-        new_field = new_field.replace("##type##", type_def)
-        fields_str += new_field
-    # 6. Inject into object file
-    with open(final_obj, "r", encoding="utf-8") as f:
-        obj_txt = f.read()
-    obj_txt = obj_txt.replace("##description##", description)
-    obj_txt = obj_txt.replace("##name##", label)
-    obj_txt = obj_txt.replace("##plural_name##", plural_name)
-    obj_txt = obj_txt.replace("##fields##", fields_str)
-    with open(final_obj, "w", encoding="utf-8") as f:
-        f.write(obj_txt)
-
-def deploy_package_from_deploy_dir(sf):
-    """Zips the DEPLOY_DIR and deploys it via the Metadata API."""
-    deploy_dir_path = os.path.join(BASE_PATH, DEPLOY_DIR)
-    if not os.path.exists(deploy_dir_path):
-        raise FileNotFoundError(f"Deployment directory not found: {deploy_dir_path}")
-
-    # Zip only the contents of the deployment directory (no parent folder)
-    zip_path = os.path.join(BASE_PATH, "deploy_package.zip")
-    # Remove old zip if present
-    if os.path.exists(zip_path):
-        os.remove(zip_path)
-    # Create new zip with contents at the root
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for root, dirs, files in os.walk(deploy_dir_path):
-            for file in files:
-                abs_file = os.path.join(root, file)
-                # Compute path relative to deploy_dir_path
-                rel_path = os.path.relpath(abs_file, deploy_dir_path)
-                zf.write(abs_file, rel_path)
-
-    # Encode and deploy
-    b64 = binary_to_base64(zip_path)
-    deploy(b64, sf)
-
-def create_profile_permissions_package(object_name: str, fields: list):
+            type_def = {"type": f_type}
+        field_entries.append(mdxml.custom_field(f_api, f_label, type_def))
+    # 2. Object file and package.xml
+    package = MetadataPackage()
+    package.add("package.xml", mdxml.package_manifest({"CustomObject": [api_name]}))
+    package.add(f"objects/{api_name}.object", mdxml.custom_metadata_type(label, plural_name, description, field_entries))
+    return package
+
+def create_profile_permissions_package(object_name: str, fields: list) -> MetadataPackage:
     """Creates a package to update the System Administrator profile with field permissions.
     Preserves existing permissions while adding new ones.
     
@@ -796,92 +667,33 @@ def create_profile_permissions_package(object_name: str, fields: list):
         object_name (str): The API name of the object
         fields (list): List of field API names to grant permissions for
     """
-    # Clean and prepare deploy directory
-    _clean_deploy_dir()
-    
-    # Create profiles directory
-    deploy_dir = os.path.join(BASE_PATH, DEPLOY_DIR)
-    profiles_dir = os.path.join(deploy_dir, "profiles")
-    os.makedirs(profiles_dir, exist_ok=True)
-    
-    # Create package.xml
-    package_xml = """<?xml version="1.0" encoding="UTF-8"?>
-<Package xmlns="http://soap.sforce.com/2006/04/metadata">
-    <types>
-        <members>Admin</members>
-        <name>Profile</name>
-    </types>
-    <version>63.0</version>
-</Package>"""
-    
-    with open(os.path.join(deploy_dir, "package.xml"), "w", encoding="utf-8") as f:
-        f.write(package_xml)
-    
-    # Create new field permissions XML
-    new_field_permissions = ""
-    for field in fields:
-        new_field_permissions += f"""    <fieldPermissions>
-        <editable>true</editable>
-        <field>{object_name}.{field}</field>
-        <readable>true</readable>
-    </fieldPermissions>
-"""
-    
-    # Read the profile template
-    with open(os.path.join(BASE_PATH, "assets", "profile.tmpl"), "r", encoding="utf-8") as f:
-        profile_template = f.read()
-    
-    # Replace the fieldPermissions placeholder with our new permissions
-    profile_xml = profile_template.replace("##fieldPermissions##", new_field_permissions)
-    
-    # Write profile XML
-    with open(os.path.join(profiles_dir, "Admin.profile"), "w", encoding="utf-8") as f:
-        f.write(profile_xml)
-
-def deploy_lightning_page(page_label="Simple Lightning App Page", description=""):
+    package = MetadataPackage()
+    package.add("package.xml", mdxml.package_manifest({"Profile": ["Admin"]}))
+    package.add("profiles/Admin.profile", mdxml.profile(
+        field_permissions=[f"{object_name}.{field}" for field in fields]
+    ))
+    return package
+
+def deploy_lightning_page(page_label="Simple Lightning App Page", description="") -> Optional[MetadataPackage]:
     """Creates a new Lightning Page with a unique name based on the provided label.
     
     Args:
         page_label (str): The label for the Lightning Page
         description (str): Optional description for the Lightning Page
+
+    Returns:
+        MetadataPackage: The package to deploy, or None if it could not be built.
     """
     try:
-        _clean_deploy_dir()
         # Generate a unique API name from the label
         api_name = page_label.replace(" ", "_") + "_" + str(int(time.time()))
         
-        asset_path = os.path.join(BASE_PATH, "assets", "Flexipages", "HardcodedPage.flexipage")
-        with open(asset_path, "r", encoding="utf-8") as asset_file:
-            flexipage_xml = asset_file.read()
-        
-        # Replace the placeholders
-        flexipage_xml = flexipage_xml.replace("##page_label##", page_label)
-        flexipage_xml = flexipage_xml.replace("##page_description##", description)
-        
-        flexipage_dir = os.path.join(BASE_PATH, DEPLOY_DIR, "flexipages")
-        os.makedirs(flexipage_dir, exist_ok=True)
-        
-        # Use the unique API name for the file
-        flexipage_path = os.path.join(flexipage_dir, f"{api_name}.flexipage")
-        with open(flexipage_path, "w", encoding="utf-8") as f:
-            f.write(flexipage_xml)
-            
-        # Update package.xml to use the unique API name
-        package_xml = f'''<?xml version="1.0" encoding="UTF-8"?>
-<Package xmlns="http://soap.sforce.com/2006/04/metadata">
-    <types>
-        <members>{api_name}</members>
-        <name>FlexiPage</name>
-    </types>
-    <version>63.0</version>
-</Package>'''
-        
-        package_path = os.path.join(BASE_PATH, DEPLOY_DIR, "package.xml")
-        with open(package_path, "w", encoding="utf-8") as f:
-            f.write(package_xml)
-            
+        package = MetadataPackage()
+        package.add(f"flexipages/{api_name}.flexipage", mdxml.flexipage(page_label, description))
+        package.add("package.xml", mdxml.package_manifest({"FlexiPage": [api_name]}))
+
         write_to_file(f"Created new Lightning page with API name: {api_name}")
-        return True
+        return package
     except Exception as e:
         write_to_file(f"Error creating Lightning page package: {str(e)}")
-        return False
+        return None
@@ -0,0 +1,80 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from simple_salesforce import Salesforce
+
+from salesforcemcp.env import env_int
+
+# sObject Collections accept at most 200 records per request
+COLLECTION_LIMIT = 200
+COLLECTION_WORKERS = env_int("SFMCP_COLLECTION_WORKERS", 4, minimum=1)
+
+def _chunks(items: list[Any], size: int = COLLECTION_LIMIT) -> list[list[Any]]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def _not_processed(count: int) -> list[dict[str, Any]]:
+    error = {"statusCode": "NOT_PROCESSED", "message": "Not sent because an earlier chunk failed and all_or_none is set."}
+    return [{"id": None, "success": False, "errors": [error]} for _ in range(count)]
+
+def _run_chunks(chunks: list[list[Any]], send: Callable[[list[Any]], list[dict[str, Any]]],
+                all_or_none: bool) -> list[dict[str, Any]]:
+    """Sends every chunk and returns the per-record results in input order.
+
+    Without all_or_none the chunks are independent and are sent concurrently. With
+    all_or_none they are sent one after another and the remaining chunks are skipped
+    after the first failure, because Salesforce only rolls back within one request.
+    """
+    if all_or_none or len(chunks) == 1:
+        results = []
+        for index, chunk in enumerate(chunks):
+            chunk_results = send(chunk)
+            results.extend(chunk_results)
+            if all_or_none and not all(r.get("success") for r in chunk_results):
+                results.extend(_not_processed(sum(len(c) for c in chunks[index + 1:])))
+                break
+        return results
+
+    # Each chunk runs in a copy of the caller's context, so its requests are counted against the calling tool
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=min(COLLECTION_WORKERS, len(chunks)),
+                            thread_name_prefix="sfmcp-collections") as pool:
+        sent = pool.map(lambda chunk: context.copy().run(send, chunk), chunks)
+        return [result for chunk_results in sent for result in chunk_results]
+
+def _with_type(object_name: str, record: dict[str, Any]) -> dict[str, Any]:
+    return {"attributes": {"type": object_name}, **record}
+
+def create_records(connection: Salesforce, object_name: str, records: list[dict[str, Any]],
+                   all_or_none: bool = False) -> list[dict[str, Any]]:
+    """Creates records through POST composite/sobjects, 200 per request."""
+    def send(chunk):
+        return connection.restful("composite/sobjects", method="POST", json={
+            "allOrNone": all_or_none,
+            "records": [_with_type(object_name, record) for record in chunk],
+        })
+    return _run_chunks(_chunks(records), send, all_or_none)
+
+def update_records(connection: Salesforce, object_name: str, records: list[dict[str, Any]],
+                   all_or_none: bool = False) -> list[dict[str, Any]]:
+    """Updates records (each must carry its Id) through PATCH composite/sobjects."""
+    missing = [index for index, record in enumerate(records) if not record.get("Id")]
+    if missing:
+        raise ValueError(f"Every record needs an 'Id' to be updated (missing at positions {missing[:10]}).")
+
+    def send(chunk):
+        return connection.restful("composite/sobjects", method="PATCH", json={
+            "allOrNone": all_or_none,
+            "records": [_with_type(object_name, record) for record in chunk],
+        })
+    return _run_chunks(_chunks(records), send, all_or_none)
+
+def delete_records(connection: Salesforce, record_ids: list[str],
+                   all_or_none: bool = False) -> list[dict[str, Any]]:
+    """Deletes records by Id through DELETE composite/sobjects?ids=..."""
+    def send(chunk):
+        return connection.restful("composite/sobjects", method="DELETE", params={
+            "ids": ",".join(chunk),
+            "allOrNone": str(all_or_none).lower(),
+        })
+    return _run_chunks(_chunks(record_ids), send, all_or_none)
@@ -1,20 +1,44 @@
 import asyncio
+import json
+import sys
+import weakref
+from typing import Optional
 
 import mcp.types as types
 from mcp.server import Server, NotificationOptions
 from mcp.server.models import InitializationOptions
+from mcp.server.lowlevel.helper_types import ReadResourceContents
 
 import mcp.server.stdio
 
 import salesforcemcp.sfdc_client as sfdc_client
-import salesforcemcp.definitions as sfmcpdef
-import salesforcemcp.implementations as sfmcpimpl
+import salesforcemcp.progress as progress
+import salesforcemcp.api_limits as api_limits
+import salesforcemcp.metrics as metrics
+import salesforcemcp.deploy_batch as deploy_batch
+from salesforcemcp.env import env_float
+from salesforcemcp.executor import ToolExecutor
+from salesforcemcp.registry import build_registry
     
 server = Server("salesforce-mcp")
 
 sf_client = sfdc_client.OrgHandler()
-if not sf_client.establish_connection():
-    print("Failed to initialize Salesforce connection")
+
+# The login runs in the background once the server is serving (see run()), so a slow
+# or unreachable login endpoint does not hold up the MCP handshake
+login_task: Optional[asyncio.Task] = None
+
+# Seconds a tool call waits for a login still in progress
+LOGIN_TIMEOUT = env_float("SFMCP_LOGIN_TIMEOUT", 60.0, minimum=1)
+
+# Sessions that listed tools, told to list them again if the catalog changes
+_listing_sessions: "weakref.WeakSet" = weakref.WeakSet()
+
+# Tool implementations are blocking, so they run on a bounded thread pool
+tool_executor = ToolExecutor.from_env()
+
+# Tool schemas and handlers are resolved once at startup
+tool_registry = build_registry()
 
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
@@ -22,80 +46,136 @@ async def handle_list_tools() -> list[types.Tool]:
     List available tools.
     Dynamically excludes tools requiring a live connection if sf_client is not connected.
     """
+    try:
+        _listing_sessions.add(server.request_context.session)
+    except LookupError:
+        pass
+    if login_task is None or not login_task.done():
+        # Tool calls wait for the login, so the full catalog is advertised meanwhile
+        return tool_registry.list_tools(True)
+    is_connected = sf_client.connection is not None
+    if not is_connected:
+        print("Salesforce connection inactive. Filtering available tools.", file=sys.stderr)
+    return tool_registry.list_tools(is_connected)
+
+async def _login() -> bool:
+    """Logs in on a worker thread; clients are told to refetch the (smaller) catalog if it fails."""
+    connected = await asyncio.to_thread(sf_client.establish_connection)
+    if not connected:
+        print("Failed to initialize Salesforce connection", file=sys.stderr)
+        for session in list(_listing_sessions):
+            try:
+                await session.send_tool_list_changed()
+            except Exception as e:
+                print(f"Could not send tools/list_changed: {e}", file=sys.stderr)
+    return connected
 
-    all_tools = sfmcpdef.get_tools()
-    is_connected = sf_client.metadata_cache is not None
+async def _wait_for_login():
+    """Waits (up to LOGIN_TIMEOUT) for a login still in progress."""
+    if login_task is None or login_task.done():
+        return
+    try:
+        await asyncio.wait_for(asyncio.shield(login_task), LOGIN_TIMEOUT)
+    except asyncio.TimeoutError:
+        # The tool then reports the inactive connection itself
+        print(f"Salesforce login still in progress after {LOGIN_TIMEOUT:.0f}s", file=sys.stderr)
 
-    if is_connected:
-        return all_tools
-    else:
-        print("Salesforce connection inactive. Filtering available tools.")
-        live_connection_tools = {
-            "create_record", "delete_object_fields", "create_tab", "create_custom_app"
-        }
-        available_tools = [tool for tool in all_tools if tool.name not in live_connection_tools]
-        return available_tools
+def _progress_reporter() -> Optional[progress.ProgressReporter]:
+    """Returns a thread-safe progress callback when the client sent a progressToken."""
+    try:
+        ctx = server.request_context
+    except LookupError:
+        return None
+    progress_token = ctx.meta.progressToken if ctx.meta else None
+    if progress_token is None:
+        return None
+    loop = asyncio.get_running_loop()
+
+    def report(value: float, total: Optional[float] = None, message: Optional[str] = None):
+        # Called from the worker thread running the tool
+        asyncio.run_coroutine_threadsafe(
+            ctx.session.send_progress_notification(progress_token, value, total, message), loop
+        )
+    return report
+
+def _client_session():
+    try:
+        return server.request_context.session
+    except LookupError:
+        return None
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict[str, str]) -> list[types.TextContent]:
-    if name == "create_object":
-        return sfmcpimpl.create_object_impl(sf_client, arguments)
-    elif name == "create_object_with_fields":
-        return sfmcpimpl.create_object_with_fields_impl(sf_client, arguments)
-    elif name == "create_custom_field":
-        return sfmcpimpl.create_object_with_fields_impl(sf_client, arguments)
-    elif name == "delete_object_fields":
-        return sfmcpimpl.delete_object_fields_impl(sf_client, arguments)
-    elif name == "create_custom_metadata_type":
-        return sfmcpimpl.create_custom_metadata_type_impl(sf_client, arguments)
-    elif name == "create_custom_metadata_field":
-        return sfmcpimpl.create_custom_metadata_type_impl(sf_client, arguments)
-    elif name == "create_tab":
-        return sfmcpimpl.create_tab_impl(sf_client, arguments)
-    elif name == "define_tabs_on_app":
-        return sfmcpimpl.define_tabs_on_app_impl(sf_client, arguments)
-    elif name == "create_custom_app":
-        return sfmcpimpl.create_custom_app_impl(sf_client, arguments)
-    elif name == "create_report_folder":
-        return sfmcpimpl.create_report_folder_impl(sf_client, arguments)
-    elif name == "create_lightning_page":
-        return sfmcpimpl.create_lightning_page_impl(sf_client, arguments)
-    elif name == "create_dashboard_folder":
-        return sfmcpimpl.create_dashboard_folder_impl(sf_client, arguments)
-
-    # --- Standard Data Tool Implementations --- 
-    elif name == "run_soql_query":
-        return sfmcpimpl.run_soql_query_impl(sf_client, arguments)
-    elif name == "run_sosl_search":
-        return sfmcpimpl.run_sosl_search_impl(sf_client, arguments)
-    elif name == "get_object_fields":
-        return sfmcpimpl.get_object_fields_impl(sf_client, arguments)
-    elif name == "create_record":
-        return sfmcpimpl.create_record_impl(sf_client, arguments)
-    elif name == "update_record":
-        return sfmcpimpl.update_record_impl(sf_client, arguments)
-    elif name == "delete_record":
-        return sfmcpimpl.delete_record_impl(sf_client, arguments)
-    elif name == "describe_object":
-        return sfmcpimpl.describe_object_impl(sf_client, arguments)
-        
-    else:
+    spec = tool_registry.get(name)
+    if spec is None or spec.handler is None:
         raise ValueError(f"Unknown tool: {name}")
 
+    await _wait_for_login()
+    # Refused before it starts when the tool is over its API budget or the org at its reserve
+    sf_client.api_scheduler.admit(name)
+    reporter_token = progress.set_reporter(_progress_reporter())
+    tool_token = api_limits.set_current_tool(name)
+    owner_token = deploy_batch.set_batch_owner(_client_session())
+    try:
+        with metrics.METRICS.tool_call(name, arguments) as call:
+            call["result"] = await tool_executor.run(name, spec.handler, sf_client, arguments)
+        return call["result"]
+    finally:
+        deploy_batch.reset_batch_owner(owner_token)
+        api_limits.reset_current_tool(tool_token)
+        progress.reset_reporter(reporter_token)
+
+# Read-only resources exposing the tool metrics: uri -> (name, description, mime type)
+METRICS_RESOURCES = {
+    "metrics://tools": ("Tool metrics", "Per-tool calls, latency p50/p95/p99, Salesforce round trips and bytes (JSON).", "application/json"),
+    "metrics://prometheus": ("Prometheus metrics", "The same metrics in the Prometheus text format.", "text/plain"),
+}
+
+@server.list_resources()
+async def handle_list_resources() -> list[types.Resource]:
+    return [
+        types.Resource(uri=uri, name=name, description=description, mimeType=mime_type)
+        for uri, (name, description, mime_type) in METRICS_RESOURCES.items()
+    ]
+
+@server.read_resource()
+async def handle_read_resource(uri) -> list[ReadResourceContents]:
+    uri = str(uri)
+    if uri == "metrics://tools":
+        return [ReadResourceContents(json.dumps(metrics.METRICS.summary(), indent=2), "application/json")]
+    if uri == "metrics://prometheus":
+        return [ReadResourceContents(metrics.METRICS.prometheus(), "text/plain")]
+    raise ValueError(f"Unknown resource: {uri}")
+
+async def _write_metrics_file():
+    """Rewrites SFMCP_METRICS_FILE every SFMCP_METRICS_INTERVAL seconds."""
+    while True:
+        await asyncio.sleep(metrics.METRICS_INTERVAL)
+        await asyncio.to_thread(metrics.METRICS.write_file, metrics.METRICS_FILE)
+
 async def run():
+    global login_task
     async with mcp.server.stdio.stdio_server() as (read, write):
-        await server.run(
-            read,
-            write,
-            InitializationOptions(
-                server_name="salesforce-mcp",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+        login_task = asyncio.create_task(_login())
+        metrics_task = asyncio.create_task(_write_metrics_file()) if metrics.METRICS_FILE else None
+        try:
+            await server.run(
+                read,
+                write,
+                InitializationOptions(
+                    server_name="salesforce-mcp",
+                    server_version="0.1.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(tools_changed=True),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+        finally:
+            if metrics_task is not None:
+                metrics_task.cancel()
+                # The last interval would otherwise be lost
+                metrics.METRICS.write_file(metrics.METRICS_FILE)
 
 if __name__ == "__main__":
     asyncio.run(run())
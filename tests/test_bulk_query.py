@@ -0,0 +1,67 @@
+import csv
+import io
+from urllib.parse import urlsplit
+
+from salesforcemcp.query import bulk_query, stream_query
+
+BULK2_URL = "https://example.my.salesforce.com/services/data/v59.0/jobs/"
+ROWS = [{"Id": f"001{i:015d}", "Name": f"Account {i}"} for i in range(25)]
+
+class FakeResponse:
+    def __init__(self, json_data=None, content=b"", headers=None):
+        self.status_code = 200
+        self._json = json_data
+        self.content = content
+        self.headers = headers or {}
+
+    def json(self):
+        return self._json
+
+class FakeBulkSession:
+    """Serves a completed query job whose results come in pages of at most maxRecords rows."""
+
+    def request(self, method, url, headers=None, params=None, **kwargs):
+        path = urlsplit(url).path[len(urlsplit(BULK2_URL).path):]
+        if method == "POST":
+            return FakeResponse({"id": "750000000000001AAA"})
+        if not path.endswith("/results"):
+            return FakeResponse({"state": "JobComplete", "numberRecordsProcessed": len(ROWS)})
+        start = int(params.get("locator") or 0)
+        end = min(start + params["maxRecords"], len(ROWS))
+        out = io.StringIO()
+        writer = csv.DictWriter(out, fieldnames=["Id", "Name"], lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(ROWS[start:end])
+        return FakeResponse(content=out.getvalue().encode("utf-8"),
+                            headers={"Sforce-Locator": str(end) if end < len(ROWS) else "null"})
+
+class FakeConnection:
+    bulk2_url = BULK2_URL
+    session_id = "00D!session"
+
+    def __init__(self):
+        self.session = FakeBulkSession()
+
+def test_cut_bulk_result_resumes_from_its_cursor():
+    connection = FakeConnection()
+
+    first = bulk_query(connection, "SELECT Id, Name FROM Account", max_rows=10)
+    assert not first["done"]
+    assert [r["Name"] for r in first["records"]] == [f"Account {i}" for i in range(10)]
+    assert first["nextRecordsUrl"].startswith("/services/data/v59.0/jobs/query/750000000000001AAA/results")
+
+    second = stream_query(connection, next_records_url=first["nextRecordsUrl"], max_rows=10)
+    third = stream_query(connection, next_records_url=second["nextRecordsUrl"], max_rows=10)
+
+    assert [r["Name"] for r in second["records"]] == [f"Account {i}" for i in range(10, 20)]
+    assert [r["Name"] for r in third["records"]] == [f"Account {i}" for i in range(20, 25)]
+    assert third["done"] and "nextRecordsUrl" not in third
+
+def test_output_file_counts_written_rows(tmp_path):
+    output_file = tmp_path / "accounts.csv"
+
+    result = bulk_query(FakeConnection(), "SELECT Id, Name FROM Account", output_file=str(output_file))
+
+    with open(output_file, encoding="utf-8", newline="") as f:
+        assert len(list(csv.DictReader(f))) == len(ROWS)
+    assert result["recordsWritten"] == len(ROWS)
@@ -0,0 +1,53 @@
+import pytest
+
+from salesforcemcp.deploy_batch import DeployBatcher, reset_batch_owner, set_batch_owner
+from salesforcemcp.package import MetadataPackage
+
+class Session:
+    """Stands in for an MCP client session."""
+
+def package(name: str) -> MetadataPackage:
+    return MetadataPackage({f"objects/{name}.object": f"<CustomObject><label>{name}</label></CustomObject>"})
+
+def as_session(session, func, *args):
+    token = set_batch_owner(session)
+    try:
+        return func(*args)
+    finally:
+        reset_batch_owner(token)
+
+def test_failed_commit_keeps_the_batch_open():
+    attempts = []
+
+    def deploy(pkg):
+        attempts.append(pkg)
+        if len(attempts) == 1:
+            raise ConnectionError("connection reset")
+        return "0Af000000000001"
+
+    batcher = DeployBatcher(deploy)
+    batcher.begin()
+    batcher.submit(package("A__c"))
+    batcher.submit(package("B__c"))
+
+    with pytest.raises(ConnectionError):
+        batcher.commit()
+    assert batcher.pending() == 2
+
+    assert batcher.commit() == ("0Af000000000001", 2)
+    assert batcher.pending() == 0
+
+def test_each_session_has_its_own_batch():
+    deployed = []
+    batcher = DeployBatcher(lambda pkg: deployed.append(pkg) or f"0Af{len(deployed)}")
+    first, second = Session(), Session()
+
+    as_session(first, batcher.begin)
+    assert as_session(first, batcher.submit, package("A__c")) is None
+    # The other session has no open batch: its package is deployed right away
+    assert as_session(second, batcher.submit, package("B__c")) == "0Af1"
+    assert as_session(second, batcher.pending) == 0
+    with pytest.raises(ValueError):
+        as_session(second, batcher.commit)
+
+    assert as_session(first, batcher.commit) == ("0Af2", 1)
@@ -0,0 +1,35 @@
+import re
+
+from salesforcemcp.describe_markdown import render_describe
+
+def text_field(i):
+    return {"name": f"Text{i}__c", "label": f"Text {i}", "type": "string"}
+
+def lookup_field(i):
+    return {"name": f"Lookup{i}__c", "label": f"Lookup {i}", "type": "reference",
+            "referenceTo": ["Account"], "relationshipName": f"Lookup{i}__r"}
+
+# Lookups are scattered among many plain fields, as on a wide object
+DESCRIBE = {
+    "name": "Invoice__c",
+    "label": "Invoice",
+    "fields": [lookup_field(i) if i % 10 == 0 else text_field(i) for i in range(100)],
+}
+
+def test_relationships_only_render_pages_over_relationship_fields():
+    seen = []
+    offset = 0
+    while True:
+        markdown = render_describe(DESCRIBE, ["relationships"], field_offset=offset, field_limit=4)
+        seen += re.findall(r"^\| (Lookup\d+__c) \|", markdown, re.MULTILINE)
+        next_page = re.search(r"field_offset=(\d+)", markdown)
+        if not next_page:
+            break
+        offset = int(next_page.group(1))
+
+    assert seen == [f"Lookup{i}__c" for i in range(0, 100, 10)]
+    assert "Relationship fields 9-10 of 10" in markdown
+
+def test_fields_section_pages_over_every_field():
+    markdown = render_describe(DESCRIBE, ["fields", "relationships"], field_limit=4)
+    assert "Fields 1-4 of 100; call again with field_offset=4" in markdown
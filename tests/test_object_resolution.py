@@ -0,0 +1,53 @@
+from salesforcemcp.describe_store import GLOBAL_DESCRIBE
+from salesforcemcp.implementations import create_record_impl
+from salesforcemcp.sfdc_client import OrgHandler
+
+DESCRIBE_GLOBAL = {"sobjects": [
+    {"name": "Account", "label": "Account", "labelPlural": "Accounts", "keyPrefix": "001", "custom": False},
+    {"name": "Invoice__c", "label": "Invoice", "labelPlural": "Invoices", "keyPrefix": "a01", "custom": True},
+]}
+
+class FakeSObject:
+    def __init__(self, name, created):
+        self.name = name
+        self.created = created
+
+    def create(self, data):
+        self.created.append((self.name, data))
+        return {"id": "a02000000000001AAA", "success": True, "errors": []}
+
+class FakeConnection:
+    def __init__(self):
+        self.created = []
+
+    def __getattr__(self, name):
+        return FakeSObject(name, self.created)
+
+def org_handler() -> OrgHandler:
+    handler = OrgHandler()
+    handler.connection = FakeConnection()
+    # The object index is built from this cached describeGlobal, without any request
+    handler.metadata_cache.put(GLOBAL_DESCRIBE, DESCRIBE_GLOBAL)
+    return handler
+
+def test_labels_and_case_are_remapped():
+    handler = org_handler()
+    assert handler.resolve_object_name("invoices") == "Invoice__c"
+    assert handler.resolve_object_name("ACCOUNT") == "Account"
+
+def test_object_created_after_the_index_was_fetched_is_passed_through():
+    handler = org_handler()
+    handler.object_index()
+    # Shipment__c was deployed after describeGlobal was fetched: it is not refused locally
+    assert handler.resolve_object_name("Shipment__c") == "Shipment__c"
+
+    result = create_record_impl(handler, {"object_name": "Shipment__c", "data": {"Name": "S-1"}})
+
+    assert handler.connection.created == [("Shipment__c", {"Name": "S-1"})]
+    assert result[0].text.startswith("Create Shipment__c Record Result")
+
+def test_unknown_name_hint_lists_the_closest_objects():
+    handler = org_handler()
+    handler.object_index()
+    assert handler.object_name_hint("Invoise__c") == " Did you mean: Invoice__c?"
+    assert handler.object_name_hint("Invoice__c") == ""